@@ -0,0 +1,74 @@
+"""
+Description: Benchmark of the circle and ellipse intersection.
+Compares the polynomial root isolation with the sampling and bisection used before over randomized ellipses and radii.
+Run from the repository root: python benchmarks/bench_circle_intersection.py
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from excaligen.impl.geometry.CircleIntersection import CircleIntersection
+from excaligen.impl.geometry.Vector2D import Vector2D
+
+def bisection_with_ellipse(dx, dy, R, a, b, angle, tolerance=1e-5):
+    """The ellipse intersection as it was computed before: 360 samples of f(theta) and bisection of the sign changes."""
+    dxr, dyr = Vector2D.rotate(dx, dy, -angle)
+
+    def f(theta):
+        return (a * math.cos(theta) - dxr)**2 + (b * math.sin(theta) - dyr)**2 - R**2
+
+    def bisect(lo, hi):
+        f_lo = f(lo)
+        for _ in range(100):
+            mid = (lo + hi) / 2
+            f_mid = f(mid)
+            if abs(f_mid) < tolerance:
+                return mid
+            if f_lo * f_mid < 0:
+                hi = mid
+            else:
+                lo, f_lo = mid, f_mid
+        return (lo + hi) / 2
+
+    roots = []
+    thetas = [i * 2 * math.pi / 360 for i in range(361)]
+    for theta1, theta2 in zip(thetas, thetas[1:]):
+        if f(theta1) * f(theta2) <= 0:
+            root = bisect(theta1, theta2)
+            if all(abs(root - existing) > tolerance for existing in roots):
+                roots.append(root)
+    return [Vector2D.rotate(a * math.cos(theta), b * math.sin(theta), angle) for theta in roots]
+
+def residual(points, dx, dy, R):
+    """The largest distance of the points from the circle."""
+    return max((abs(math.hypot(x - dx, y - dy) - R) for x, y in points), default=0.0)
+
+def cases(count, seed=7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        a, b = rng.uniform(10, 200), rng.uniform(10, 200)
+        distance, direction = rng.uniform(0, 400), rng.uniform(0, 2 * math.pi)
+        yield distance * math.cos(direction), distance * math.sin(direction), rng.uniform(20, 600), a, b, rng.uniform(-math.pi, math.pi)
+
+def main(count=2_000):
+    data = list(cases(count))
+    results = {}
+    for name, function in (("bisection", bisection_with_ellipse), ("polynomial", CircleIntersection.with_ellipse)):
+        start = time.perf_counter()
+        results[name] = [function(*case) for case in data]
+        elapsed = time.perf_counter() - start
+        worst = max(residual(points, dx, dy, R) for points, (dx, dy, R, *_) in zip(results[name], data))
+        print(f"{name:<12} {elapsed / count * 1e6:8.1f} us per call, max distance from the circle {worst:.2e}")
+
+    different = sum(len(old) != len(new) for old, new in zip(results["bisection"], results["polynomial"]))
+    print(f"{different} of {count} cases found a different number of intersections")
+
+if __name__ == "__main__":
+    main()
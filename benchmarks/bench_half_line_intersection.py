@@ -0,0 +1,55 @@
+"""
+Description: Benchmark of the half-line intersections with shapes.
+Compares the per-edge intersection used before, the closed-form clipping and the batched variant.
+Run from the repository root: python benchmarks/bench_half_line_intersection.py
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import math
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from excaligen.impl.geometry.HalfLineIntersection import HalfLineIntersection
+from excaligen.impl.geometry.Vector2D import Vector2D
+
+RAYS = [(math.cos(i * 2 * math.pi / 360), math.sin(i * 2 * math.pi / 360)) for i in range(360)]
+A, B, ANGLE = 80.0, 40.0, 0.3
+
+def per_edge_rectangle(dx, dy, vx, vy, a, b, angle):
+    """The rectangle intersection as it was computed before: each edge separately, then the closest one."""
+    lines = [((-a, -b), (-a, b)), ((-a, b), (a, b)), ((a, b), (a, -b)), ((a, -b), (-a, -b))]
+    vxr, vyr = Vector2D.rotate(vx, vy, -angle)
+    intersections = []
+    for (x1, y1), (x2, y2) in lines:
+        intersection = HalfLineIntersection.half_line_line_intersection(dx, dy, vxr, vyr, x1, y1, x2, y2)
+        if intersection:
+            intersections.append(intersection)
+    x, y = min(intersections, key=lambda point: math.hypot(point[0] - dx, point[1] - dy))
+    return Vector2D.rotate(x, y, angle)
+
+def bench(name, function, number=200):
+    seconds = min(timeit.repeat(function, number=number, repeat=5)) / number
+    print(f"{name:<40} {seconds * 1e6:10.1f} us per {len(RAYS)} rays")
+    return seconds
+
+def main():
+    baseline = bench("rectangle, per edge", lambda: [per_edge_rectangle(0, 0, vx, vy, A, B, ANGLE) for vx, vy in RAYS])
+    for shape in HalfLineIntersection.SHAPES:
+        scalar = getattr(HalfLineIntersection, f"with_{shape}")
+        seconds = bench(f"{shape}, scalar", lambda: [scalar(0, 0, vx, vy, A, B, ANGLE) for vx, vy in RAYS])
+        if shape == "rectangle":
+            print(f"{'':<40} {baseline / seconds:10.1f}x faster than per edge")
+
+        threshold = HalfLineIntersection.NUMPY_THRESHOLD
+        HalfLineIntersection.NUMPY_THRESHOLD = math.inf
+        bench(f"{shape}, batch", lambda: HalfLineIntersection.with_shape_batch(shape, 0, 0, RAYS, A, B, ANGLE))
+        HalfLineIntersection.NUMPY_THRESHOLD = threshold
+        if HalfLineIntersection._HalfLineIntersection__numpy() is not None:
+            bench(f"{shape}, batch (NumPy)", lambda: HalfLineIntersection.with_shape_batch(shape, 0, 0, RAYS, A, B, ANGLE))
+
+if __name__ == "__main__":
+    main()
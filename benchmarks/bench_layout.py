@@ -0,0 +1,85 @@
+"""
+Description: Benchmark of the automatic layouts on large random graphs.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from excaligen.SceneBuilder import SceneBuilder
+
+def layered(node_count: int = 5000, edge_count: int = 10000) -> None:
+    rng = random.Random(1)
+    scene = SceneBuilder()
+    nodes = [scene.rectangle().size(rng.choice((80, 120, 160)), 40) for _ in range(node_count)]
+    edges = set()
+    while len(edges) < edge_count:
+        u, v = rng.randrange(node_count), rng.randrange(node_count)
+        if u < v and v - u < 200:
+            edges.add((u, v))
+    pairs = [(nodes[u], nodes[v]) for u, v in sorted(edges)]
+
+    start = time.perf_counter()
+    scene.layout().layered(nodes, pairs, arrows=False)
+    placed = time.perf_counter()
+    scene.layout().layered(nodes, pairs)
+    routed = time.perf_counter()
+
+    print(f"{node_count} nodes, {edge_count} edges")
+    print(f"layout only:       {placed - start:8.2f} s")
+    print(f"layout and arrows: {routed - placed:8.2f} s")
+
+def force(node_count: int = 5000, iterations: int = 100) -> None:
+    rng = random.Random(1)
+    scene = SceneBuilder()
+    nodes = [scene.ellipse().size(rng.choice((40, 60, 80)), 40) for _ in range(node_count)]
+    pairs = [(nodes[rng.randrange(i)], nodes[i]) for i in range(1, node_count)]
+
+    start = time.perf_counter()
+    scene.layout().force(nodes, pairs, iterations=iterations, arrows=False)
+    placed = time.perf_counter()
+
+    print(f"{node_count} nodes, {len(pairs)} edges, {iterations} iterations")
+    print(f"force layout:      {placed - start:8.2f} s")
+
+def tree(node_count: int = 10000) -> None:
+    rng = random.Random(1)
+    root: dict = {}
+    subtrees = [root]
+    for i in range(node_count - 1):
+        subtree: dict = {}
+        rng.choice(subtrees[-50:])[f"node {i}"] = subtree
+        subtrees.append(subtree)
+
+    for direction in ("TB", "radial"):
+        scene = SceneBuilder()
+        start = time.perf_counter()
+        scene.layout().tree({"root": root}, direction=direction)
+        print(f"{node_count} nodes, tree {direction:6} {time.perf_counter() - start:8.2f} s")
+
+def pack(element_count: int = 10000) -> None:
+    rng = random.Random(1)
+    scene = SceneBuilder()
+    elements = [scene.rectangle().size(rng.choice((100, 150, 200)), rng.choice((80, 120, 160))) for _ in range(element_count)]
+    frames = [scene.frame().size(2000, 2000).position(2100 * i, 0) for i in range(element_count // 100)]
+
+    start = time.perf_counter()
+    scene.layout().pack(elements, width=4000)
+    packed = time.perf_counter()
+    scene.layout().pack(elements, frames=frames)
+    framed = time.perf_counter()
+
+    print(f"{element_count} elements")
+    print(f"pack into width:   {packed - start:8.2f} s")
+    print(f"pack into frames:  {framed - packed:8.2f} s")
+
+if __name__ == "__main__":
+    layered()
+    force()
+    tree()
+    pack()
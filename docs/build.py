@@ -4,7 +4,7 @@ Documentation generator for Excaligen
 This script generates documentation for Excaligen by parsing the source code and generating Markdown files.
 """
 
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 import os
@@ -474,7 +474,11 @@ if __name__ == "__main__":
         ("excaligen.impl.elements.Line", "./src/excaligen/impl/elements/Line.py"),
         ("excaligen.impl.elements.Rectangle", "./src/excaligen/impl/elements/Rectangle.py"),
         ("excaligen.impl.elements.Text", "./src/excaligen/impl/elements/Text.py"),
+        ("excaligen.impl.elements.Template", "./src/excaligen/impl/elements/Template.py"),
+        ("excaligen.impl.layout.Layout", "./src/excaligen/impl/layout/Layout.py"),
+        ("excaligen.impl.layout.LayoutResult", "./src/excaligen/impl/layout/LayoutResult.py"),
         ("excaligen.defaults.Defaults", "./src/excaligen/defaults/Defaults.py"),
+        ("excaligen.defaults.Style", "./src/excaligen/defaults/Style.py"),
     ]
 
     generator = Generator(os.path.join("docs", "api"))
@@ -8,6 +8,7 @@ Excalidraw scene/diagram.
 
 from .impl.base.ExcaligenStructure import ExcaligenStructure
 from .defaults.Defaults import Defaults
+from .defaults.Style import Style
 from .impl.elements.Rectangle import Rectangle
 from .impl.elements.Diamond import Diamond
 from .impl.elements.Ellipse import Ellipse
@@ -17,9 +18,12 @@ from .impl.elements.Text import Text
 from .impl.elements.Image import Image
 from .impl.elements.Frame import Frame
 from .impl.elements.Group import Group
+from .impl.elements.Template import Template, Override
+from .impl.base.AbstractElement import AbstractElement
 from .impl.colors.Color import Color
+from .impl.layout.Layout import Layout
 
-from typing import Self
+from typing import Any, Self, Sequence
 
 class SceneBuilder(ExcaligenStructure):
     """The SceneBuilder class provides methods to add various diagram elements.
@@ -27,6 +31,7 @@ class SceneBuilder(ExcaligenStructure):
     The elemnts include rectangles, diamonds, ellipses, arrows, lines, text, images, groups, and frames.
     Additionally, it offers serialization of the diagram to JSON and allows saving it to a file.
     The fluent API allows chaining method calls for a more concise code.
+    Elements can be created from several threads at once.
     """
     def __init__(self):
         super().__init__()
@@ -163,6 +168,237 @@ class SceneBuilder(ExcaligenStructure):
         """
         return super().color()
 
+    def template(self, **parts: AbstractElement) -> Template:
+        """Turn elements of the diagram into a template, a composite that can be stamped many times.
+
+        Build the composite once with the usual API, then pass its elements as named parts.
+        The labels of the parts are included automatically. The elements are taken out of the diagram,
+        only the stamped copies are drawn. Arrows of the diagram bound to them are unbound, and frames
+        of the diagram release them.
+
+        Args:
+            **parts (AbstractElement): The template elements by their names.
+
+        Returns:
+            Template: The [Template](template.md) object.
+
+        Raises:
+            ValueError: If there are no parts or a part is not an element of this diagram.
+        """
+        return super().template(**parts)
+
+    def stamp(self, template: Template, at: tuple[float, float], overrides: dict[str, Override] | None = None) -> dict[str, AbstractElement]:
+        """Add a copy of a template to the diagram.
+
+        The copy is not rebuilt: the elements are cloned with fresh ids and translated,
+        and their labels, bindings, groups and frames are connected to the other clones.
+        This is much faster than building the composite again.
+
+        Args:
+            template (Template): The template created by `template()`.
+            at (tuple[float, float]): The position of the template origin (the top left corner of its elements).
+            overrides (dict[str, str | Callable] | None): Changes of the copied parts by their names.
+                A string replaces the text of a text part or the label of a labeled part.
+                A callable is called with the copied part, e.g. `lambda box: box.color('red')`.
+
+        Returns:
+            dict[str, AbstractElement]: The copied parts by their names, e.g. for binding arrows to them.
+
+        Raises:
+            ValueError: If an override refers to an unknown part or a text cannot be applied.
+        """
+        return super().stamp(template, at, overrides)
+
+    def merge(self, *others: "SceneBuilder", offset: tuple[float, float] = (0.0, 0.0)) -> Self:
+        """Add copies of the elements of other diagrams, e.g. regions built in parallel in other processes.
+
+        A diagram can be pickled to send it to another process. The copies get fresh ids, group ids and
+        indexes after the elements of this diagram, and their labels, arrow bindings and frames are connected
+        to each other. The same images are stored once. The other diagrams are not changed.
+
+        Example:
+            ```python
+            with ProcessPoolExecutor() as executor:
+                regions = list(executor.map(build_region, names))  # Each returns a SceneBuilder
+            for i, region in enumerate(regions):
+                scene.merge(region, offset=(5000 * i, 0))
+            ```
+
+        Args:
+            *others (SceneBuilder): The diagrams to merge, in the order their elements are added.
+            offset (tuple[float, float]): The translation of the copies. Defaults to (0.0, 0.0).
+
+        Returns:
+            Self: The current instance of the Excaligen class.
+
+        Raises:
+            ValueError: If a diagram is merged into itself, or is streamed to a file.
+        """
+        return super().merge(*others, offset=offset)
+
+    def style(self, name: str | None = None, **attributes: Any) -> Style:
+        """Create a named or anonymous style, or get a named style created before.
+
+        A style is an immutable set of style values based on the current defaults, with the given attributes changed.
+        The attributes are named after the element setters: `opacity`, `sloppiness`, `roundness`, `stroke`,
+        `thickness`, `color`, `background`, `fill`, `fontsize`, `font`, `align`, `baseline`, `autoresize`,
+        `spacing` and `arrowheads` (a tuple of the start and end arrowhead).
+        Apply the style with the `style()` method of the elements. The elements share the style
+        instead of copying its values, which makes creating many identically styled elements cheap.
+
+        Args:
+            name (str | None): The name of the style. If given without attributes, the style registered
+                with this name is returned. Defaults to None (anonymous style).
+            **attributes (Any): The style values, e.g. `color='#1E88E5', fill='solid'`.
+
+        Returns:
+            Style: The [Style](style.md) object.
+
+        Raises:
+            ValueError: If an attribute or its value is invalid, or if there is no style with the name.
+        """
+        return super().style(name, **attributes)
+
+    def prefetch_images(self, urls: list[str], workers: int | None = None) -> Self:
+        """Download remote images concurrently ahead of `Image.url()` calls.
+
+        The images are fetched over pooled keep-alive connections with a bounded number of parallel requests.
+        A later `Image.url()` call with a prefetched URL does not touch the network.
+        Download errors are not raised here but by the `Image.url()` call requesting the failed URL.
+
+        Args:
+            urls (list[str]): The image URLs to download.
+            workers (int | None): The maximum number of parallel requests. Defaults to 8.
+
+        Returns:
+            Self: The current instance of the Excaligen class.
+        """
+        return super().prefetch_images(urls, workers)
+
+    def assets(self, path: str) -> Self:
+        """Register an asset bundle, a zip or uncompressed tar archive with images (e.g. an icon library).
+
+        The archive is opened and indexed once. The images are then loaded by name with `Image.asset()`,
+        reading just the requested member from a memory map of the archive.
+        If several bundles are registered, they are searched in the order of registration.
+
+        Args:
+            path (str): The path to the archive.
+
+        Returns:
+            Self: The current instance of the Excaligen class.
+
+        Raises:
+            ValueError: If the file is not a zip or an uncompressed tar archive.
+        """
+        return super().assets(path)
+
+    def minify_svg(self, enabled: bool = True) -> Self:
+        """Minify SVG images before they are embedded in the diagram.
+
+        Comments, metadata, content of editor namespaces (Inkscape, Sodipodi, Illustrator, ...) and whitespace
+        that does not affect rendering are removed. The setting applies to SVG images loaded afterwards,
+        including SVG files, which are then read as a whole when they are loaded.
+
+        Args:
+            enabled (bool): Whether the minification is enabled. Defaults to True.
+
+        Returns:
+            Self: The current instance of the Excaligen class.
+        """
+        return super().minify_svg(enabled)
+
+    def svg_bytes_saved(self) -> int:
+        """Report the effect of the SVG minification.
+
+        Returns:
+            int: The total number of bytes removed from SVG images by the minification.
+        """
+        return super().svg_bytes_saved()
+
+    def downscale_images(self, dpr: float = 2.0, max_pixels: int | None = None, quality: int = 85) -> Self:
+        """Downscale embedded PNG, JPEG and GIF images to the size they are displayed with.
+
+        Without this setting the full-resolution image is embedded, even when it is displayed
+        much smaller, e.g. after `Image.fit()`. With it, the images are resampled when the scene is serialized
+        to their displayed size multiplied by `dpr`, and further reduced to at most `max_pixels` pixels if given.
+        Images are never upscaled, SVG and animated GIF images are embedded unchanged. An image shown by several
+        elements, e.g. stamped from a template or merged from other scenes, is embedded once at the largest of their sizes.
+
+        Requires the optional Pillow package (`pip install excaligen[images]`).
+
+        Args:
+            dpr (float): The device pixel ratio the images should stay sharp on. Defaults to 2.0.
+            max_pixels (int | None): The maximum number of pixels of an embedded image. Defaults to None (no limit).
+            quality (int): The JPEG quality from 1 to 100. Defaults to 85.
+
+        Returns:
+            Self: The current instance of the Excaligen class.
+
+        Raises:
+            ImportError: If Pillow is not installed.
+            ValueError: If a parameter is out of its range.
+        """
+        return super().downscale_images(dpr, max_pixels, quality)
+
+    def simplify_lines(self, tolerance: float, method: str = "douglas-peucker") -> int:
+        """Simplify all lines and arrows in the scene, e.g. sensor traces or GPS tracks with many points.
+
+        Removes points that do not change the shape of a line by more than the tolerance,
+        see `Line.simplify()`. Arrows bound to elements are simplified too, but their points are recomputed
+        when they are bound again.
+
+        Args:
+            tolerance (float): The maximal distance of a removed point from the simplified line.
+            method (str): The algorithm, either 'douglas-peucker' or 'visvalingam'. Defaults to 'douglas-peucker'.
+
+        Returns:
+            int: The total number of removed points.
+
+        Raises:
+            ValueError: If the tolerance is negative or the method is unknown.
+        """
+        return super().simplify_lines(tolerance, method)
+
+    def transform(self, matrix: Sequence[Any]) -> Self:
+        """Apply an affine transform to all elements of the diagram, e.g. to fit it to a target viewport.
+
+        The positions, sizes, rotations and points of all elements are transformed in one batch,
+        using NumPy for large diagrams if it is installed. Texts and labels are scaled by their font size,
+        arrows bound to elements are routed again. Shapes stay rotated boxes, a shear is not applied to them.
+        Frames are not rotated, as Excalidraw frames cannot be, they are fitted to their transformed elements.
+
+        Example:
+            ```python
+            scene.transform((0.5, 0, 0, 0.5, 100, 100))  # Half the size, moved by (100, 100)
+            ```
+
+        Args:
+            matrix (Sequence[Any]): The coefficients (a, b, c, d, e, f) of x' = a·x + c·y + e, y' = b·x + d·y + f,
+                as in SVG, or the rows of a 2x3 or 3x3 matrix.
+
+        Returns:
+            Self: The current instance of the Excaligen class.
+
+        Raises:
+            ValueError: If the matrix has another shape, is not affine or is singular.
+        """
+        return super().transform(matrix)
+
+    def layout(self) -> Layout:
+        """Get the automatic layouts, which place existing elements instead of positioning them one by one.
+
+        Example:
+            ```python
+            services = [scene.rectangle(name).size(160, 60) for name in names]
+            scene.layout().layered(services, [(services[0], services[1]), (services[0], services[2])], direction="LR")
+            ```
+
+        Returns:
+            Layout: The [Layout](layout.md) object.
+        """
+        return super().layout()
+
     def json(self) -> str:
         """Serialize the diagram to a JSON string.
 
@@ -179,5 +415,96 @@ class SceneBuilder(ExcaligenStructure):
 
         Returns:
             Self: The current instance of the Excaligen class.
+
+        Raises:
+            ValueError: If the diagram is streamed to a file, see `stream()`.
         """
         return super().save(file)
+
+    def stream(self, file_path: str) -> Self:
+        """Start writing the diagram to a file while it is built, for diagrams too large to hold in memory.
+
+        Each `flush()` writes the elements created so far and drops them, `close()` writes the rest
+        and finishes the file. The elements keep their indexes as if the diagram was saved at once,
+        and the file is the same as the one written by `save()`.
+
+        An element is final once it is flushed: binding an arrow to it, adding it to a frame
+        or changing it afterwards does not change the file. Images are kept until `close()`.
+
+        The diagram can be used in a `with` statement, which closes the file at its end. If the block
+        or a `flush()` raises an exception, the file is closed unfinished.
+
+        Example:
+            ```python
+            with scene.stream("timeline.excalidraw"):
+                for event in events:
+                    scene.rectangle(event.name).position(event.time, event.lane)
+                    if event.last_of_day:
+                        scene.flush()
+            ```
+
+        Args:
+            file_path (str): The path to the file where the diagram will be written.
+
+        Returns:
+            Self: The current instance of the Excaligen class.
+
+        Raises:
+            ValueError: If the diagram is already streamed to a file.
+        """
+        return super().stream(file_path)
+
+    def flush(self) -> Self:
+        """Write the elements created since the last flush to the streamed file and drop them from memory.
+
+        Returns:
+            Self: The current instance of the Excaligen class.
+
+        Raises:
+            ValueError: If the diagram is not streamed to a file.
+        """
+        return super().flush()
+
+    def close(self) -> Self:
+        """Write the remaining elements, the app state and the images to the streamed file, and close it.
+
+        Returns:
+            Self: The current instance of the Excaligen class.
+
+        Raises:
+            ValueError: If the diagram is not streamed to a file.
+        """
+        return super().close()
+
+    def save_tiles(self, file_path: str, tile_size: tuple[float, float] | None = None, frames: bool = False, budget: int | None = None, base_url: str = "") -> list[str]:
+        """Save a huge diagram split into several smaller files, and an overview linking them.
+
+        The diagram is split by exactly one of: the tiles of a grid, the top-level frames, or a budget
+        of elements per file. Labels stay with their containers, frame members with their frames and
+        group members with each other. An arrow bound to elements in two files is written to both,
+        bound to the element in the file and linked to the other file.
+
+        The overview, written to `file_path`, has a rectangle over the area of each file linking to it,
+        and arrows labeled with the number of arrows between the files. The files are written next to it,
+        numbered: `map.excalidraw` is split into `map-1.excalidraw`, `map-2.excalidraw` and so on.
+
+        Example:
+            ```python
+            scene.save_tiles("network.excalidraw", tile_size=(5000, 5000))
+            ```
+
+        Args:
+            file_path (str): The path of the overview file.
+            tile_size (tuple[float, float] | None): The width and height of the tiles to split the diagram by.
+            frames (bool): Whether to split the diagram by the top-level frames, the elements out of frames go to the last file.
+            budget (int | None): The maximum number of elements per file, the diagram is split in the order of creation.
+            base_url (str): The prefix of the links to the files, e.g. the URL of the folder they are served from. Defaults to "".
+
+        Returns:
+            list[str]: The paths of the written files, without the overview.
+
+        Raises:
+            ValueError: If not exactly one way to split the diagram is given, the tile size or budget is not positive,
+                or the diagram is streamed to a file.
+        """
+        return super().save_tiles(file_path, tile_size, frames, budget, base_url)
@@ -1,7 +1,7 @@
 """
 Description: Default values for elements.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from ..impl.inputs.Sloppiness import Sloppiness
@@ -15,6 +15,7 @@ from ..impl.inputs.Align import Align
 from ..impl.inputs.Baseline import Baseline
 from ..impl.inputs.Arrowheads import Arrowheads
 from ..impl.colors.Color import Color
+from .Style import Style
 
 from typing import Self, Any
 
@@ -63,6 +64,25 @@ class Defaults:
         self._start_arrowhead: str | None = None
         self._end_arrowhead: str | None = "arrow"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any change invalidates the style snapshot shared by the elements created so far
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_Defaults__style", None)
+
+    def _style(self, name: str | None = None) -> Style:
+        """Get the current values as an immutable style. The anonymous style is shared until the defaults change."""
+        if name is not None:
+            return Style(self.__values(), name)
+
+        style = self.__dict__.get("_Defaults__style")
+        if style is None:
+            style = Style(self.__values())
+            object.__setattr__(self, "_Defaults__style", style)
+        return style
+
+    def __values(self) -> dict[str, Any]:
+        return {name: value for name, value in self.__dict__.items() if not name.startswith("_Defaults__")}
+
     def size(self, width: float, height: float) -> Self:
         """
         Sets the size of the element.
@@ -238,7 +258,7 @@ class Defaults:
         Returns:
             Self: The current instance of the Text class.
         """
-        self._textAlign = Align.from_(align)
+        self._text_align = Align.from_(align)
         return self
 
     def baseline(self, align: str) -> Self:
@@ -253,7 +273,7 @@ class Defaults:
         Returns:
             Self: The current instance of the Text class.
         """
-        self._verticalAlign = Baseline.from_(align)
+        self._vertical_align = Baseline.from_(align)
         return self
 
     def autoresize(self, enabled: bool) -> Self:
@@ -265,7 +285,7 @@ class Defaults:
         Returns:
             Self: The current instance of the Text class.
         """
-        self._autoResize = enabled
+        self._auto_resize = enabled
         return self
 
     def spacing(self, height: float) -> Self:
@@ -277,7 +297,7 @@ class Defaults:
         Returns:
             Self: The current instance of the Text class.
         """
-        self._lineHeight = height
+        self._line_height = height
         return self
 
     def arrowheads(self, start: str | None, end: str | None) -> Self:
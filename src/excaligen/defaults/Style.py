@@ -0,0 +1,37 @@
+"""
+Description: Immutable set of style values shared by elements.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from typing import Any
+
+class Style:
+    """An immutable, named set of style values (colors, stroke, fill, font, ...).
+
+    Elements reference a style instead of copying its values, so creating many identically styled
+    elements is cheap. Any value can still be overridden per element by its setter, e.g. `color()`.
+    Create styles with `SceneBuilder.style()` and apply them with the `style()` method of the elements.
+
+    > [!WARNING]
+    > Do not instantiate this class directly. Use `SceneBuilder.style()` instead.
+    """
+    __slots__ = ("__name", "__values")
+
+    def __init__(self, values: dict[str, Any], name: str | None = None):
+        self.__name = name
+        self.__values = dict(values)
+
+    def name(self) -> str | None:
+        """Get the name of the style.
+
+        Returns:
+            str | None: The name the style was registered with, None for anonymous styles.
+        """
+        return self.__name
+
+    def __getitem__(self, key: str) -> Any:
+        return self.__values[key]
+
+    def __repr__(self) -> str:
+        return f"Style({self.__name!r})"
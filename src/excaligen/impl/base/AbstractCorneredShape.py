@@ -1,7 +1,7 @@
 """
 Description: Base class for shapes with corners.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 
@@ -12,10 +12,11 @@ from .AbstractLabeledElement import AbstractLabeledElement
 from ..base.AbstractPlainLabelListener import AbstractPlainLabelListener
 from ..elements.Text import Text
 from ...defaults.Defaults import Defaults
-from typing import Self, Any
+from typing import Self
 
 class AbstractCorneredShape(AbstractStrokedElement, AbstractShape, AbstractRoundableElement, AbstractLabeledElement):
+    _STYLE_ATTRIBUTES = ("_roundness",)
+
     def __init__(self, type: str, defaults: Defaults, listener: AbstractPlainLabelListener, label: str | Text | None = None):
         super().__init__(type, defaults)
         self._init_labels(listener, label)
-        self._roundness: str | dict[str, Any] | None = getattr(defaults, "_roundness")
@@ -4,15 +4,30 @@ Description: Base class for all Excalidraw elements.
 # Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
+import copy
 import math
 import uuid
-from typing import Self, overload
+from typing import Any, Self, overload
 from ...defaults.Defaults import Defaults
+from ...defaults.Style import Style
 from ..inputs.Opacity import Opacity
+from ..geometry.Outline import Outline
+from ..geometry.AffineTransform import AffineTransform
+from .AbstractFrameListener import AbstractFrameListener
 
 class AbstractElement:
     """Base class for all Excalidraw elements."""
 
+    # Attributes read from the style unless they are set on the element, each class lists its own ones
+    _STYLE_ATTRIBUTES: tuple[str, ...] = ("_opacity",)
+    _styled_attributes: tuple[str, ...] = _STYLE_ATTRIBUTES
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._styled_attributes = tuple(dict.fromkeys(
+            name for klass in reversed(cls.__mro__) for name in vars(klass).get("_STYLE_ATTRIBUTES", ())
+        ))
+
     def __init__(self, element_type: str, defaults: Defaults):
         self._type = element_type
         self._id = str(uuid.uuid4())
@@ -24,7 +39,7 @@ class AbstractElement:
         self._y: float = 0
         self._width: float = getattr(defaults, "_width")
         self._height: float = getattr(defaults, "_height")
-        self._opacity: int = getattr(defaults, "_opacity")
+        self.__style: Style = defaults._style()
         self._angle: float = getattr(defaults, "_angle")
         self._index: str | None = None
         self._group_ids: list[str] = []
@@ -32,6 +47,40 @@ class AbstractElement:
         self._link: None | str = None
         self._bound_elements = None
         self.__is_centered = False
+        self.__outline: tuple[tuple[float, ...], Outline] | None = None
+        self.__frame: AbstractFrameListener | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Called only when the attribute is not set on the element, i.e. for style values not overridden
+        if name in type(self)._styled_attributes:
+            style = self.__dict__.get("_AbstractElement__style")
+            if style is not None:
+                return style[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def style(self, style: Style) -> Self:
+        """
+        Apply a style created by `SceneBuilder.style()`.
+
+        The element references the style instead of copying its values. Style values set on the element
+        before are replaced by the style, values set afterwards override it.
+
+        Args:
+            style (Style): The style to apply.
+
+        Returns:
+            Self: The instance of the element with the style applied.
+
+        Raises:
+            TypeError: If the style is not a Style object.
+        """
+        if not isinstance(style, Style):
+            raise TypeError("Invalid style. Use a Style object created by SceneBuilder.style().")
+
+        for name in self._styled_attributes:
+            self.__dict__.pop(name, None)
+        self.__style = style
+        return self
 
     def position(self, x: float, y: float) -> Self:
         """
@@ -46,6 +95,7 @@ class AbstractElement:
         """
         self._x = x
         self._y = y
+        self._changed()
         return self
     
     @overload
@@ -75,6 +125,7 @@ class AbstractElement:
                 self.__is_centered = True
                 self._x = x - 0.5 * self._width
                 self._y = y - 0.5 * self._height
+                self._changed()
                 return self
             case _:
                 raise ValueError("Invalid arguments for center. Expected () or (x, y).")
@@ -212,15 +263,119 @@ class AbstractElement:
 
         self._width = width
         self._height = height
-        
+        self._changed()
         return self
 
+    def _outline(self) -> Outline:
+        """Get the outline used to connect arrows to the element.
+
+        The outline is cached, so connecting many arrows to the same element computes it once.
+        It is recomputed when the position, size or rotation of the element changes.
+        """
+        key = (self._x, self._y, self._width, self._height, self._angle)
+        if self.__outline is None or self.__outline[0] != key:
+            self.__outline = (key, Outline(self._type, *key))
+        return self.__outline[1]
+
+    def _clone(self, dx: float, dy: float) -> Self:
+        """Create a translated copy with a fresh id. References to other elements are fixed by `_remap()`.
+
+        The copy shares immutable data (style, image file) with the original, and its geometry
+        is translated only, not recalculated.
+        """
+        clone = copy.copy(self)
+        for name, value in vars(clone).items():
+            if isinstance(value, (list, dict)):
+                setattr(clone, name, copy.copy(value))
+
+        clone._id = str(uuid.uuid4())
+        clone._x += dx
+        clone._y += dy
+        clone._index = None
+        return clone
+
+    def _transform_origin(self) -> tuple[float, float]:
+        """Get the point the transform of the element is computed from, its center."""
+        return self.center()
+
+    def _transform(self, transform: AffineTransform, x: float, y: float) -> None:
+        """Apply an affine transform, with the origin already transformed to (x, y) in a batch with other elements.
+
+        The element stays a rotated box: its sides are scaled by the transform of its axes and it is rotated
+        with the first one, a shear is not representable.
+        """
+        if transform.is_translation():
+            self._x += transform.e
+            self._y += transform.f
+            self._changed()
+            return
+        cos, sin = math.cos(self._angle), math.sin(self._angle)
+        ux, uy = transform.apply_linear(cos, sin)
+        vx, vy = transform.apply_linear(-sin, cos)
+        self._width *= math.hypot(ux, uy)
+        self._height *= math.hypot(vx, vy)
+        self._angle = math.atan2(uy, ux) % (2 * math.pi)
+        self._x = x - 0.5 * self._width
+        self._y = y - 0.5 * self._height
+        self._changed()
+
+    def _remap(self, clones: dict[str, "AbstractElement"], group_ids: dict[str, str]) -> None:
+        """Point the references of a clone to the clones of the referenced elements.
+
+        Args:
+            clones (dict[str, AbstractElement]): The clones by the ids of their originals.
+            group_ids (dict[str, str]): The new group ids by the original ones, filled in as needed.
+        """
+        self._group_ids = [group_ids.setdefault(id, str(uuid.uuid4())) for id in self._group_ids]
+        if self._frame_id in clones:
+            self._frame_id = clones[self._frame_id]._id
+        if self.__frame is not None:
+            # The clone of a member of a cloned frame joins the cloned frame, otherwise the frame of the original
+            frame = clones.get(getattr(self.__frame, "_id", None), self.__frame)
+            self.__frame = None
+            self._set_frame(frame, self._frame_id)
+        if self._bound_elements:
+            # Elements out of the cloned set do not know the clone, so their bindings are dropped
+            self._bound_elements = [
+                {"id": clones[bound["id"]]._id, "type": bound["type"]} for bound in self._bound_elements if bound["id"] in clones
+            ] or None
+
+    def _set_frame(self, frame: AbstractFrameListener | None, frame_id: str | None) -> None:
+        """Move the element into a frame, or out of its frame with None.
+
+        Args:
+            frame (AbstractFrameListener | None): The frame to notify about the changes of the element.
+            frame_id (str | None): The frame id written to the file, None for frames nested in frames.
+        """
+        if self.__frame is not None:
+            self.__frame._remove_member(self)
+        self.__frame = frame
+        self._frame_id = frame_id
+        if frame is not None:
+            frame._add_member(self)
+
+    def _get_frame(self) -> AbstractFrameListener | None:
+        return self.__frame
+
+    def _changed(self) -> None:
+        """Notify the frame of the element that its position or size changed."""
+        if self.__frame is not None:
+            self.__frame._on_member_changed(self)
+
+    def _style_values(self) -> dict[str, Any]:
+        """Get the style values that are not overridden by the element."""
+        return {name: self.__style[name] for name in self._styled_attributes if name not in self.__dict__}
+
     def _add_bound_element(self, element: "AbstractElement") -> None:
         self._bound_elements = self._bound_elements or []
 
-        if not element._id in self._bound_elements: # TODO check if this works to prevent binding twice
+        if not any(bound["id"] == element._id for bound in self._bound_elements):
             self._bound_elements.append({"id": element._id, "type": element._type})
 
+    def _remove_bound_elements(self, ids: set[str]) -> None:
+        if self._bound_elements:
+            self._bound_elements = [bound for bound in self._bound_elements if bound["id"] not in ids] or None
+
     def _add_group_id(self, id: str) -> None:
         """Add a group ID to the element.
 
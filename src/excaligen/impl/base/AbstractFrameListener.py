@@ -0,0 +1,21 @@
+"""
+Description: Interface to frames listening to the changes of their members.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+class AbstractFrameListener(ABC):
+    @abstractmethod
+    def _add_member(self, element: Any) -> None:
+        pass
+
+    @abstractmethod
+    def _remove_member(self, element: Any) -> None:
+        pass
+
+    @abstractmethod
+    def _on_member_changed(self, element: Any) -> None:
+        pass
@@ -1,16 +1,17 @@
 """
 Description: Interface to image listeners.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from abc import ABC, abstractmethod
+from ..images.ImageData import ImageData
 
 class AbstractImageListener(ABC):
     def __init__(self):
         pass
 
     @abstractmethod
-    def _on_image(self, id: str, mime_type: str, data_url: str) -> None:
+    def _on_image(self, id: str, image_data: ImageData) -> None:
         pass
 
@@ -1,7 +1,7 @@
 """
 Description: Interface to image loaders.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from abc import ABC, abstractmethod
@@ -19,3 +19,11 @@ class AbstractImageLoader(ABC):
     @abstractmethod
     def load_from_url(self, url: str) -> ImageData:
         pass
+
+    @abstractmethod
+    def load_from_asset(self, name: str) -> tuple[str, ImageData]:
+        pass
+
+    @abstractmethod
+    def prefetch(self, urls: list[str], workers: int | None = None) -> None:
+        pass
@@ -8,6 +8,7 @@ from typing import Self, override, overload
 from ..elements.Text import Text
 from ..base.AbstractPlainLabelListener import AbstractPlainLabelListener
 from ..base.AbstractElement import AbstractElement
+from ..geometry.AffineTransform import AffineTransform
 
 class AbstractLabeledElement(AbstractElement):
     LABEL_HORIZONTAL_INSET = 10
@@ -73,6 +74,32 @@ class AbstractLabeledElement(AbstractElement):
     def _size(self, width: float, height: float) -> Self:
         return super()._size(width, height)._justify_label()
 
+    def _get_label(self) -> Text | None:
+        return self.__label
+
+    def _set_listener(self, listener: AbstractPlainLabelListener) -> None:
+        """Create the labels set later in another scene, the one the element was merged into."""
+        self.__listener = listener
+
+    @override
+    def _remap(self, clones: dict[str, AbstractElement], group_ids: dict[str, str]) -> None:
+        super()._remap(clones, group_ids)
+        if self.__label is not None:
+            self.__label = clones.get(self.__label._id) # type: ignore labels are always cloned with their container
+
+    @override
+    def _transform(self, transform: AffineTransform, x: float, y: float) -> None:
+        super()._transform(transform, x, y)
+        self._transform_label(transform)
+
+    def _transform_label(self, transform: AffineTransform) -> None:
+        """Scale the label with the element and justify it again, it is not transformed on its own."""
+        if self.__label:
+            if not transform.is_translation():
+                self.__label._scale(transform.scale())
+                self.__label._angle = self._angle
+            self._justify_label()
+
     def _justify_label(self) -> Self:
         """Justify the label within the element."""
         if self.__label:
@@ -9,13 +9,19 @@ from ..base.AbstractStrokedElement import AbstractStrokedElement
 from ..base.AbstractRoundableElement import AbstractRoundableElement
 from ...defaults.Defaults import Defaults
 from ..geometry.Point import Point
-from typing import Self
+from ..geometry.PointBuffer import PointBuffer
+from ..geometry.PolylineSimplification import PolylineSimplification
+from ..geometry.AffineTransform import AffineTransform
+from typing import Any, Self
+
+import copy
 
 class AbstractLine(AbstractStrokedElement, AbstractRoundableElement):
+    _STYLE_ATTRIBUTES = ("_roundness",)
+
     def __init__(self, type: str, defaults: Defaults):
         super().__init__(type, defaults)
-        self._points: list[Point] = []
-        self._roundness = getattr(defaults, "_roundness")
+        self._points = PointBuffer()
 
     def points(self, points: list[Point]) -> Self:
         """
@@ -25,7 +31,24 @@ class AbstractLine(AbstractStrokedElement, AbstractRoundableElement):
         Returns:
             Self: The instance of the class with updated points, width, and height.
         """
-        self._points = points
+        self._points = PointBuffer(points)
+        self.__update_width_height()
+
+        return self
+
+    def points_from_buffer(self, buffer: Any) -> Self:
+        """
+        Sets the points for the line from a buffer of interleaved x and y coordinates, without copying them.
+        Use it for lines with many points, e.g. measured data in an `array('d')` or a NumPy array.
+        Args:
+            buffer (Any): An object supporting the buffer protocol with C-contiguous float64 values x0, y0, x1, y1, ...,
+                e.g. `array('d')` or a NumPy array of shape (n, 2). It must not be modified afterwards.
+        Returns:
+            Self: The instance of the class with updated points, width, and height.
+        Raises:
+            ValueError: If the buffer does not contain pairs of float64 values.
+        """
+        self._points = PointBuffer.from_buffer(buffer)
         self.__update_width_height()
 
         return self
@@ -51,15 +74,68 @@ class AbstractLine(AbstractStrokedElement, AbstractRoundableElement):
         Returns:
             Self: The instance of the class with updated points, width, and height.
         """
-        self._points = points + self._points
+        self._points.prepend(points)
         self.__update_width_height()
 
         return self
 
+    def simplify(self, tolerance: float, method: str = PolylineSimplification.DOUGLAS_PEUCKER) -> Self:
+        """
+        Removes points that do not change the shape of the line by more than the tolerance.
+        The first and the last point are kept, a closed line stays closed.
+        Args:
+            tolerance (float): The maximal distance of a removed point from the simplified line.
+                For 'visvalingam', points are removed while the triangle they form with their neighbours is smaller than tolerance².
+            method (str): The algorithm, either 'douglas-peucker' (Ramer-Douglas-Peucker) or 'visvalingam' (Visvalingam-Whyatt).
+                Defaults to 'douglas-peucker'.
+        Returns:
+            Self: The instance of the class with updated points, width, and height.
+        Raises:
+            ValueError: If the tolerance is negative or the method is unknown.
+        """
+        points = PolylineSimplification.simplify(self._points, tolerance, method)
+        if len(points) != len(self._points):
+            self._points = PointBuffer(points)
+            self.__update_width_height()
+
+        return self
+
+    def _clone(self, dx: float, dy: float) -> Self:
+        clone = super()._clone(dx, dy)
+        clone._points = copy.copy(self._points)
+        return clone
+
+    def _transform_origin(self) -> tuple[float, float]:
+        # The points are relative to the position
+        return (self._x, self._y)
+
+    def _transform(self, transform: AffineTransform, x: float, y: float, points: Any = None) -> None:
+        """Apply an affine transform, with the position already transformed to (x, y).
+
+        Args:
+            transform (AffineTransform): The transform.
+            x (float): The transformed position.
+            y (float): The transformed position.
+            points (Any): The relative coordinates of the points transformed without the translation,
+                if they were transformed in a batch with other lines. Defaults to None.
+        """
+        self._x, self._y = x, y
+        if transform.is_translation():
+            self._changed()
+            return
+        if points is None:
+            points = transform.apply_many(self._points.coordinates(), linear=True)
+        self._points = PointBuffer.from_buffer(points)
+        self.__update_width_height()
+
     def __update_width_height(self) -> None:
         """
         Updates the width and height of the line.
         """
-        x_coords, y_coords = zip(*self._points)
-        self._width = max(x_coords) - min(x_coords)
-        self._height = max(y_coords) - min(y_coords)
+        bounds = self._points.bounds()
+        if bounds is None:
+            raise ValueError("The line has no points.")
+        min_x, min_y, max_x, max_y = bounds
+        self._width = max_x - min_x
+        self._height = max_y - min_y
+        self._changed()
@@ -1,7 +1,7 @@
 """
 Description: Base class for shapes.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from .AbstractElement import AbstractElement
@@ -11,12 +11,10 @@ from ..inputs.Fill import Fill
 from typing import Self
 
 class AbstractShape(AbstractElement):
+    _STYLE_ATTRIBUTES = ("_background_color", "_fill_style")
+
     def __init__(self, type: str, defaults: Defaults):
         super().__init__(type, defaults)
-        self._width = getattr(defaults, "_width")
-        self._height = getattr(defaults, "_height")
-        self._background_color = getattr(defaults, "_background_color")
-        self._fill_style = getattr(defaults, "_fill_style")
 
     def size(self, width: float, height: float) -> Self:
         """
@@ -1,7 +1,7 @@
 """
 Description: Base class for stroked elements.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from .AbstractElement import AbstractElement
@@ -16,12 +16,10 @@ from typing import Self
 
 
 class AbstractStrokedElement(AbstractElement):
+    _STYLE_ATTRIBUTES = ("_stroke_color", "_stroke_width", "_stroke_style", "_roughness")
+
     def __init__(self, type: str, defaults: Defaults):
         super().__init__(type, defaults)
-        self._stroke_color = getattr(defaults, "_stroke_color")
-        self._stroke_width = getattr(defaults, "_stroke_width")
-        self._stroke_style = getattr(defaults, "_stroke_style")
-        self._roughness = getattr(defaults, "_roughness")
 
     def color(self, color: str | Color) -> Self:
         """Set the stroke (outline) color as #RRGGBB, color name or Color object.
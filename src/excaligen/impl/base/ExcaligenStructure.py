@@ -1,10 +1,12 @@
 """
 Description: Base class for Excaligen to hide implementation details from the user.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from .AbstractElement import AbstractElement
+from .AbstractLine import AbstractLine
+from .AbstractLabeledElement import AbstractLabeledElement
 from ..elements.ElementFactory import ElementFactory
 from ..elements.Rectangle import Rectangle
 from ..elements.Diamond import Diamond
@@ -15,17 +17,34 @@ from ..elements.Text import Text
 from ..elements.Image import Image
 from ..elements.Frame import Frame
 from ..elements.Group import Group
+from ..elements.Template import Template, Override
 from ..colors.Color import Color
+from ..images.AssetBundle import AssetBundle
 from ..images.ImageLoader import ImageLoader
-from ..indexer.IndexGenerator import IndexGenerator
+from ..images.ImageData import ImageData
+from ..images.ImageResampler import ImageResampler
+from ..geometry.PointBuffer import PointBuffer
+from ..geometry.PolylineSimplification import PolylineSimplification
+from ..geometry.AffineTransform import AffineTransform
+from ..indexer.IndexBlocks import IndexBlocks
+from ..layout.Layout import Layout
+from ..export.ScenePartition import ScenePartition
 
 from .AbstractImageListener import AbstractImageListener
 from .AbstractPlainLabelListener import AbstractPlainLabelListener
 
 from ...defaults.Defaults import Defaults
-from typing import Self, cast
+from ...defaults.Style import Style
+from array import array
+from itertools import chain
+from typing import Any, Iterator, Self, Sequence, TextIO, cast
 
+import contextlib
+import copy
+import hashlib
 import json
+import os
+import uuid
 
 class ExcaligenStructure(AbstractImageListener, AbstractPlainLabelListener):
     class ElementEncoder(json.JSONEncoder):
@@ -37,8 +56,16 @@ class ExcaligenStructure(AbstractImageListener, AbstractPlainLabelListener):
         """
 
         def default(self, obj):
+            if isinstance(obj, ImageData):
+                return obj.data_url
+
+            if isinstance(obj, PointBuffer):
+                return obj.to_list()
+
+            # Style values shared with other elements come first, the element's own attributes override them
             result = {}
-            for attr_name, value in obj.__dict__.items():
+            attributes = obj._style_values() | obj.__dict__ if isinstance(obj, AbstractElement) else obj.__dict__
+            for attr_name, value in attributes.items():
                 if attr_name.startswith('_') and not '__' in attr_name:
                     json_key = self._snake_to_camel(attr_name.lstrip('_'))
                     result[json_key] = value
@@ -50,7 +77,36 @@ class ExcaligenStructure(AbstractImageListener, AbstractPlainLabelListener):
             components = snake_str.split('_')
             return components[0] + ''.join(x.title() for x in components[1:])
 
+    class StreamingEncoder(ElementEncoder):
+        """JSON encoder that leaves image payloads out of the encoded chunks.
+
+        Each image payload is encoded as a unique placeholder string. The writer replaces
+        the placeholder chunk by the data URL streamed directly from the image source.
+        """
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.__payloads: dict[str, ImageData] = {}
+            self.__counter = 0
+
+        def default(self, obj):
+            if isinstance(obj, ImageData):
+                self.__counter += 1
+                placeholder = f"<payload {self.__counter}>"
+                self.__payloads[json.dumps(placeholder)] = obj
+                return placeholder
+
+            return super().default(obj)
+
+        def pop_payload(self, chunk: str) -> ImageData | None:
+            return self.__payloads.pop(chunk, None)
+
     _START_INDEX = 'a0'
+    _ELEMENTS_PLACEHOLDER = '<elements>'
+    _STYLE_SETTERS = {
+        "opacity", "sloppiness", "roundness", "stroke", "thickness", "color", "background", "fill",
+        "fontsize", "font", "align", "baseline", "autoresize", "spacing", "arrowheads"
+    }
     
     def __init__(self):
         self._type = "excalidraw"
@@ -66,8 +122,14 @@ class ExcaligenStructure(AbstractImageListener, AbstractPlainLabelListener):
         self._files = {}
         self.__factory = ElementFactory()
         self.__image_loader = ImageLoader()
-        self.__indexer = IndexGenerator(self._START_INDEX)
-        self.__index = self._START_INDEX
+        self.__indexes = IndexBlocks(self._START_INDEX)
+        self.__images: dict[str, ImageData] = {}
+        self.__resampler: ImageResampler | None = None
+        self.__resampled: dict[str, tuple[tuple[float, float], ImageData, ImageData]] = {}
+        self.__styles: dict[str, Style] = {}
+        self.__layout: Layout | None = None
+        self.__stream: TextIO | None = None
+        self.__streamed = 0
 
     def defaults(self) -> Defaults:
         return self.__factory.defaults()
@@ -107,38 +169,440 @@ class ExcaligenStructure(AbstractImageListener, AbstractPlainLabelListener):
         return cast(Frame, self.__append_element(self.__factory.frame(title)))
 
     def group(self) -> Group:
-        return self.__factory.group()
+        return self.__factory.group(self._transform_elements)
 
     def color(self) -> Color:
         return self.__factory.color()
 
+    def template(self, **parts: AbstractElement) -> Template:
+        if not parts:
+            raise ValueError("A template needs at least one element.")
+
+        # Labels belong to their containers, they are taken into the template with them
+        ids = {part._id for part in parts.values()}
+        members = [
+            element for element in self._elements
+            if element._id in ids or (isinstance(element, Text) and element._container_id in ids)
+        ]
+        if len({member._id for member in members} & ids) != len(ids):
+            raise ValueError("Template parts must be elements of this scene.")
+
+        self._remove_elements(list(parts.values()))
+        return Template(parts, members)
+
+    def stamp(self, template: Template, at: tuple[float, float], overrides: dict[str, Override] | None = None) -> dict[str, AbstractElement]:
+        clones, parts = template._instantiate(at[0], at[1], overrides)
+        for clone in clones:
+            self.__append_element(clone)
+        return parts
+
+    def merge(self, *others: "ExcaligenStructure", offset: tuple[float, float] = (0.0, 0.0)) -> Self:
+        dx, dy = offset
+        digests = {self.__digest(data): id for id, data in self.__images.items()}
+        for other in others:
+            if other is self:
+                raise ValueError("A scene cannot be merged into itself.")
+            other.__check_not_streamed()
+            other.__finalize()
+
+            # Copies have fresh ids and group ids, so they never collide with the elements of this scene
+            clones = {element._id: element._clone(dx, dy) for element in other._elements}
+            group_ids: dict[str, str] = {}
+            for clone in clones.values():
+                clone._remap(clones, group_ids)
+
+            file_ids = self.__merge_images(other, digests)
+            for clone in clones.values():
+                if isinstance(clone, Image):
+                    clone._file_id = file_ids.get(clone._file_id, clone._file_id)
+                    clone._set_listener(self, self.__image_loader)
+                elif isinstance(clone, AbstractLabeledElement):
+                    clone._set_listener(self)
+                self.__append_element(clone)
+
+            for name, style in other.__styles.items():
+                self.__styles.setdefault(name, style)
+        return self
+
+    def style(self, name: str | None = None, **attributes: Any) -> Style:
+        if name is not None and not attributes:
+            if name not in self.__styles:
+                raise ValueError(f"Unknown style '{name}'.")
+            return self.__styles[name]
+
+        # The values are validated by the setters of a copy of the current defaults
+        defaults = copy.copy(self.defaults())
+        for setter, value in attributes.items():
+            if setter not in self._STYLE_SETTERS:
+                raise ValueError(f"Invalid style attribute '{setter}'. Use one of: {', '.join(sorted(self._STYLE_SETTERS))}.")
+            if setter == "arrowheads":
+                defaults.arrowheads(*value)
+            else:
+                getattr(defaults, setter)(value)
+
+        style = defaults._style(name)
+        if name is not None:
+            self.__styles[name] = style
+        return style
+
+    def prefetch_images(self, urls: list[str], workers: int | None = None) -> Self:
+        self.__image_loader.prefetch(urls, workers)
+        return self
+
+    def assets(self, path: str) -> Self:
+        self.__image_loader.add_bundle(AssetBundle(path))
+        return self
+
+    def minify_svg(self, enabled: bool = True) -> Self:
+        self.__image_loader.minify_svg(enabled)
+        return self
+
+    def svg_bytes_saved(self) -> int:
+        return self.__image_loader.svg_bytes_saved
+
+    def downscale_images(self, dpr: float = ImageResampler.DEFAULT_DPR, max_pixels: int | None = None, quality: int = ImageResampler.DEFAULT_QUALITY) -> Self:
+        self.__resampler = ImageResampler(dpr, max_pixels, quality)
+        self.__resampled.clear()
+        return self
+
+    def simplify_lines(self, tolerance: float, method: str = PolylineSimplification.DOUGLAS_PEUCKER) -> int:
+        removed = 0
+        for element in self._elements:
+            if isinstance(element, AbstractLine):
+                count = len(element._points)
+                element.simplify(tolerance, method)
+                removed += count - len(element._points)
+        return removed
+
+    def transform(self, matrix: Sequence[Any]) -> Self:
+        self._transform_elements(self._elements, AffineTransform.from_matrix(matrix))
+        return self
+
+    def layout(self) -> Layout:
+        if self.__layout is None:
+            self.__layout = Layout(self.arrow, {"rectangle": self.rectangle, "ellipse": self.ellipse, "diamond": self.diamond}, self._remove_elements)
+        return self.__layout
+
     def json(self) -> str:
+        self.__check_not_streamed()
+        self.__finalize()
+        self.__resample_images()
         return json.dumps(self, cls = self.ElementEncoder, indent = 2)
 
     def save(self, file_path: str) -> Self:
+        self.__check_not_streamed()
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(self.json())
+            with self.__open_replaced(file_path) as file:
+                self._write(file)
                 return self
 
         except Exception as e:
             print(f"Error Writing '{file_path}': {e}")      
             return self  
 
-    def _on_image(self, id: str, mime_type: str, data_url: str) -> None:
+    def save_tiles(self, file_path: str, tile_size: tuple[float, float] | None = None, frames: bool = False, budget: int | None = None, base_url: str = "") -> list[str]:
+        modes = (tile_size is not None) + frames + (budget is not None)
+        if modes != 1:
+            raise ValueError("Split the scene by exactly one of tile_size, frames or budget.")
+        self.__check_not_streamed()
+        self.__finalize()
+        self.__resample_images()
+
+        partition = ScenePartition(self._elements)
+        if tile_size is not None:
+            parts = partition.by_tiles(*tile_size)
+        elif frames:
+            parts = partition.by_frames()
+        else:
+            parts = partition.by_budget(cast(int, budget))
+
+        stem, extension = os.path.splitext(file_path)
+        paths = [f"{stem}-{i + 1}{extension or '.excalidraw'}" for i in range(len(parts))]
+        urls = [base_url + os.path.basename(path) for path in paths]
+        crossing: dict[tuple[int, int], set[str]] = {}
+        for i, ((elements, links), path) in enumerate(zip(ScenePartition.crossing(parts), paths)):
+            for element in elements:
+                if element._id in links:
+                    crossing.setdefault((min(i, links[element._id]), max(i, links[element._id])), set()).add(element._id)
+                    if element._link is None:
+                        # The element is a copy, the arrow of the scene keeps its link
+                        element._link = urls[links[element._id]]
+            files = {e._file_id: self._files[e._file_id] for e in elements if isinstance(e, Image) and e._file_id in self._files}
+            document = self.__document(elements, files)
+            with self.__open_replaced(path) as file:
+                self.__encode(document, file)
+
+        overview = type(self)()
+        overview._app_state = copy.copy(self._app_state)
+        tiles = []
+        for (name, elements), url in zip(parts, urls):
+            min_x, min_y, max_x, max_y = ScenePartition.bounds(elements)
+            label = f"{name}\n{len(elements)} elements"
+            tiles.append(overview.rectangle(label).position(min_x, min_y).size(max_x - min_x, max_y - min_y).link(url))
+        for (i, j), arrows in crossing.items():
+            overview.arrow(str(len(arrows))).bind(tiles[i], tiles[j])
+        with self.__open_replaced(file_path) as file:
+            overview._write(file)
+        return paths
+
+    def stream(self, file_path: str) -> Self:
+        if self.__stream is not None:
+            raise ValueError("The scene is already streamed to a file.")
+        self.__stream = open(file_path, 'w', encoding='utf-8')
+        self.__streamed = 0
+        return self
+
+    def flush(self) -> Self:
+        if self.__stream is None:
+            raise ValueError("The scene is not streamed to a file, call stream() first.")
+        try:
+            self.__finalize()
+            self.__resample_images()
+            for element in self._elements:
+                # The head is written with the first element, a scene without elements is written whole by close()
+                if self.__streamed:
+                    self.__stream.write(",\n    ")
+                else:
+                    self.__encode(self.__placeholder_document(), self.__stream, head = True)
+                # The elements are indented as in the whole document, so the file is the same as the saved one
+                self.__stream.write(json.dumps(element, cls = self.ElementEncoder, indent = 2).replace("\n", "\n    "))
+                self.__streamed += 1
+        except BaseException:
+            self.__abort_stream()
+            raise
+        self._elements = []
+        self.__indexes.release()
+        return self
+
+    def close(self) -> Self:
+        self.flush()
+        stream = cast(TextIO, self.__stream)
+        self.__stream = None
+        try:
+            if self.__streamed:
+                self.__encode(self.__placeholder_document(), stream, head = False)
+            else:
+                self.__encode(self.__document([], self._files), stream)
+        finally:
+            stream.close()
+        return self
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exception_type, *_) -> None:
+        if self.__stream is None:
+            return
+        if exception_type is None:
+            self.close()
+        else:
+            self.__abort_stream()
+
+    def _write(self, stream: TextIO) -> None:
+        """Write the JSON document to the stream without materializing image data URLs in memory."""
+        self.__check_not_streamed()
+        self.__finalize()
+        self.__resample_images()
+        self.__encode(self, stream)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def __open_replaced(file_path: str) -> Iterator[TextIO]:
+        """Open a temporary file next to the target, which replaces the target only when it is written completely.
+
+        Image files are read only while the document is written, so writing fails if one of them is gone.
+        The target then keeps its previous content, instead of a truncated document.
+        """
+        directory, name = os.path.split(os.path.abspath(file_path))
+        temporary = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temporary, 'x', encoding='utf-8') as file:
+                yield file
+            os.replace(temporary, file_path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+    @classmethod
+    def __encode(cls, document: "ExcaligenStructure", stream: TextIO, head: bool | None = None) -> None:
+        """Write the document, or with `head` only its part before or after the placeholder of the elements."""
+        encoder = cls.StreamingEncoder(indent = 2)
+        placeholder = json.dumps(cls._ELEMENTS_PLACEHOLDER)
+        writing = head is not False
+        for chunk in encoder.iterencode(document):
+            if head is not None and placeholder in chunk:
+                before, after = chunk.split(placeholder, 1)
+                if head:
+                    stream.write(before)
+                    return
+                chunk, writing = after, True
+            if not writing:
+                continue
+            payload = encoder.pop_payload(chunk)
+            if payload is None:
+                stream.write(chunk)
+            else:
+                stream.write('"')
+                for part in payload.iter_data_url():
+                    stream.write(part)
+                stream.write('"')
+
+    def __getstate__(self) -> dict[str, Any]:
+        if self.__stream is not None:
+            raise ValueError("A streamed scene cannot be pickled, call close() first.")
+        return self.__dict__
+
+    def _on_image(self, id: str, image_data: ImageData) -> None:
+        self.__images[id] = image_data
         self._files[id] = {
-            "mimeType": mime_type,
+            "mimeType": image_data.mime_type,
             "id": id,
-            "dataURL": data_url
+            "dataURL": image_data
         }
 
     def _on_text(self, text: str) -> Text:
         return cast(Text, self.__append_element(self.__factory.text(text)))
 
+    def _remove_elements(self, elements: list[AbstractElement]) -> None:
+        """Take elements and their labels out of the scene, and drop the bindings of the other elements to them."""
+        ids = {element._id for element in elements}
+        ids |= {element._id for element in self._elements if isinstance(element, Text) and element._container_id in ids}
+        self._elements = [element for element in self._elements if element._id not in ids]
+        for element in self._elements:
+            element._remove_bound_elements(ids)
+        # Frames removed together with their members keep them, the other frames let the removed elements go
+        for element in elements:
+            frame = cast(Frame | None, element._get_frame())
+            if frame is not None and frame._id not in ids:
+                element._set_frame(None, None)
+            if isinstance(element, Frame):
+                for member in element._members():
+                    if member._id not in ids:
+                        member._set_frame(None, None)
+
+    def _transform_elements(self, elements: Sequence[AbstractElement], transform: AffineTransform) -> None:
+        """Transform elements in a batch: the origins of all elements at once and the points of all lines at once.
+
+        Labels follow their containers and the contents of frames follow the frames. Arrows bound to the elements
+        are routed again, unless they are only translated together with both of their elements.
+        """
+        members = {element._id: element for element in elements}
+        frames = [element for element in elements if isinstance(element, Frame)]
+        while frames:
+            for member in frames.pop()._members():
+                if member._id not in members:
+                    members[member._id] = member
+                    if isinstance(member, Frame):
+                        frames.append(member)
+        transformed = [element for element in members.values() if not (isinstance(element, Text) and element._container_id is not None)]
+
+        origins = transform.apply_many(array('d', chain.from_iterable(element._transform_origin() for element in transformed)))
+        lines = [element for element in transformed if isinstance(element, AbstractLine)]
+        points, offsets = None, {}
+        if lines and not transform.is_translation():
+            coordinates = array('d')
+            for line in lines:
+                offsets[line._id] = (len(coordinates), len(coordinates) + 2 * len(line._points))
+                coordinates.extend(line._points.coordinates())
+            points = transform.apply_many(coordinates, linear=True)
+
+        for i, element in enumerate(transformed):
+            x, y = float(origins[2 * i]), float(origins[2 * i + 1])
+            if isinstance(element, AbstractLine):
+                start, end = offsets.get(element._id, (0, 0))
+                element._transform(transform, x, y, points[start:end] if points is not None else None)
+            else:
+                element._transform(transform, x, y)
+
+        bound_ids = {bound["id"] for element in transformed for bound in element._bound_elements or ()} - members.keys()
+        arrows = transformed + [element for element in self._elements if element._id in bound_ids] if bound_ids else transformed
+        for arrow in arrows:
+            if isinstance(arrow, Arrow) and (endpoints := arrow._endpoints()) is not None:
+                translated_along = transform.is_translation() and arrow._id in members and all(end._id in members for end in endpoints)
+                if not translated_along:
+                    arrow._reconnect()
+
+        for element in transformed:
+            if isinstance(element, Frame):
+                element._refit()
+
     def __append_element(self, element: AbstractElement) -> AbstractElement:
-        element._index = self.__index
+        # Safe to call from several threads: the index comes from a block of the thread, appending to a list is atomic
+        element._index = self.__indexes.next()
         self._elements.append(element)
-        self.__index = self.__indexer.next()
         
         return element
-        
+
+    def __merge_images(self, other: "ExcaligenStructure", digests: dict[bytes, str]) -> dict[str, str]:
+        """Add the images of another scene that this one does not have yet.
+
+        Returns:
+            dict[str, str]: The file ids in this scene by the file ids in the other one.
+        """
+        file_ids = {}
+        for id, data in other.__images.items():
+            digest = self.__digest(data)
+            if digest not in digests:
+                digests[digest] = id if id not in self.__images else str(uuid.uuid4())
+                self._on_image(digests[digest], data)
+            file_ids[id] = digests[digest]
+        return file_ids
+
+    @staticmethod
+    def __digest(data: ImageData) -> bytes:
+        digest = hashlib.sha256(data.mime_type.encode())
+        for chunk in data._iter_payload():
+            digest.update(chunk)
+        return digest.digest()
+
+    def __placeholder_document(self) -> "ExcaligenStructure":
+        return self.__document([self._ELEMENTS_PLACEHOLDER], self._files)  # type: ignore
+
+    def __document(self, elements: list[AbstractElement], files: dict[str, Any]) -> "ExcaligenStructure":
+        """Get a shallow copy of the scene to encode with other elements and files."""
+        document = object.__new__(type(self))
+        document.__dict__.update(self.__dict__, _elements = elements, _files = files)
+        return document
+
+    def __abort_stream(self) -> None:
+        """Close the streamed file unfinished."""
+        stream, self.__stream = self.__stream, None
+        if stream is not None:
+            stream.close()
+
+    def __check_not_streamed(self) -> None:
+        if self.__stream is not None:
+            raise ValueError("The scene is streamed to a file, call close() to finish it.")
+
+    def __finalize(self) -> None:
+        """Bring the elements to the state they are written in."""
+        if self.__indexes.concurrent():
+            # Elements appended by several threads interleave, the indexes give their order
+            self._elements.sort(key = lambda element: element._index or "")
+        self.__refit_frames()
+
+    def __refit_frames(self) -> None:
+        for element in self._elements:
+            if isinstance(element, Frame):
+                element._refit()
+
+    def __resample_images(self) -> None:
+        """Downscale the embedded images to their final displayed size, which is known only at serialization."""
+        if self.__resampler is None:
+            return
+
+        # Elements sharing a file (stamps, merged scenes) show it at the largest of their displayed sizes
+        sizes: dict[str, tuple[float, float]] = {}
+        for element in self._elements:
+            if isinstance(element, Image) and element._file_id in self.__images:
+                width, height = sizes.get(element._file_id, (0.0, 0.0))
+                sizes[element._file_id] = max(width, element._width), max(height, element._height)
+
+        # One entry per file, replaced when the size changes, so resized images do not keep old payloads
+        for file_id, size in sizes.items():
+            original = self.__images[file_id]
+            cached = self.__resampled.get(file_id)
+            if cached is None or cached[0] != size or cached[1] is not original:
+                cached = size, original, self.__resampler.resample(original, *size)
+                self.__resampled[file_id] = cached
+            self._files[file_id]["dataURL"] = cached[2]
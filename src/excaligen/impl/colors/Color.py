@@ -1,10 +1,13 @@
 """
-Description: Color class for handling RGB and HSL colors. Contains also a static method for parsing color strings.
+Description: Color class for handling RGB and HSL colors. Contains also a static method for parsing color strings
+and palette generators (ramps and categorical palettes).
 """
 # Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from typing import Self, overload
+from functools import lru_cache
+import math
 
 
 class Color:
@@ -56,6 +59,10 @@ class Color:
         "Wheat", "White", "WhiteSmoke",
         "Yellow", "YellowGreen"
     }
+    _CANONICAL_NAMES = {name.casefold(): name for name in _COLOR_NAMES}
+
+    _INTERPOLATION_SPACES = ("rgb", "hsl", "oklch")
+    _GOLDEN_ANGLE = 137.50776405003785
 
     def __init__(self):
         self._r = 0
@@ -189,21 +196,81 @@ class Color:
 
         return (round((r_temp + m) * 255), round((g_temp + m) * 255), round((b_temp + m) * 255))
     
+    @staticmethod
+    def ramp(stops: "list[str | Color]", n: int, space: str = "oklch") -> "list[Color]":
+        """
+        Generates n colors evenly spread along a gradient through the given color stops.
+        The stops are hex strings or Color instances, they are equally spaced along the gradient.
+        The interpolation space is 'rgb', 'hsl' or 'oklch' (perceptually uniform, the default).
+        Hues are interpolated along the shorter arc.
+        """
+        if len(stops) < 2:
+            raise ValueError("A color ramp needs at least 2 stops.")
+        if n < 1:
+            raise ValueError("The number of colors must be at least 1.")
+        if space not in Color._INTERPOLATION_SPACES:
+            raise ValueError(f"Invalid interpolation space '{space}'. Use 'rgb', 'hsl', or 'oklch'.")
+
+        to_space, from_space = {
+            "rgb": (lambda rgb: rgb, lambda rgb: rgb),
+            "hsl": (Color._rgb_to_hsl_float, Color._hsl_float_to_rgb),
+            "oklch": (Color._rgb_to_oklch, Color._oklch_to_rgb),
+        }[space]
+        hue_index = None if space == "rgb" else 0 if space == "hsl" else 2
+        points = [to_space(Color._stop_to_rgb(stop)) for stop in stops]
+
+        colors = []
+        segments = len(points) - 1
+        for i in range(n):
+            position = i / (n - 1) * segments if n > 1 else 0.0
+            segment = min(int(position), segments - 1)
+            t = position - segment
+            start, end = points[segment], points[segment + 1]
+
+            mixed = [a + (b - a) * t for a, b in zip(start, end)]
+            if hue_index is not None:
+                mixed[hue_index] = Color._mix_hue(start, end, hue_index, t)
+            colors.append(Color().rgb(*Color._clamp_rgb(from_space(tuple(mixed)))))
+        return colors
+
+    @staticmethod
+    def categorical(n: int, lightness: float = 0.7, chroma: float = 0.15, start_hue: float = 30.0) -> "list[Color]":
+        """
+        Generates n visually distinct colors of the same perceived lightness, e.g. for data series or categories.
+        The hues are spread by the golden angle in the OKLCH space, so any prefix of the palette is well distributed.
+        lightness is the OKLCH lightness 0-1, chroma the OKLCH chroma (about 0-0.37), which is reduced
+        for hues that cannot be displayed with it.
+        """
+        if n < 1:
+            raise ValueError("The number of colors must be at least 1.")
+        if not 0 <= lightness <= 1:
+            raise ValueError("Lightness must be between 0 and 1.")
+        if chroma < 0:
+            raise ValueError("Chroma must not be negative.")
+
+        return [
+            Color().rgb(*Color._clamp_rgb(Color._oklch_to_rgb((lightness, chroma, (start_hue + i * Color._GOLDEN_ANGLE) % 360))))
+            for i in range(n)
+        ]
+
     def __str__(self) -> str:
         return f"#{self._r:02X}{self._g:02X}{self._b:02X}"
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _string(color: str) -> str:
+        # Cached, diagrams use the same few colors over and over again
         color = color.strip()
         if color.startswith("#"):
             if Color._is_valid_hex_color(color):
                 return color.upper()
             else:
                 raise ValueError(f"Invalid hex color: {color}")
-        for valid_color in Color._COLOR_NAMES:
-            if color.casefold() == valid_color.casefold():
-                return valid_color
-        raise ValueError(f"Invalid color name: {color}")
+
+        canonical = Color._CANONICAL_NAMES.get(color.casefold())
+        if canonical is None:
+            raise ValueError(f"Invalid color name: {color}")
+        return canonical
 
     @staticmethod
     def from_(input_color: "str | Color") -> str:
@@ -216,6 +283,121 @@ class Color:
             case _:
                 raise TypeError("Invalid input type. Expected str or Color.")
 
+    @staticmethod
+    def _stop_to_rgb(stop: "str | Color") -> tuple[float, float, float]:
+        match stop:
+            case Color():
+                return stop.rgb()
+            case str() if stop.strip().startswith("#"):
+                return Color._hex_to_rgb(stop.strip())
+            case str():
+                raise ValueError(f"Invalid color stop: {stop}. Use a hex color or a Color instance.")
+            case _:
+                raise TypeError("Invalid color stop type. Expected str or Color.")
+
+    @staticmethod
+    def _mix_hue(start: list | tuple, end: list | tuple, index: int, t: float) -> float:
+        """ Interpolates the hue along the shorter arc. An achromatic end takes the hue of the other one. """
+        chroma_index = 1 # Saturation in HSL, chroma in OKLCH
+        start_hue, end_hue = start[index], end[index]
+        if start[chroma_index] < 1e-6:
+            start_hue = end_hue
+        elif end[chroma_index] < 1e-6:
+            end_hue = start_hue
+
+        delta = (end_hue - start_hue + 180) % 360 - 180
+        return (start_hue + delta * t) % 360
+
+    @staticmethod
+    def _clamp_rgb(rgb: tuple[float, float, float]) -> tuple[int, int, int]:
+        return tuple(min(255, max(0, round(channel))) for channel in rgb) # type: ignore the tuple has 3 items
+
+    @staticmethod
+    def _rgb_to_hsl_float(rgb: tuple[float, float, float]) -> tuple[float, float, float]:
+        """ Converts RGB 0-255 to HSL with hue 0-360 and saturation and lightness 0-1, without rounding. """
+        r, g, b = (channel / 255.0 for channel in rgb)
+        c_max, c_min = max(r, g, b), min(r, g, b)
+        delta = c_max - c_min
+        l = (c_max + c_min) / 2
+        if delta == 0:
+            return 0.0, 0.0, l
+
+        s = delta / (1 - abs(2 * l - 1))
+        if c_max == r:
+            h = ((g - b) / delta) % 6
+        elif c_max == g:
+            h = (b - r) / delta + 2
+        else:
+            h = (r - g) / delta + 4
+        return h * 60, s, l
+
+    @staticmethod
+    def _hsl_float_to_rgb(hsl: tuple[float, float, float]) -> tuple[float, float, float]:
+        h, s, l = hsl
+        c = (1 - abs(2 * l - 1)) * s
+        x = c * (1 - abs((h / 60) % 2 - 1))
+        m = l - c / 2
+        r, g, b = [(c, x, 0), (x, c, 0), (0, c, x), (0, x, c), (x, 0, c), (c, 0, x)][int(h // 60) % 6]
+        return (r + m) * 255, (g + m) * 255, (b + m) * 255
+
+    @staticmethod
+    def _rgb_to_oklch(rgb: tuple[float, float, float]) -> tuple[float, float, float]:
+        """ Converts RGB 0-255 to OKLCH (lightness 0-1, chroma, hue 0-360). """
+        r, g, b = (Color._to_linear(channel / 255.0) for channel in rgb)
+
+        l = math.cbrt(0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b)
+        m = math.cbrt(0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b)
+        s = math.cbrt(0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b)
+
+        lightness = 0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s
+        a = 1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s
+        b_ = 0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s
+        return lightness, math.hypot(a, b_), math.degrees(math.atan2(b_, a)) % 360
+
+    @staticmethod
+    def _oklch_to_rgb(lch: tuple[float, float, float]) -> tuple[float, float, float]:
+        """ Converts OKLCH to RGB 0-255. Colors out of the sRGB gamut are mapped into it by reducing the chroma. """
+        lightness, chroma, hue = lch
+        rgb = Color._oklch_to_linear_rgb(lightness, chroma, hue)
+        if not Color._in_gamut(rgb):
+            low, high = 0.0, chroma
+            for _ in range(24):
+                middle = (low + high) / 2
+                if Color._in_gamut(Color._oklch_to_linear_rgb(lightness, middle, hue)):
+                    low = middle
+                else:
+                    high = middle
+            rgb = Color._oklch_to_linear_rgb(lightness, low, hue)
+
+        return tuple(Color._from_linear(min(1.0, max(0.0, channel))) * 255 for channel in rgb) # type: ignore the tuple has 3 items
+
+    @staticmethod
+    def _oklch_to_linear_rgb(lightness: float, chroma: float, hue: float) -> tuple[float, float, float]:
+        a = chroma * math.cos(math.radians(hue))
+        b = chroma * math.sin(math.radians(hue))
+
+        l = (lightness + 0.3963377774 * a + 0.2158037573 * b) ** 3
+        m = (lightness - 0.1055613458 * a - 0.0638541728 * b) ** 3
+        s = (lightness - 0.0894841775 * a - 1.2914855480 * b) ** 3
+
+        return (
+            4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s,
+            -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s,
+            -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s,
+        )
+
+    @staticmethod
+    def _in_gamut(rgb: tuple[float, float, float]) -> bool:
+        return all(-1e-4 <= channel <= 1 + 1e-4 for channel in rgb)
+
+    @staticmethod
+    def _to_linear(channel: float) -> float:
+        return channel / 12.92 if channel <= 0.04045 else ((channel + 0.055) / 1.055) ** 2.4
+
+    @staticmethod
+    def _from_linear(channel: float) -> float:
+        return channel * 12.92 if channel <= 0.0031308 else 1.055 * channel ** (1 / 2.4) - 0.055
+
     @staticmethod
     def _hex_to_rgb(hex: str) -> tuple[int, int, int]:
         """ Converts hex color to RGB. """
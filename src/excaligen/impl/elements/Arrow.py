@@ -1,7 +1,7 @@
 """
 Description: Arrow element.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 
@@ -17,6 +17,7 @@ from ..geometry.CurveConnection import CurveConnection
 from ..geometry.ElbowConnection import ElbowConnection
 from ..geometry.Directions import Directions
 from ..geometry.Point import Point
+from ..geometry.AffineTransform import AffineTransform
 
 from ..inputs.Arrowheads import Arrowheads
 
@@ -48,13 +49,13 @@ class Arrow(AbstractLine, AbstractLabeledElement):
         ELBOW = 3
         FREE = 4
 
+    _STYLE_ATTRIBUTES = ("_start_arrowhead", "_end_arrowhead")
+
     def __init__(self, defaults: Defaults, listener: AbstractPlainLabelListener, label: str | Text | None = None) -> None:
         AbstractLine.__init__(self, "arrow", defaults)
         self._init_labels(listener, label)
         self._start_binding = None
         self._end_binding = None
-        self._start_arrowhead = getattr(defaults, "_start_arrowhead")
-        self._end_arrowhead = getattr(defaults, "_end_arrowhead")
         self._elbowed = False
         self.__start_gap = 1
         self.__end_gap = 1
@@ -63,6 +64,7 @@ class Arrow(AbstractLine, AbstractLabeledElement):
         self.__start_direction: str | None = None
         self.__end_direction: str | None = None
         self.__radius: float | None = None  # For arc connections
+        self.__arc_tolerance: float | None = None
         self.__start_element: AbstractElement | None = None
         self.__end_element: AbstractElement | None = None
         self.__connection_type = Arrow.ConnectionType.STRAIGHT
@@ -85,7 +87,7 @@ class Arrow(AbstractLine, AbstractLabeledElement):
         self.__try_connect_elements()
         return self
     
-    def arc(self, radius: float) -> Self:
+    def arc(self, radius: float, tolerance: float | None = None) -> Self:
         """Approximate an arc between the bound elements with the given radius.
 
         The center of the arc is determined by the radius and the positions of the bound elements
@@ -93,12 +95,21 @@ class Arrow(AbstractLine, AbstractLabeledElement):
 
         Args:
             radius (float): The radius of the arc.
+            tolerance (float, optional): The maximal distance of the approximation from the arc.
+                If given, the arc is sampled with the minimal number of points within the tolerance.
+                Defaults to None, using a fixed point spacing.
 
         Returns:
             Self: The current instance of the Arrow class.
+
+        Raises:
+            ValueError: If the tolerance is not positive.
         """
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError("The tolerance must be a positive number.")
         self.__connection_type = Arrow.ConnectionType.ARC
         self.__radius = radius
+        self.__arc_tolerance = tolerance
         self.roundness('round')
         self.__try_connect_elements()
         return self
@@ -174,6 +185,21 @@ class Arrow(AbstractLine, AbstractLabeledElement):
         self.__try_connect_elements()
         return self 
 
+    def points_from_buffer(self, buffer: Any) -> Self:
+        """Set the points of the arrow from a buffer of interleaved x and y coordinates, without copying them.
+
+        Args:
+            buffer (Any): An object supporting the buffer protocol with C-contiguous float64 values x0, y0, x1, y1, ...,
+                e.g. `array('d')` or a NumPy array of shape (n, 2). It must not be modified afterwards.
+
+        Returns:
+            Self: The current instance of the Arrow class.
+        """
+        super().points_from_buffer(buffer)
+        self.__connection_type = Arrow.ConnectionType.FREE
+        self.__try_connect_elements()
+        return self
+
     def bind(self, start: AbstractElement, end: AbstractElement) -> Self:
         """Bind the arrow between two elements, supporting different connection styles.
 
@@ -189,6 +215,46 @@ class Arrow(AbstractLine, AbstractLabeledElement):
         self.__try_connect_elements()
         return self
     
+    @override
+    def _remap(self, clones: dict[str, AbstractElement], group_ids: dict[str, str]) -> None:
+        super()._remap(clones, group_ids)
+        # A binding to an element out of the cloned set is dropped, the arrow keeps its translated points
+        self.__start_element = clones.get(self.__start_element._id) if self.__start_element is not None else None
+        self.__end_element = clones.get(self.__end_element._id) if self.__end_element is not None else None
+        self._start_binding = self.__remap_binding(self._start_binding, self.__start_element)
+        self._end_binding = self.__remap_binding(self._end_binding, self.__end_element)
+
+    @override
+    def _transform(self, transform: AffineTransform, x: float, y: float, points: Any = None) -> None:
+        AbstractLine._transform(self, transform, x, y, points)
+        self._transform_label(transform)
+
+    @override
+    def _remove_bound_elements(self, ids: set[str]) -> None:
+        super()._remove_bound_elements(ids)
+        # A binding to a removed element is dropped, the arrow keeps its points
+        if self.__start_element is not None and self.__start_element._id in ids:
+            self.__start_element = None
+            self._start_binding = None
+        if self.__end_element is not None and self.__end_element._id in ids:
+            self.__end_element = None
+            self._end_binding = None
+
+    def _endpoints(self) -> tuple[AbstractElement, AbstractElement] | None:
+        """Get the elements the arrow is bound to, None if it is not bound."""
+        if self.__start_element is None or self.__end_element is None:
+            return None
+        return self.__start_element, self.__end_element
+
+    def _reconnect(self) -> Self:
+        """Compute the points again, after the bound elements changed."""
+        return self.__try_connect_elements()
+
+    def __remap_binding(self, binding: dict[str, Any] | None, element: AbstractElement | None) -> dict[str, Any] | None:
+        if binding is None or element is None:
+            return None
+        return binding | {"elementId": element._id}
+
     def __try_connect_elements(self) -> Self:
         """Attempt to connect the bound elements based on the connection type.
 
@@ -216,7 +282,7 @@ class Arrow(AbstractLine, AbstractLabeledElement):
                 self.__transform_points(StraightConnection(self.__start_element, self.__end_element).points()) # type: ignore
 
             case Arrow.ConnectionType.ARC:
-                self.__transform_points(ArcConnection(self.__start_element, self.__end_element, self.__radius).points()) # type: ignore
+                self.__transform_points(ArcConnection(self.__start_element, self.__end_element, self.__radius, self.__arc_tolerance).points()) # type: ignore
 
             case Arrow.ConnectionType.CURVE:
                 self.__transform_points(CurveConnection(self.__start_element, self.__end_element, self.__start_angle, self.__end_angle).points()) # type: ignore
@@ -1,7 +1,7 @@
 """
 Description: Factory for creating elements.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from ...defaults.Defaults import Defaults
@@ -18,7 +18,7 @@ from .Line import Line
 from .Text import Text
 from .Image import Image
 from .Frame import Frame
-from .Group import Group
+from .Group import Group, Transformer
 
 from typing import Self
 
@@ -102,13 +102,16 @@ class ElementFactory():
         """
         return Frame(self._defaults, title)
 
-    def group(self) -> Group:
+    def group(self, transformer: Transformer) -> Group:
         """Create a group element with the current configuration.
 
+        Args:
+            transformer (Transformer): The function transforming the members of the group.
+
         Returns:
             Group: The group element.
         """
-        return Group(self._defaults)
+        return Group(self._defaults, transformer)
     
     def color(self) -> Color:
         """Create a color object.
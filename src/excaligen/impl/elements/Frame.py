@@ -6,6 +6,7 @@ Description: Frame container for elements.
 
 from ..base.AbstractElement import AbstractElement
 from ..base.AbstractShape import AbstractShape
+from ..base.AbstractFrameListener import AbstractFrameListener
 
 from ..elements.Rectangle import Rectangle
 from ..elements.Diamond import Diamond
@@ -14,16 +15,17 @@ from ..elements.Arrow import Arrow
 from ..elements.Line import Line
 from ..elements.Text import Text
 from ..elements.Image import Image
+from ..geometry.AffineTransform import AffineTransform
 from ...defaults.Defaults import Defaults
 
-from typing import Self
-import math
+from typing import Self, cast, override
 
 Element = Rectangle | Diamond | Ellipse | Arrow | Line | Text | Image
+Box = tuple[float, float, float, float]
 
 DEFAULT_FRAME_INSET: float = 30.0
 
-class Frame(AbstractShape):
+class Frame(AbstractShape, AbstractFrameListener):
     """A visual container that can hold other elements and automatically adjusts its size.
     
     Frame is a fundamental layout component that serves as a container for other elements.
@@ -31,6 +33,9 @@ class Frame(AbstractShape):
     sized. Frames can also have titles and background colors, making them useful for
     grouping related elements and creating visual hierarchies in the layout.
 
+    A frame that is not sized explicitly keeps fitting its elements when they move or resize later.
+    Frames can be nested: the outer frame fits around the inner one.
+
     > [!WARNING]
     > Do not instantiate this class directly. Use `SceneBuilder.frame()` instead.
     """
@@ -38,8 +43,14 @@ class Frame(AbstractShape):
         super().__init__("frame", defaults)
         self._width = 0.0
         self._height = 0.0
-        self._background_color = getattr(defaults, "_background_color")
         self._name = title
+        self.__fitting = True
+        self.__members: dict[str, AbstractElement] = {}
+        # The boxes of the members when the frame saw them last, and the box around all of them
+        self.__boxes: dict[str, Box] = {}
+        self.__bounds: Box | None = None
+        # Set when a member at the border moved inwards, the bounds may then be larger than needed until refitted
+        self.__stale = False
 
     def title(self, title: str) -> Self:
         """Set the title of the frame.
@@ -52,32 +63,137 @@ class Frame(AbstractShape):
         """
         self._name = title
         return self
-    
+
+    @override
+    def size(self, width: float, height: float) -> Self:
+        """Set the size of the frame. The frame then does not fit its elements any more.
+
+        Args:
+            width (float): The width of the frame.
+            height (float): The height of the frame.
+
+        Returns:
+            Self: The current instance of the Frame class.
+        """
+        self.__fitting = False
+        return super().size(width, height)
+
     def elements(self, *elements: AbstractElement) -> Self:
         """Add elements to the frame and adjust the frame size accordingly.
 
+        The elements leave the frames they were in before. A frame added to a frame is nested in it.
+
         Args:
             elements (AbstractElement): The elements to add to the frame.
 
         Returns:
             Self: The current instance of the Frame class.
+
+        Raises:
+            ValueError: If a frame would be nested in itself.
         """
-        min_x, min_y = math.inf, math.inf
-        max_x, max_y = -math.inf, -math.inf
-        
         for element in elements:
-            element._frame_id = self._id
-
-            min_x = min(min_x, element._x)
-            min_y = min(min_y, element._y)
-            max_x = max(max_x, element._x + element._width)
-            max_y = max(max_y, element._y + element._height)
-
-        if self._width == 0.0 and self._height == 0.0:
-            width = max_x - min_x + 2 * DEFAULT_FRAME_INSET
-            height = max_y - min_y + 2 * DEFAULT_FRAME_INSET
-            self.size(width, height)
-            self.position(min_x - DEFAULT_FRAME_INSET, min_y - DEFAULT_FRAME_INSET)
-
+            if isinstance(element, Frame):
+                frame: AbstractFrameListener | None = self
+                while frame is not None:
+                    if frame is element:
+                        raise ValueError("A frame cannot be nested in itself.")
+                    frame = cast(Frame, frame)._get_frame()
+                # Excalidraw does not nest frames, so the nesting is not written to the file
+                element._set_frame(self, None)
+            else:
+                element._set_frame(self, self._id)
         return self
 
+    def _members(self) -> list[AbstractElement]:
+        return list(self.__members.values())
+
+    def _add_member(self, element: AbstractElement) -> None:
+        box = Frame.__box(element)
+        self.__members[element._id] = element
+        self.__boxes[element._id] = box
+        self.__extend(box)
+        self.__fit()
+
+    def _remove_member(self, element: AbstractElement) -> None:
+        if self.__members.pop(element._id, None) is not None:
+            box = self.__boxes.pop(element._id)
+            self.__stale = self.__stale or self.__at_border(box)
+
+    def _on_member_changed(self, element: AbstractElement) -> None:
+        box = Frame.__box(element)
+        previous = self.__boxes.get(element._id)
+        if previous == box:
+            return
+        self.__boxes[element._id] = box
+        if previous is not None and not self.__stale:
+            moved_in = (box[0] > previous[0], box[1] > previous[1], box[2] < previous[2], box[3] < previous[3])
+            self.__stale = any(inward and at_border for inward, at_border in zip(moved_in, self.__at_borders(previous)))
+        self.__extend(box)
+        self.__fit()
+
+    def _refit(self) -> None:
+        """Shrink the bounds if a member at the border moved inwards, nested frames first.
+
+        Moves outwards extend the frame right away, moves inwards only mark it stale, so the frame
+        is refitted once for any number of moves. The scene refits its frames before it is written.
+        """
+        for member in self.__members.values():
+            if isinstance(member, Frame) and member.__stale:
+                member._refit()
+        if self.__stale:
+            self.__stale = False
+            self.__bounds = None
+            for box in self.__boxes.values():
+                self.__extend(box)
+            self.__fit()
+
+    @override
+    def _transform(self, transform: AffineTransform, x: float, y: float) -> None:
+        """Excalidraw frames cannot be rotated, the frame stays axis-aligned.
+
+        A fitting frame is refitted around its transformed members, a sized frame covers its transformed box.
+        """
+        if self.__fitting and self.__members:
+            self.__stale = True
+            return
+        corners = [transform.apply(cx, cy) for cx in (self._x, self._x + self._width) for cy in (self._y, self._y + self._height)]
+        xs, ys = [cx for cx, _ in corners], [cy for _, cy in corners]
+        self._x, self._y, self._width, self._height = min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)
+        self._changed()
+
+    @override
+    def _clone(self, dx: float, dy: float) -> Self:
+        # The clones of the members join the clone in their `_remap()`
+        clone = super()._clone(dx, dy)
+        clone.__members, clone.__boxes, clone.__bounds, clone.__stale = {}, {}, None, False
+        return clone
+
+    def __extend(self, box: Box) -> None:
+        bounds = self.__bounds
+        if bounds is None:
+            self.__bounds = box
+        elif box[0] < bounds[0] or box[1] < bounds[1] or box[2] > bounds[2] or box[3] > bounds[3]:
+            self.__bounds = (min(bounds[0], box[0]), min(bounds[1], box[1]), max(bounds[2], box[2]), max(bounds[3], box[3]))
+
+    def __fit(self) -> None:
+        if not self.__fitting or self.__bounds is None:
+            return
+        min_x, min_y, max_x, max_y = self.__bounds
+        geometry = (min_x - DEFAULT_FRAME_INSET, min_y - DEFAULT_FRAME_INSET, max_x - min_x + 2 * DEFAULT_FRAME_INSET, max_y - min_y + 2 * DEFAULT_FRAME_INSET)
+        if geometry != (self._x, self._y, self._width, self._height):
+            self._x, self._y, self._width, self._height = geometry
+            self._changed()
+
+    def __at_border(self, box: Box) -> bool:
+        return any(self.__at_borders(box))
+
+    def __at_borders(self, box: Box) -> tuple[bool, bool, bool, bool]:
+        bounds = self.__bounds
+        if bounds is None:
+            return (False, False, False, False)
+        return (box[0] <= bounds[0], box[1] <= bounds[1], box[2] >= bounds[2], box[3] >= bounds[3])
+
+    @staticmethod
+    def __box(element: AbstractElement) -> Box:
+        return (element._x, element._y, element._x + element._width, element._y + element._height)
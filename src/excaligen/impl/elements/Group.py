@@ -3,7 +3,7 @@ Description: Group is virtual only element that groups real elements together.
 It is not written in Excalidraw file, the element belonging to a group refers
 to the group by groupIds attribute instead.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from ..elements.Rectangle import Rectangle
@@ -14,13 +14,17 @@ from ..elements.Line import Line
 from ..elements.Text import Text
 from ..elements.Image import Image
 from ..elements.Frame import Frame
+from ..base.AbstractElement import AbstractElement
+from ..geometry.AffineTransform import AffineTransform
+from ..geometry.Point import Point
 from ...defaults.Defaults import Defaults
 
-from typing import Self
+from typing import Callable, Self
 
 import uuid
 
 Element = Rectangle | Diamond | Ellipse | Arrow | Line | Text | Image | Frame
+Transformer = Callable[[list[AbstractElement], AffineTransform], None]
 
 class Group():
     """A container class that represents a group of elements.
@@ -28,11 +32,16 @@ class Group():
     within a group can be manipulated together while maintaining their individual properties.
     Each group is identified by a unique UUID.
 
+    The group can be moved, scaled and rotated as a whole. The members are transformed in one batch,
+    their labels, the contents of member frames and the arrows bound to them follow.
+
     > [!WARNING]
     > Do not instantiate this class directly. Use `SceneBuilder.group()` instead.
     """
-    def __init__(self, defaults: Defaults):
+    def __init__(self, defaults: Defaults, transformer: Transformer):
         self.__id = str(uuid.uuid4())
+        self.__elements: list[AbstractElement] = []
+        self.__transformer = transformer
 
     def elements(self, *elements: Element) -> Self:
         """Add elements to the group.
@@ -45,5 +54,67 @@ class Group():
         """
         for element in elements:
             element._add_group_id(self.__id) # type: ignore
+            self.__elements.append(element)
+
+        return self
+
+    def translate(self, dx: float, dy: float) -> Self:
+        """Move the elements of the group.
+
+        Args:
+            dx (float): The distance to move along the x axis.
+            dy (float): The distance to move along the y axis.
+
+        Returns:
+            Self: The current instance of the Group class.
+        """
+        return self.__transform(AffineTransform.translation(dx, dy))
+
+    def scale(self, sx: float, sy: float | None = None, origin: Point | None = None) -> Self:
+        """Scale the elements of the group. Texts and labels are scaled by their font size.
+
+        Args:
+            sx (float): The scale factor along the x axis.
+            sy (float | None): The scale factor along the y axis. Defaults to `sx`.
+            origin (Point | None): The point that stays in place. Defaults to the center of the group.
+
+        Returns:
+            Self: The current instance of the Group class.
+
+        Raises:
+            ValueError: If a scale factor is not positive.
+        """
+        sy = sx if sy is None else sy
+        if sx <= 0 or sy <= 0:
+            raise ValueError("The scale factors must be positive.")
+        return self.__transform(AffineTransform.scaling(sx, sy, origin or self.center()))
+
+    def rotate(self, angle: float, origin: Point | None = None) -> Self:
+        """Rotate the elements of the group clockwise around a point.
+
+        Args:
+            angle (float): The angle in radians.
+            origin (Point | None): The center of the rotation. Defaults to the center of the group.
+
+        Returns:
+            Self: The current instance of the Group class.
+        """
+        return self.__transform(AffineTransform.rotation(angle, origin or self.center()))
+
+    def center(self) -> Point:
+        """Get the center of the bounding box of the elements, as they are not rotated.
+
+        Returns:
+            Point: The x and y coordinates of the center, (0, 0) for an empty group.
+        """
+        if not self.__elements:
+            return (0.0, 0.0)
+        min_x = min(element._x for element in self.__elements)
+        min_y = min(element._y for element in self.__elements)
+        max_x = max(element._x + element._width for element in self.__elements)
+        max_y = max(element._y + element._height for element in self.__elements)
+        return ((min_x + max_x) / 2, (min_y + max_y) / 2)
 
+    def __transform(self, transform: AffineTransform) -> Self:
+        self.__transformer(self.__elements, transform)
         return self
@@ -24,6 +24,7 @@ class Image(AbstractElement):
     def __init__(self, defaults: Defaults, listener: AbstractImageListener, loader: AbstractImageLoader):
         super().__init__("image", defaults)
         self._file_id = str(uuid.uuid4())
+        self.__shared_file = False  # The file of an asset is shared with the other images showing it
         self._scale = [1, 1]
         self._status = "pending"
         self._background_color = "transparent"
@@ -35,6 +36,10 @@ class Image(AbstractElement):
     def file(self, path: str) -> Self:
         """Load image data from a file and set it.
 
+        Only the file header is read here to get the image size. The content is read and encoded
+        when the scene is serialized, so the file must still exist at that time. If it does not,
+        saving fails and a previously saved file is kept unchanged.
+
         Args:
             path (str): The path to the image file.
 
@@ -61,16 +66,41 @@ class Image(AbstractElement):
     def url(self, url: str) -> Self:
         """Load image data from a URL and set it.
 
+        URLs downloaded ahead by `SceneBuilder.prefetch_images()` are served without a network request.
+
         Args:
             url (str): The URL to the image.
 
         Returns:
             Self: The current instance of the Image class.
+
+        Raises:
+            ValueError: If the image cannot be downloaded or its format is not supported.
         """
         image_data = self.__loader.load_from_url(url)
         self._apply_image_data(image_data)
         return self
 
+    def asset(self, name: str) -> Self:
+        """Load image data by name from the asset bundles registered by `SceneBuilder.assets()`.
+
+        Args:
+            name (str): The path of the image in the archive, e.g. `icons/robot.svg`.
+                The file extension can be left out if the name stays unambiguous.
+                All images showing the same asset share one file, it is written to the diagram once.
+
+        Returns:
+            Self: The current instance of the Image class.
+
+        Raises:
+            ValueError: If no bundle contains the asset or its format is not supported.
+        """
+        self._file_id, image_data = self.__loader.load_from_asset(name)
+        self.__shared_file = True
+        self._size(image_data.width, image_data.height)
+        self.__listener._on_image(self._file_id, image_data)
+        return self
+
     def fit(self, max_width: float, max_height: float) -> Self:
         """Scale the image to fit within a bounding box while maintaining aspect ratio.
 
@@ -95,12 +125,21 @@ class Image(AbstractElement):
 
         return self._size(new_width, new_height)
 
+    def _set_listener(self, listener: AbstractImageListener, loader: AbstractImageLoader) -> None:
+        """Load the images set later in another scene, the one the element was merged into."""
+        self.__listener = listener
+        self.__loader = loader
+
     def _apply_image_data(self, image_data: ImageData) -> None:
         """Apply image data to the Image element.
 
         Args:
             image_data (ImageData): The image data to apply.
         """
+        if self.__shared_file:
+            # Other images keep showing the asset
+            self._file_id = str(uuid.uuid4())
+            self.__shared_file = False
         self._size(image_data.width, image_data.height)
-        self.__listener._on_image(self._file_id, image_data.mime_type, image_data.data_url)
+        self.__listener._on_image(self._file_id, image_data)
 
@@ -1,7 +1,7 @@
 """
 Description: Line element.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 
@@ -26,8 +26,6 @@ class Line(AbstractLine, AbstractShape):
     """
     def __init__(self, defaults: Defaults):
         super().__init__("line", defaults)
-        self._background_color = getattr(defaults, "_background_color")
-        self._fill_style = getattr(defaults, "_fill_style")
 
     def background(self, color: str | Color) -> Self:
         """
@@ -64,7 +62,7 @@ class Line(AbstractLine, AbstractShape):
             self._points.append(self._points[0])
         return self
 
-    def arc(self, x: float, y: float, radius: float, start_angle: float, angle_span: float) -> Self:
+    def arc(self, x: float, y: float, radius: float, start_angle: float, angle_span: float, tolerance: float | None = None) -> Self:
         """
         Adds an arc to the line.
         Approximates an arc between two points, given by the center of the arc, radius, start angle and angle span.
@@ -74,16 +72,23 @@ class Line(AbstractLine, AbstractShape):
             y (float): The y-coordinate of the center of the arc.
             radius (float): The radius of the arc.
             start_angle (float): The starting angle of the arc, in radians.
-            angle_span (float): The angle span of the arc, in radians.
+            angle_span (float): The angle span of the arc, in radians. The shorter arc between the start
+                and the end point is drawn, so spans over a half turn are drawn as the complementary arc.
+            tolerance (float, optional): The maximal distance of the approximation from the arc, e.g. 0.5.
+                If given, the arc is sampled with the minimal number of points within the tolerance,
+                so large arcs get fewer points and small arcs more. Defaults to None, using a fixed point spacing.
 
         Returns:
             Self: The instance of the class for method chaining.
+
+        Raises:
+            ValueError: If the tolerance is not positive.
         """
         start_point = (radius * math.cos(start_angle) + x, radius * math.sin(start_angle) + y)
         end_point = (radius * math.cos(start_angle + angle_span) + x, radius * math.sin(start_angle + angle_span) + y)
         
         POINTS_PER_SEGMENT = 5 if self._roundness == None else ArcApproximation.DEFAULT_POINTS_PER_SEGMENT
-        self._points.extend(ArcApproximation.generate_points((x, y), radius, start_point, end_point, POINTS_PER_SEGMENT))
+        self._points.extend(ArcApproximation.generate_points((x, y), radius, start_point, end_point, POINTS_PER_SEGMENT, tolerance))
             
         return self
     
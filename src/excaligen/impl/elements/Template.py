@@ -0,0 +1,98 @@
+"""
+Description: Template of a composite made of several elements.
+The elements are built once and then stamped into the scene as translated copies.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from ..base.AbstractElement import AbstractElement
+from ..base.AbstractLabeledElement import AbstractLabeledElement
+from ..base.AbstractLine import AbstractLine
+from ..elements.Text import Text
+
+from typing import Any, Callable
+
+Override = str | Callable[[Any], Any]
+
+class Template:
+    """A reusable composite of elements, e.g. a labeled box with an icon and ports.
+
+    The template elements are built once with the usual API and then copied into the scene
+    by `SceneBuilder.stamp()`. Stamping does not rebuild the elements: the copies get fresh ids,
+    translated coordinates and references (labels, bindings, groups, frames) pointing to each other,
+    while sizes, text measurements and arrow points are reused as they are.
+
+    > [!WARNING]
+    > Do not instantiate this class directly. Use `SceneBuilder.template()` instead.
+    """
+    def __init__(self, parts: dict[str, AbstractElement], members: list[AbstractElement]):
+        self.__parts = parts
+        self.__members = members
+        self.__origin = self.__compute_origin(members)
+
+    def parts(self) -> list[str]:
+        """Get the names of the template parts.
+
+        Returns:
+            list[str]: The names the parts were given in `SceneBuilder.template()`.
+        """
+        return list(self.__parts)
+
+    def origin(self) -> tuple[float, float]:
+        """Get the top left corner of the template elements. It is placed to the `at` point when stamped.
+
+        Returns:
+            tuple[float, float]: The x and y coordinates of the origin.
+        """
+        return self.__origin
+
+    def _instantiate(self, x: float, y: float, overrides: dict[str, Override] | None = None) -> tuple[list[AbstractElement], dict[str, AbstractElement]]:
+        """Copy the template elements with the origin moved to (x, y).
+
+        Returns:
+            tuple[list[AbstractElement], dict[str, AbstractElement]]: All the copies in the template order,
+            and the copies of the named parts.
+        """
+        overrides = overrides or {}
+        unknown = set(overrides) - set(self.__parts)
+        if unknown:
+            raise ValueError(f"Unknown template parts: {', '.join(sorted(unknown))}.")
+
+        dx, dy = x - self.__origin[0], y - self.__origin[1]
+        clones = {member._id: member._clone(dx, dy) for member in self.__members}
+        group_ids: dict[str, str] = {}
+        for clone in clones.values():
+            clone._remap(clones, group_ids)
+
+        parts = {name: clones[part._id] for name, part in self.__parts.items()}
+        for name, override in overrides.items():
+            self.__apply(parts[name], override)
+
+        return list(clones.values()), parts
+
+    def __apply(self, part: AbstractElement, override: Override) -> None:
+        match override:
+            case str() if isinstance(part, Text):
+                part.content(override)
+            case str() if isinstance(part, AbstractLabeledElement) and part._get_label() is not None:
+                part._get_label().content(override) # type: ignore checked above
+                part._justify_label()
+            case str():
+                raise ValueError("A text override can be applied only to a text or a labeled element.")
+            case _ if callable(override):
+                override(part)
+            case _:
+                raise TypeError("Invalid template override. Use a text or a callable taking the element.")
+
+    @staticmethod
+    def __compute_origin(members: list[AbstractElement]) -> tuple[float, float]:
+        xs, ys = [], []
+        for member in members:
+            if isinstance(member, AbstractLine) and member._points:
+                min_x, min_y, _, _ = member._points.bounds() # type: ignore not empty
+                xs.append(member._x + min_x)
+                ys.append(member._y + min_y)
+            else:
+                xs.append(member._x)
+                ys.append(member._y)
+        return min(xs), min(ys)
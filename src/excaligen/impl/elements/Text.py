@@ -1,17 +1,20 @@
 """
 Description: Text element.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from ..base.AbstractElement import AbstractElement
 from ..colors.Color import Color
 from ...defaults.Defaults import Defaults
+from ...defaults.Style import Style
+from ..geometry.AffineTransform import AffineTransform
 from ..inputs.Font import Font
 from ..inputs.Fontsize import Fontsize
 from ..inputs.Align import Align
 from ..inputs.Baseline import Baseline
-from typing import Self, overload
+from typing import Self, overload, override
+import math
 
 _ANCHOR_OFFSETS_COEFFS = {
     "left" : {
@@ -44,18 +47,11 @@ class Text(AbstractElement):
     CHAR_WIDTH_FACTOR = 0.6  # Approximate width of a character relative to the font size
     LINE_HEIGHT_FACTOR = 1.25  # Approximate line height factor
 
+    _STYLE_ATTRIBUTES = ("_font_size", "_font_family", "_text_align", "_vertical_align", "_line_height", "_auto_resize", "_stroke_color")
+
     def __init__(self, defaults: Defaults, text: str | None = None):
         super().__init__("text", defaults)
         self._text: str = text if text is not None else ""
-        self._font_size = getattr(defaults, "_font_size")
-        self._font_family = getattr(defaults, "_font_family")
-        self._text_align = getattr(defaults, "_text_align")
-        self._vertical_align = getattr(defaults, "_vertical_align")
-        self._line_height = getattr(defaults, "_line_height")
-        self._auto_resize = getattr(defaults, "_auto_resize")
-        self._stroke_color = getattr(defaults, "_stroke_color")
-        self._width = getattr(defaults, "_width")
-        self._height = getattr(defaults, "_height")
         self._container_id: str | None = None
         self.__is_anchored: bool = False
         self.__calculate_dimensions()
@@ -96,6 +92,26 @@ class Text(AbstractElement):
         self.__check_anchor_and_do_action(action)
         return self
 
+    @override
+    def style(self, style: Style) -> Self:
+        """Apply a style created by `SceneBuilder.style()` and recalculate the text size for its font size.
+
+        Args:
+            style (Style): The style to apply.
+
+        Returns:
+            Self: The current instance of the Text class.
+
+        Raises:
+            TypeError: If the style is not a Style object.
+        """
+        def action():
+            super(Text, self).style(style)
+            self.__calculate_dimensions()
+
+        self.__check_anchor_and_do_action(action)
+        return self
+
     def font(self, family: str) -> Self:
         """Set the font family ('Excalifont', 'Comic Shaans', 'Lilita One', 'Nunito', 'Hand-drawn', 'Normal', 'Code').
 
@@ -254,6 +270,31 @@ class Text(AbstractElement):
         self.__do_anchor(x + cx * width, y + cy * height)
         return self
 
+    @override
+    def _transform(self, transform: AffineTransform, x: float, y: float) -> None:
+        # The text keeps its proportions, it is scaled by the font size
+        if transform.is_translation():
+            super()._transform(transform, x, y)
+            return
+        self._scale(transform.scale())
+        ux, uy = transform.apply_linear(math.cos(self._angle), math.sin(self._angle))
+        self._angle = math.atan2(uy, ux) % (2 * math.pi)
+        self._x = x - 0.5 * self._width
+        self._y = y - 0.5 * self._height
+        self._changed()
+
+    def _scale(self, factor: float) -> None:
+        self._font_size = self._font_size * factor
+        self._width *= factor
+        self._height *= factor
+
+    @override
+    def _remap(self, clones: dict[str, AbstractElement], group_ids: dict[str, str]) -> None:
+        super()._remap(clones, group_ids)
+        if self._container_id is not None:
+            container = clones.get(self._container_id)
+            self._container_id = container._id if container is not None else None
+
     def __calculate_dimensions(self):
         """Calculate the width and height based on the text content."""
         lines = self._text.split("\n")
@@ -267,6 +308,7 @@ class Text(AbstractElement):
         cx, cy = _ANCHOR_OFFSETS_COEFFS[self._text_align][self._vertical_align]
         self._x = x - cx * self._width
         self._y = y - cy * self._height
+        self._changed()
 
     def __get_anchor(self) -> tuple[float, float]:
         """Get the anchor point based on current position and alignment.
@@ -0,0 +1,182 @@
+"""
+Description: Partition of the elements of a scene into parts saved to separate files.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from ..base.AbstractElement import AbstractElement
+from ..elements.Arrow import Arrow
+from ..elements.Frame import Frame
+from ..elements.Text import Text
+
+import copy
+import math
+
+Part = tuple[str, list[AbstractElement]]
+
+class ScenePartition:
+    """Splits the elements of a scene into parts, keeping together what belongs together.
+
+    Labels stay with their containers, members of frames with the frames and members of groups with each other.
+    An arrow bound to elements in two parts is written to both of them, bound only to the element in the part,
+    see `crossing()`.
+    """
+    def __init__(self, elements: list[AbstractElement]):
+        self.__elements = elements
+        self.__positions = {id(element): i for i, element in enumerate(elements)}
+        self.__units = self.__find_units()
+
+    def by_tiles(self, width: float, height: float) -> list[Part]:
+        """Split by the tiles of a grid, each unit of elements goes to the tile of its center, the tiles row by row.
+
+        Raises:
+            ValueError: If the width or height of the tiles is not positive.
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("The size of the tiles must be positive.")
+        tiles: dict[tuple[int, int], list[list[AbstractElement]]] = {}
+        for unit in self.__units:
+            min_x, min_y, max_x, max_y = ScenePartition.bounds(unit)
+            key = (math.floor(0.5 * (min_y + max_y) / height), math.floor(0.5 * (min_x + max_x) / width))
+            tiles.setdefault(key, []).append(unit)
+        return [(f"Tile {row}, {column}", self.__merge(units)) for (row, column), units in sorted(tiles.items())]
+
+    def by_frames(self) -> list[Part]:
+        """Split by the top-level frames, the elements out of any frame go to the last part."""
+        parts: dict[str, tuple[str, list[list[AbstractElement]]]] = {}
+        rest: list[list[AbstractElement]] = []
+        for unit in self.__units:
+            frame = next((e for e in unit if isinstance(e, Frame) and e._get_frame() is None), None)
+            if frame is None:
+                rest.append(unit)
+            else:
+                parts.setdefault(frame._id, (frame._name or f"Frame {len(parts) + 1}", []))[1].append(unit)
+        result = [(name, self.__merge(units)) for name, units in parts.values()]
+        return result + [("Other elements", self.__merge(rest))] if rest else result
+
+    def by_budget(self, budget: int) -> list[Part]:
+        """Split in the order of the scene into parts of at most `budget` elements, unless a unit alone is larger.
+
+        Raises:
+            ValueError: If the budget is not positive.
+        """
+        if budget <= 0:
+            raise ValueError("The budget must be positive.")
+        parts: list[list[list[AbstractElement]]] = []
+        count = budget
+        for unit in self.__units:
+            if count + len(unit) > budget:
+                parts.append([])
+                count = 0
+            parts[-1].append(unit)
+            count += len(unit)
+        return [(f"Part {i + 1}", self.__merge(units)) for i, units in enumerate(parts)]
+
+    @staticmethod
+    def crossing(parts: list[Part]) -> list[tuple[list[AbstractElement], dict[str, int]]]:
+        """Copy the arrows bound to elements in other parts into those parts and drop the bindings out of each part.
+
+        The elements of the scene are not changed, the elements whose references are dropped are shallow copies.
+
+        Returns:
+            list[tuple[list[AbstractElement], dict[str, int]]]: The elements of each part in the order of the scene,
+                and the parts its arrows lead to, as the indexes of the parts by the arrow ids.
+        """
+        part_of = {element._id: i for i, (_, elements) in enumerate(parts) for element in elements}
+        result: list[tuple[list[AbstractElement], dict[str, int]]] = [(list(elements), {}) for _, elements in parts]
+
+        copied: set[int] = set()
+        for i, (_, elements) in enumerate(parts):
+            for element in elements:
+                if isinstance(element, Arrow) and (endpoints := element._endpoints()) is not None:
+                    # Both ends may be in the same other part, the arrow is copied there once
+                    for other in {part_of.get(end._id, i) for end in endpoints} - {i}:
+                        copied.add(other)
+                        label = element._get_label()
+                        result[other][0].extend([element] if label is None else [element, label])
+
+        for i, (elements, links) in enumerate(result):
+            ids = {element._id for element in elements}
+            if i in copied:
+                # Fractional indexes sort as strings, the copies take their places in the order of the scene
+                elements.sort(key=lambda element: element._index or "")
+            for position, element in enumerate(elements):
+                elements[position] = ScenePartition.__detach(element, ids, part_of, links)
+        return result
+
+    @staticmethod
+    def bounds(elements: list[AbstractElement]) -> tuple[float, float, float, float]:
+        return (
+            min(element._x for element in elements),
+            min(element._y for element in elements),
+            max(element._x + element._width for element in elements),
+            max(element._y + element._height for element in elements),
+        )
+
+    @staticmethod
+    def __detach(element: AbstractElement, ids: set[str], part_of: dict[str, int], links: dict[str, int]) -> AbstractElement:
+        """Get the element, or its copy without the references to elements out of the part."""
+        bound = element._bound_elements or []
+        frame_missing = element._frame_id is not None and element._frame_id not in ids
+        start = element._start_binding if isinstance(element, Arrow) else None
+        end = element._end_binding if isinstance(element, Arrow) else None
+        start_missing = start is not None and start["elementId"] not in ids
+        end_missing = end is not None and end["elementId"] not in ids
+        if not (frame_missing or start_missing or end_missing or any(b["id"] not in ids for b in bound)):
+            return element
+
+        detached = copy.copy(element)
+        detached._bound_elements = [b for b in bound if b["id"] in ids] or None
+        if frame_missing:
+            detached._frame_id = None
+        if start_missing or end_missing:
+            other = part_of.get((start if start_missing else end)["elementId"])  # type: ignore
+            if other is not None:
+                links[element._id] = other
+            if start_missing:
+                detached._start_binding = None  # type: ignore
+            if end_missing:
+                detached._end_binding = None  # type: ignore
+        return detached
+
+    def __find_units(self) -> list[list[AbstractElement]]:
+        """Find the sets of elements that go to the same part, in the order of the scene."""
+        parents = list(range(len(self.__elements)))
+        positions = {element._id: i for i, element in enumerate(self.__elements)}
+
+        def find(i: int) -> int:
+            while parents[i] != i:
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        def union(i: int, j: int) -> None:
+            i, j = find(i), find(j)
+            if i != j:
+                parents[max(i, j)] = min(i, j)
+
+        groups: dict[str, int] = {}
+        for i, element in enumerate(self.__elements):
+            for group_id in element._group_ids:
+                union(i, groups.setdefault(group_id, i))
+            frame = element._get_frame()
+            if frame is not None and getattr(frame, "_id", None) in positions:
+                union(i, positions[getattr(frame, "_id")])
+            if isinstance(element, Text) and element._container_id in positions:
+                union(i, positions[element._container_id])
+
+        for i, element in enumerate(self.__elements):
+            # A free arrow goes with its start element, a grouped or framed one stays where it is
+            if isinstance(element, Arrow) and (endpoints := element._endpoints()) is not None and endpoints[0]._id in positions:
+                if not element._group_ids and element._get_frame() is None:
+                    union(i, positions[endpoints[0]._id])
+
+        units: dict[int, list[AbstractElement]] = {}
+        for i, element in enumerate(self.__elements):
+            units.setdefault(find(i), []).append(element)
+        return list(units.values())
+
+    def __merge(self, units: list[list[AbstractElement]]) -> list[AbstractElement]:
+        elements = [element for unit in units for element in unit]
+        elements.sort(key=lambda element: self.__positions[id(element)])
+        return elements
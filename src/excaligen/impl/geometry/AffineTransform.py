@@ -0,0 +1,100 @@
+"""
+Description: Affine transform of the plane, applied to many points at once.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from .Point import Point
+from .NumPySupport import NumPySupport
+from array import array
+from typing import Any, Sequence
+import math
+
+class AffineTransform:
+    """The transform x' = a·x + c·y + e, y' = b·x + d·y + f, with the coefficients in the order of SVG and canvas matrices.
+
+    Points are transformed in batches of interleaved x, y coordinates, with NumPy for large batches if it is installed.
+    """
+    # Batches of fewer coordinates are transformed in pure Python, see NumPySupport
+    NUMPY_THRESHOLD = 4096
+
+    def __init__(self, a: float = 1.0, b: float = 0.0, c: float = 0.0, d: float = 1.0, e: float = 0.0, f: float = 0.0):
+        self.a, self.b, self.c, self.d, self.e, self.f = a, b, c, d, e, f
+
+    @staticmethod
+    def from_matrix(matrix: Sequence[Any]) -> "AffineTransform":
+        """Create the transform from six coefficients (a, b, c, d, e, f), or from the rows of a 2x3 or 3x3 matrix.
+
+        Raises:
+            ValueError: If the matrix has another shape, is not affine or is singular.
+        """
+        values = list(matrix)
+        if len(values) in (2, 3) and all(isinstance(row, Sequence) and len(row) == 3 for row in values):
+            if len(values) == 3 and list(values[2]) != [0, 0, 1]:
+                raise ValueError("The last row of a 3x3 matrix must be (0, 0, 1).")
+            (a, c, e), (b, d, f) = values[0], values[1]
+        elif len(values) == 6 and all(isinstance(value, (int, float)) for value in values):
+            a, b, c, d, e, f = values
+        else:
+            raise ValueError("The matrix must be six coefficients (a, b, c, d, e, f), or a 2x3 or 3x3 matrix.")
+        transform = AffineTransform(a, b, c, d, e, f)
+        if transform.determinant() == 0:
+            raise ValueError("The matrix must not be singular.")
+        return transform
+
+    @staticmethod
+    def translation(dx: float, dy: float) -> "AffineTransform":
+        return AffineTransform(e=dx, f=dy)
+
+    @staticmethod
+    def scaling(sx: float, sy: float, origin: Point = (0.0, 0.0)) -> "AffineTransform":
+        ox, oy = origin
+        return AffineTransform(sx, 0.0, 0.0, sy, ox - sx * ox, oy - sy * oy)
+
+    @staticmethod
+    def rotation(angle: float, origin: Point = (0.0, 0.0)) -> "AffineTransform":
+        """The rotation clockwise on the screen, i.e. with the y axis pointing down, as the angles of Excalidraw elements."""
+        ox, oy = origin
+        cos, sin = math.cos(angle), math.sin(angle)
+        return AffineTransform(cos, sin, -sin, cos, ox - cos * ox + sin * oy, oy - sin * ox - cos * oy)
+
+    def determinant(self) -> float:
+        return self.a * self.d - self.b * self.c
+
+    def is_translation(self) -> bool:
+        return (self.a, self.b, self.c, self.d) == (1, 0, 0, 1)
+
+    def scale(self) -> float:
+        """Get the factor areas are scaled by, as a length: the square root of the determinant."""
+        return math.sqrt(abs(self.determinant()))
+
+    def apply(self, x: float, y: float) -> Point:
+        return (self.a * x + self.c * y + self.e, self.b * x + self.d * y + self.f)
+
+    def apply_linear(self, x: float, y: float) -> Point:
+        """Transform a vector, i.e. without the translation."""
+        return (self.a * x + self.c * y, self.b * x + self.d * y)
+
+    def apply_many(self, coordinates: array, linear: bool = False) -> Any:
+        """Transform many points at once.
+
+        Args:
+            coordinates (array): The interleaved x, y coordinates of the points.
+            linear (bool): Whether to transform vectors, i.e. without the translation. Defaults to False.
+
+        Returns:
+            Any: The transformed coordinates, an `array('d')` or a NumPy array, both supporting the buffer protocol and slicing.
+        """
+        e, f = (0.0, 0.0) if linear else (self.e, self.f)
+        numpy = NumPySupport.for_batch(len(coordinates), AffineTransform.NUMPY_THRESHOLD)
+        if numpy is not None:
+            points = numpy.frombuffer(coordinates, dtype=float).reshape(-1, 2)
+            matrix = numpy.array([[self.a, self.b], [self.c, self.d]])
+            return (points @ matrix + (e, f)).ravel()
+
+        a, b, c, d = self.a, self.b, self.c, self.d
+        xs, ys = coordinates[0::2], coordinates[1::2]
+        result = array('d', bytes(coordinates.itemsize * len(coordinates)))
+        result[0::2] = array('d', [a * x + c * y + e for x, y in zip(xs, ys)])
+        result[1::2] = array('d', [b * x + d * y + f for x, y in zip(xs, ys)])
+        return result
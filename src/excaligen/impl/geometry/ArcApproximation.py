@@ -13,13 +13,19 @@ class ArcApproximation:
     """Generates a list of points approximating an arc between two points.
 
     The arc is part of a circle with a given radius, passes through the two points.
+    The number of points is either derived from the arc length (`points_per_segment`),
+    or, when a `tolerance` is given, it is the minimal number of points keeping the polyline
+    within the tolerance from the circle.
     """
 
     DEFAULT_POINTS_PER_SEGMENT = 37
 
     @staticmethod
-    def generate_points(circle_center: Point, radius: float, start_point: Point, end_point: Point, points_per_segment: int = DEFAULT_POINTS_PER_SEGMENT) -> list[Point]:
-        """Generate points along the arc between start_point and end_point."""
+    def generate_points(circle_center: Point, radius: float, start_point: Point, end_point: Point, points_per_segment: int = DEFAULT_POINTS_PER_SEGMENT, tolerance: float | None = None) -> list[Point]:
+        """Generate points along the arc between start_point and end_point.
+
+        If `tolerance` is given, it takes precedence over `points_per_segment`.
+        """
         cx, cy = circle_center
         angle_start = math.atan2(start_point[1] - cy, start_point[0] - cx)
         angle_end = math.atan2(end_point[1] - cy, end_point[0] - cx)
@@ -33,6 +39,9 @@ class ArcApproximation:
         if angle_span > math.pi:
             angle_span -= 2 * math.pi
 
+        if tolerance is not None:
+            return ArcApproximation.sample(circle_center, radius, angle_start, angle_span, tolerance)
+
         len = abs(angle_span) * radius
         num_points = max(int(len / points_per_segment) + 1, 2)
 
@@ -44,4 +53,40 @@ class ArcApproximation:
             arc_points.append((x, y))
 
         return arc_points
-    
+
+    @staticmethod
+    def segment_count(radius: float, angle_span: float, tolerance: float) -> int:
+        """Get the minimal number of chords approximating the arc within the tolerance.
+
+        A chord spanning the angle θ deviates from the circle by the sagitta r * (1 - cos(θ / 2)),
+        so the largest angle within the tolerance is 2 * acos(1 - tolerance / r).
+        """
+        if tolerance <= 0:
+            raise ValueError("The tolerance must be a positive number.")
+        if radius <= tolerance:
+            return max(math.ceil(abs(angle_span) / math.pi), 1)
+        max_angle = 2 * math.acos(1 - tolerance / radius)
+        return max(math.ceil(abs(angle_span) / max_angle), 1)
+
+    @staticmethod
+    def sample(circle_center: Point, radius: float, start_angle: float, angle_span: float, tolerance: float) -> list[Point]:
+        """Sample the arc given by its start angle and angle span with the minimal number of points
+        keeping the deviation from the circle within the tolerance.
+
+        The points are generated by rotating the radius vector with a precomputed rotation,
+        the last point is computed directly so the rounding errors do not accumulate to the end point.
+        """
+        cx, cy = circle_center
+        segments = ArcApproximation.segment_count(radius, angle_span, tolerance)
+        step = angle_span / segments
+        cos_step, sin_step = math.cos(step), math.sin(step)
+
+        rx, ry = radius * math.cos(start_angle), radius * math.sin(start_angle)
+        arc_points = [(cx + rx, cy + ry)]
+        for _ in range(segments - 1):
+            rx, ry = rx * cos_step - ry * sin_step, rx * sin_step + ry * cos_step
+            arc_points.append((cx + rx, cy + ry))
+
+        end_angle = start_angle + angle_span
+        arc_points.append((cx + radius * math.cos(end_angle), cy + radius * math.sin(end_angle)))
+        return arc_points
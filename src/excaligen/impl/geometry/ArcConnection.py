@@ -5,7 +5,6 @@ Description: Connection between two elements using an arc.
 # Licensed under the MIT License - see LICENSE file for details
 
 from ..base.AbstractElement import AbstractElement
-from .CircleIntersection import CircleIntersection
 from .ArcApproximation import ArcApproximation
 from .Point import Point
 
@@ -14,10 +13,11 @@ from typing import Optional
 import math
 
 class ArcConnection:
-    def __init__(self, start_element: AbstractElement, end_element: AbstractElement, radius: float):
+    def __init__(self, start_element: AbstractElement, end_element: AbstractElement, radius: float, tolerance: float | None = None):
         self._start_element = start_element
         self._end_element = end_element
         self._radius = radius
+        self._tolerance = tolerance
 
     def points(self) -> list[Point]:
         center_start = self._start_element.center()
@@ -46,7 +46,7 @@ class ArcConnection:
 
         start_edge_point, end_edge_point = self.__find_intersection_points(circle_center, angle_start_element, angle_end_element)
 
-        return ArcApproximation.generate_points(circle_center, self._radius, start_edge_point, end_edge_point)
+        return ArcApproximation.generate_points(circle_center, self._radius, start_edge_point, end_edge_point, tolerance=self._tolerance)
 
     def __find_intersection_points(self, circle_center: Point, angle_start_element: float, angle_end_element: float) -> tuple[Point, Point]:
         start_point = self.__find_intersection_with_element(self._start_element, circle_center, angle_start_element, angle_end_element)
@@ -63,37 +63,14 @@ class ArcConnection:
         """Find the precise intersection point between a circle and the element's edge."""
 
         element_center = element.center()
-
-        # Shift coordinates to element's local coordinate system
-        cx, cy = circle_center
-        angle = element._angle
-
-        # Translate circle center relative to element center
-        dx = cx - element_center[0]
-        dy = cy - element_center[1]
-
-        a, b = element._width / 2, element._height / 2
-
-        match element._type:
-            case 'ellipse':
-                intersection_points = CircleIntersection.with_ellipse(dx, dy, self._radius, a, b, angle)
-            case 'rectangle' | 'image' | 'text':
-                intersection_points = CircleIntersection.with_rectangle(dx, dy, self._radius, a, b, angle)
-            case 'diamond':
-                intersection_points = CircleIntersection.with_diamond(dx, dy, self._radius, a, b, angle)
-            case _:
-                return None  # Unsupported element type
+        intersection_points = element._outline().intersect_circle(circle_center[0], circle_center[1], self._radius)
 
         if not intersection_points:
             return None
 
         # Prepare to select the correct intersection point
         valid_points = []
-        for ix, iy in intersection_points:
-            # Translate back to global coordinates
-            ix_global = ix + element_center[0]
-            iy_global = iy + element_center[1]
-
+        for ix_global, iy_global in intersection_points:
             # Calculate angle from circle center to intersection point
             angle_point = math.atan2(iy_global - circle_center[1], ix_global - circle_center[0]) % (2 * math.pi)
 
@@ -1,7 +1,7 @@
 """
 Description: Provides methods to compute precise intersections between a circle and various shapes.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from .Vector2D import Vector2D
@@ -11,86 +11,146 @@ import math
 class CircleIntersection:
     """Provides methods to compute precise intersections between a circle and various shapes."""
 
+    # Relative size of a polynomial coefficient or value treated as zero
+    EPSILON = 1e-14
+
     @staticmethod
-    def with_ellipse(dx, dy, R, a, b, angle, tolerance=1e-5) -> list[Point]:
+    def with_ellipse(dx, dy, R, a, b, angle) -> list[Point]:
         """Find precise intersections between a circle and an ellipse centered at origin.
 
         Solves the equation:
             f(theta) = (a * cos(theta) - dx)^2 + (b * sin(theta) - dy)^2 - R^2 = 0
 
+        With the substitution t = tan(theta / 2), f(theta) * (1 + t^2)^2 is a quartic polynomial in t.
+        Its real roots are isolated between the roots of its derivatives, so no intersection is missed,
+        and each root is refined by safeguarded Newton iterations.
+
         Args:
             dx, dy (float): Coordinates of the circle center.
             R (float): Radius of the circle.
             a, b (float): Semi-major and semi-minor axes of the ellipse.
-            tolerance (float): Tolerance for root finding.
 
         Returns:
             list[Point]: Intersection points in local coordinates.
         """
         dxr, dyr = Vector2D.rotate(dx, dy, -angle)
+        k = dxr**2 + dyr**2 - R**2
+
+        quartic = [
+            a**2 + 2 * a * dxr + k,
+            -4 * b * dyr,
+            -2 * a**2 + 4 * b**2 + 2 * k,
+            -4 * b * dyr,
+            a**2 - 2 * a * dxr + k,
+        ]
+        # A root at theta = pi is at infinity in t, it lowers the degree of the polynomial instead
+        roots = [2 * math.atan(t) for t in CircleIntersection.polynomial_roots(quartic)]
+        if abs(quartic[0]) <= CircleIntersection.EPSILON * max(map(abs, quartic)):
+            roots.append(math.pi)
 
-        def f(theta):
-            return (a * math.cos(theta) - dxr)**2 + (b * math.sin(theta) - dyr)**2 - R**2
+        thetas: list[float] = []
+        for theta in sorted(CircleIntersection.__refine(theta, dxr, dyr, R, a, b) % (2 * math.pi) for theta in roots):
+            if not thetas or theta - thetas[-1] > 1e-9:
+                thetas.append(theta)
 
-        # Initialize list of possible roots
-        roots = []
+        return [Vector2D.rotate(a * math.cos(theta), b * math.sin(theta), angle) for theta in thetas]
 
-        # Number of intervals to divide [0, 2*pi]
-        num_intervals = 360  # Adjust for accuracy
-
-        # Generate theta values
-        theta_values = [i * 2 * math.pi / num_intervals for i in range(num_intervals + 1)]
-
-        # Find intervals where f(theta) changes sign
-        for i in range(num_intervals):
-            theta1 = theta_values[i]
-            theta2 = theta_values[i + 1]
-            f1 = f(theta1)
-            f2 = f(theta2)
-
-            # Check for sign change
-            if f1 * f2 <= 0:
-                # Possible root in this interval
-                root = CircleIntersection.bisect(f, theta1, theta2, tolerance)
-                if root is not None:
-                    # Check for duplicates
-                    if all(abs(root - existing_root) > tolerance for existing_root in roots):
-                        roots.append(root)
-
-        # Compute intersection points
-        points = []
-        for theta in roots:
-            x = a * math.cos(theta)
-            y = b * math.sin(theta)
-            points.append((x, y))
+    @staticmethod
+    def polynomial_roots(coefficients: list[float]) -> list[float]:
+        """Find the real roots of a polynomial.
 
-        return [Vector2D.rotate(x, y, angle) for (x, y) in points]
+        The roots are isolated recursively: between two consecutive roots of the derivative the polynomial is monotonic,
+        so it has at most one root there, found by safeguarded Newton iterations. A root of the derivative where
+        the polynomial vanishes is a multiple root.
 
+        Args:
+            coefficients (list[float]): The coefficients, the highest degree first.
 
-    @staticmethod
-    def bisect(f, a, b, tol):
-        """Bisection method to find root of function f in interval [a, b]."""
-        fa = f(a)
-        fb = f(b)
+        Returns:
+            list[float]: The real roots in ascending order.
+        """
+        scale = max(map(abs, coefficients), default=0.0)
+        if scale == 0:
+            return []
+        while abs(coefficients[0]) <= CircleIntersection.EPSILON * scale:
+            coefficients = coefficients[1:]
+
+        degree = len(coefficients) - 1
+        if degree == 0:
+            return []
+        if degree == 1:
+            return [-coefficients[1] / coefficients[0]]
+        if degree == 2:
+            return CircleIntersection.__quadratic_roots(*coefficients)
 
-        if fa * fb > 0:
-            return None  # No root in this interval
+        def p(x: float) -> float:
+            value = 0.0
+            for c in coefficients:
+                value = value * x + c
+            return value
 
-        for _ in range(100):  # Maximum iterations
-            c = (a + b) / 2
-            fc = f(c)
+        derivative = [c * (degree - i) for i, c in enumerate(coefficients[:-1])]
+        bound = 1 + max(abs(c / coefficients[0]) for c in coefficients[1:])
+        critical = [x for x in CircleIntersection.polynomial_roots(derivative) if -bound < x < bound]
 
-            if abs(fc) < tol:
-                return c
+        roots = []
+        breaks = [-bound] + critical + [bound]
+        for lo, hi in zip(breaks, breaks[1:]):
+            p_lo, p_hi = p(lo), p(hi)
+            if abs(p_lo) <= CircleIntersection.EPSILON * scale * (1 + abs(lo)) ** degree and lo != -bound:
+                roots.append(lo)  # Multiple root at a critical point
+            elif p_lo * p_hi < 0:
+                roots.append(CircleIntersection.__newton(p, derivative, lo, hi, p_lo))
+        return roots
 
-            if fa * fc < 0:
-                b = c
-                fb = fc
+    @staticmethod
+    def __quadratic_roots(a: float, b: float, c: float) -> list[float]:
+        discriminant = b * b - 4 * a * c
+        if discriminant < 0:
+            return []
+        # Numerically stable form, avoiding the cancellation of -b and the square root
+        q = -0.5 * (b + math.copysign(math.sqrt(discriminant), b))
+        roots = {q / a, c / q} if q != 0 else {0.0}
+        return sorted(roots)
+
+    @staticmethod
+    def __newton(p, derivative: list[float], lo: float, hi: float, p_lo: float) -> float:
+        """Find the single root of the monotonic polynomial p in (lo, hi), falling back to bisection when Newton leaves the bracket."""
+        def dp(x: float) -> float:
+            value = 0.0
+            for c in derivative:
+                value = value * x + c
+            return value
+
+        x = (lo + hi) / 2
+        for _ in range(100):
+            value = p(x)
+            if value == 0:
+                return x
+            if (value < 0) == (p_lo < 0):
+                lo = x
             else:
-                a = c
-                fa = fc
+                hi = x
 
-        return (a + b) / 2  # Return the midpoint if no exact root found
+            slope = dp(x)
+            step = x - value / slope if slope != 0 else lo
+            x_next = step if lo < step < hi else (lo + hi) / 2
+            if abs(x_next - x) <= 1e-15 * (1 + abs(x)):
+                return x_next
+            x = x_next
+        return x
+
+    @staticmethod
+    def __refine(theta: float, dx: float, dy: float, R: float, a: float, b: float) -> float:
+        """Polish a root with Newton iterations on f(theta), which is well conditioned also near theta = pi."""
+        for _ in range(3):
+            c, s = math.cos(theta), math.sin(theta)
+            f = (a * c - dx)**2 + (b * s - dy)**2 - R**2
+            df = -2 * a * s * (a * c - dx) + 2 * b * c * (b * s - dy)
+            if df == 0 or abs(f / df) > 1e-3:
+                break  # Near a tangency the polynomial root is more reliable
+            theta -= f / df
+        return theta
 
     @staticmethod
     def with_rectangle(dx, dy, R, a, b, angle) -> list[Point]:
@@ -1,11 +1,10 @@
 """
 Description: Connection between two elements with a curve.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from ..base.AbstractElement import AbstractElement
-from .HalfLineIntersection import HalfLineIntersection
 from .Point import Point
 from .CurveApproximation import CurveApproximation
 from .Directions import Directions
@@ -31,40 +30,20 @@ class CurveConnection:
         return CurveApproximation.generate_points(b0, b3, self._start_angle, self._end_angle) # type: ignore
     
     def __find_intersection_points(self, vsx: float, vsy: float, vex: float, vey: float) -> tuple[Point, Point]:
-        start_point = self.__find_intersection_with_element(self._start_element, 0.0, 0.0, vsx, vsy)
+        start_point = self.__find_intersection_with_element(self._start_element, vsx, vsy)
         if start_point is None:
             raise Exception("Cannot find intersection as start point")
 
-        end_point = self.__find_intersection_with_element(self._end_element, 0.0, 0.0, vex, vey)
+        end_point = self.__find_intersection_with_element(self._end_element, vex, vey)
         if end_point is None:
             raise Exception("Cannot find intersection as end point")
         
         return start_point, end_point
 
-    def __find_intersection_with_element(self, element: AbstractElement, dx: float, dy: float, vx: float, vy: float) -> Optional[Point]:
-        """Find the precise intersection point between a half-line and the element's edge."""
+    def __find_intersection_with_element(self, element: AbstractElement, vx: float, vy: float) -> Optional[Point]:
+        """Find the precise intersection point between a half-line from the element's center and the element's edge."""
+        return element._outline().intersect_half_line(vx, vy)
 
-        a, b = element._width / 2, element._height / 2
-        intersection: Point = (0.0, 0.0)
-
-        match element._type:
-            case "rectangle" | "image" | "text":
-                intersection = HalfLineIntersection.with_rectangle(dx, dy, vx, vy, a, b, element._angle) # type: ignore
-            
-            case "diamond":
-                intersection = HalfLineIntersection.with_diamond(dx, dy, vx, vy, a, b, element._angle) # type: ignore
-            
-            case "ellipse":
-                intersection = HalfLineIntersection.with_ellipse(dx, dy, vx, vy, a, b, element._angle) # type: ignore
-
-            case _:
-                raise TypeError(f"Cannot find intersection with unknown type {element._type}")
-
-        if intersection is None:
-            return None
-            
-        return tuple(p + t for p, t in zip(intersection, element.center()))
-    
     def __convert_angle_arg(self, angle: float | str) -> float:
         match angle:
             case float():
@@ -1,7 +1,7 @@
 """
 Description: Elbow connection between two elements.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from ..base.AbstractElement import AbstractElement
@@ -11,7 +11,6 @@ from .Directions import Directions
 from .Point import Point
 from typing import Optional, Callable
 
-import copy
 
 MIN_SEGMENT_HINT: float = 30.0
 MAX_ELBOWS = 8
@@ -37,6 +36,12 @@ class ElbowConnection:
                 
             return False
 
+        def copy(self) -> 'ElbowConnection.Trajectory':
+            trajectory = ElbowConnection.Trajectory()
+            trajectory._points = list(self._points)
+            trajectory._distance = self._distance
+            return trajectory
+
         def get_elbows_count(self) -> int:
             return len(self._points)
 
@@ -173,6 +178,11 @@ class ElbowConnection:
         self._cross_segment(p1, p2, self._cross_horizontal, self._vertical_segments)
 
     def _cross_segment(self, p1: Point, p2: Point, cross_function: Callable, cross_segments: list[Segment]) -> None:
+        # A trajectory with more points than the best one found so far can never become better
+        best_count = self._best_trajectory.get_elbows_count()
+        if best_count and self._current_trajectory.get_elbows_count() >= best_count:
+            return
+
         if self._current_trajectory.get_elbows_count() < MAX_ELBOWS:
             self._try_complete_trajectory(p1, p2)
             for q1, q2 in cross_segments:
@@ -186,6 +196,6 @@ class ElbowConnection:
         if AaLineSegmentIntersection.is_point_on_segment(self._end_point, p1, p2):
             self._current_trajectory.add_point(self._end_point)
             if self._current_trajectory.is_better_than(self._best_trajectory):
-                self._best_trajectory = copy.deepcopy(self._current_trajectory)
+                self._best_trajectory = self._current_trajectory.copy()
             
             self._current_trajectory.pop_point()
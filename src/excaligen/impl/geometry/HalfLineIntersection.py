@@ -1,18 +1,24 @@
 """
 Description: Provides methods to compute precise intersections between a half-line and various shapes.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 import math
-from typing import Optional
+from typing import Optional, Sequence
 
 from .Vector2D import Vector2D
+from .NumPySupport import NumPySupport
 from .Point import Point
 
 class HalfLineIntersection:
     """Provides methods to compute precise intersections between a half-line and various shapes."""
 
+    SHAPES = ("rectangle", "diamond", "ellipse")
+
+    # Batches of fewer half-lines are clipped in pure Python, see NumPySupport
+    NUMPY_THRESHOLD = 64
+
     @staticmethod
     def with_ellipse(dx: float, dy: float, vx: float, vy: float, a: float, b: float, angle: float) -> Optional[Point]:
         """Find the intersection between a half-line and an ellipse centered at origin.
@@ -33,35 +39,17 @@ class HalfLineIntersection:
         # Substitute the parametric equations into the ellipse equation
         # Solve for t >= 0
 
+        dxr, dyr = Vector2D.rotate(dx, dy, -angle)
         vxr, vyr = Vector2D.rotate(vx, vy, -angle)
 
-        # Coefficients of the quadratic equation At^2 + Bt + C = 0
-        A = (vxr**2) / a**2 + (vyr**2) / b**2
-        B = 2 * (dx * vxr) / a**2 + 2 * (dy * vyr) / b**2
-        C = (dx**2) / a**2 + (dy**2) / b**2 - 1
-
-        discriminant = B**2 - 4 * A * C
-
-        if discriminant < 0 or A == 0:
-            return None  # No intersection
-
-        sqrt_discriminant = math.sqrt(discriminant)
-
-        t1 = (-B - sqrt_discriminant) / (2 * A)
-        t2 = (-B + sqrt_discriminant) / (2 * A)
-
-        # We need t >= 0
-        ts = [t for t in [t1, t2] if t >= 0]
-
-        if not ts:
+        # Coefficients of the quadratic equation At^2 + Bt + C = 0, the closest intersection with t >= 0 is chosen
+        t = HalfLineIntersection.__ellipse_parameter(dxr, dyr, vxr, vyr, a, b)
+        if t is None:
             return None  # No valid intersection
 
-        # Choose the smallest t (closest intersection)
-        t = min(ts)
-
         # Compute the intersection point
-        ix = dx + t * vxr
-        iy = dy + t * vyr
+        ix = dxr + t * vxr
+        iy = dyr + t * vyr
 
         return Vector2D.rotate(ix, iy, angle)
 
@@ -69,77 +57,192 @@ class HalfLineIntersection:
     def with_rectangle(dx: float, dy: float, vx: float, vy: float, a: float, b: float, angle: float) -> Optional[Point]:
         """Find the intersection between a half-line and a rectangle centered at origin.
 
+        Uses the slab method: the half-line is clipped by the pairs of parallel edges in closed form.
+
         Returns:
             Optional[Point]: The intersection point in local coordinates, or None if no intersection.
         """
-        # Edges of the rectangle
-        lines = [
-            ((-a, -b), (-a, b)),   # Left edge
-            ((-a, b), (a, b)),     # Top edge
-            ((a, b), (a, -b)),     # Right edge
-            ((a, -b), (-a, -b))    # Bottom edge
-        ]
+        dxr, dyr = Vector2D.rotate(dx, dy, -angle)
+        vxr, vyr = Vector2D.rotate(vx, vy, -angle)
+        t = HalfLineIntersection.__slab(dxr, dyr, vxr, vyr, a, b)
+        if t is None:
+            return None
+        return Vector2D.rotate(dxr + t * vxr, dyr + t * vyr, angle)
 
-        intersections = []
+    @staticmethod
+    def with_diamond(dx: float, dy: float, vx: float, vy: float, a: float, b: float, angle: float) -> Optional[Point]:
+        """Find the intersection between a half-line and a diamond centered at origin.
 
+        Returns:
+            Optional[Point]: The intersection point in local coordinates, or None if no intersection.
+        """
+        dxr, dyr = Vector2D.rotate(dx, dy, -angle)
         vxr, vyr = Vector2D.rotate(vx, vy, -angle)
+        t = HalfLineIntersection.__clip(dxr, dyr, vxr, vyr, HalfLineIntersection.__diamond_edges(a, b))
+        if t is None:
+            return None
+        return Vector2D.rotate(dxr + t * vxr, dyr + t * vyr, angle)
 
-        for (x1, y1), (x2, y2) in lines:
-            intersection = HalfLineIntersection.half_line_line_intersection(dx, dy, vxr, vyr, x1, y1, x2, y2)
-            if intersection:
-                intersections.append(intersection)
+    @staticmethod
+    def with_shape_batch(shape: str, dx: float, dy: float, directions: Sequence[Point], a: float, b: float, angle: float) -> list[Optional[Point]]:
+        """Find the intersections of many half-lines starting at the same point with one shape.
 
-        if not intersections:
-            return None
+        The rotation of the shape is computed once for all the half-lines. If the optional NumPy package is installed
+        and there are many half-lines, the intersections are computed in a single vectorized pass.
+
+        Args:
+            shape (str): The shape type, 'rectangle', 'diamond' or 'ellipse'.
+            dx (float): The x coordinate of the start of the half-lines, relative to the shape center.
+            dy (float): The y coordinate of the start of the half-lines, relative to the shape center.
+            directions (Sequence[Point]): The directions of the half-lines.
+            a (float): The half width of the shape.
+            b (float): The half height of the shape.
+            angle (float): The rotation of the shape in radians.
 
-        # Choose the intersection closest to (dx, dy)
-        min_dist = float('inf')
-        closest_point = (0.0, 0.0)
-        for x, y in intersections:
-            dist = math.hypot(x - dx, y - dy)
-            if dist < min_dist:
-                min_dist = dist
-                closest_point = (x, y)
+        Returns:
+            list[Optional[Point]]: The intersection points in local coordinates, None for half-lines missing the shape.
 
-        return Vector2D.rotate(closest_point[0], closest_point[1], angle)
+        Raises:
+            ValueError: If the shape type is not supported.
+        """
+        if shape not in HalfLineIntersection.SHAPES:
+            raise ValueError(f"Unsupported shape '{shape}'. Use one of {', '.join(HalfLineIntersection.SHAPES)}.")
+
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        dxr, dyr = dx * cos_a + dy * sin_a, -dx * sin_a + dy * cos_a
+
+        numpy = NumPySupport.for_batch(len(directions), HalfLineIntersection.NUMPY_THRESHOLD)
+        if numpy is not None:
+            return HalfLineIntersection.__batch_numpy(numpy, shape, dxr, dyr, directions, a, b, cos_a, sin_a)
+
+        intersections: list[Optional[Point]] = []
+        match shape:
+            case "rectangle":
+                parameter = lambda vxr, vyr: HalfLineIntersection.__slab(dxr, dyr, vxr, vyr, a, b)
+            case "diamond":
+                edges = HalfLineIntersection.__diamond_edges(a, b)
+                parameter = lambda vxr, vyr: HalfLineIntersection.__clip(dxr, dyr, vxr, vyr, edges)
+            case _:
+                parameter = lambda vxr, vyr: HalfLineIntersection.__ellipse_parameter(dxr, dyr, vxr, vyr, a, b)
+
+        for vx, vy in directions:
+            vxr, vyr = vx * cos_a + vy * sin_a, -vx * sin_a + vy * cos_a
+            t = parameter(vxr, vyr)
+            if t is None:
+                intersections.append(None)
+            else:
+                ix, iy = dxr + t * vxr, dyr + t * vyr
+                intersections.append((ix * cos_a - iy * sin_a, ix * sin_a + iy * cos_a))
+        return intersections
 
     @staticmethod
-    def with_diamond(dx: float, dy: float, vx: float, vy: float, a: float, b: float, angle: float) -> Optional[Point]:
-        """Find the intersection between a half-line and a diamond centered at origin.
+    def __rectangle_edges(a: float, b: float) -> tuple[tuple[float, float, float], ...]:
+        # Each edge is given by the half-plane nx * x + ny * y <= c containing the shape
+        return ((1.0, 0.0, a), (-1.0, 0.0, a), (0.0, 1.0, b), (0.0, -1.0, b))
+
+    @staticmethod
+    def __diamond_edges(a: float, b: float) -> tuple[tuple[float, float, float], ...]:
+        return ((b, a, a * b), (b, -a, a * b), (-b, a, a * b), (-b, -a, a * b))
+
+    @staticmethod
+    def __slab(dx: float, dy: float, vx: float, vy: float, a: float, b: float) -> Optional[float]:
+        """Clip the half-line by the slabs |x| <= a and |y| <= b.
 
         Returns:
-            Optional[Point]: The intersection point in local coordinates, or None if no intersection.
+            Optional[float]: The parameter of the first intersection with the boundary, or None if there is none.
         """
-        # Edges of the diamond (rotated square)
-        lines = [
-            ((0, b), (a, 0)),      # Upper right edge
-            ((a, 0), (0, -b)),     # Lower right edge
-            ((0, -b), (-a, 0)),    # Lower left edge
-            ((-a, 0), (0, b))      # Upper left edge
-        ]
+        if vx != 0:
+            t1, t2 = (-a - dx) / vx, (a - dx) / vx
+            t_enter, t_exit = (t1, t2) if t1 < t2 else (t2, t1)
+        elif -a <= dx <= a:
+            t_enter, t_exit = -math.inf, math.inf
+        else:
+            return None
 
-        intersections = []
+        if vy != 0:
+            t1, t2 = (-b - dy) / vy, (b - dy) / vy
+            if t1 > t2:
+                t1, t2 = t2, t1
+            t_enter, t_exit = max(t_enter, t1), min(t_exit, t2)
+        elif not -b <= dy <= b:
+            return None
 
-        vxr, vyr = Vector2D.rotate(vx, vy, -angle)
+        if t_exit < max(t_enter, 0.0) or math.isinf(t_exit):
+            return None
+        return t_enter if t_enter >= 0 else t_exit
 
-        for (x1, y1), (x2, y2) in lines:
-            intersection = HalfLineIntersection.half_line_line_intersection(dx, dy, vxr, vyr, x1, y1, x2, y2)
-            if intersection:
-                intersections.append(intersection)
+    @staticmethod
+    def __clip(dx: float, dy: float, vx: float, vy: float, edges: tuple[tuple[float, float, float], ...]) -> Optional[float]:
+        """Clip the half-line by the half-planes of a convex shape (Cyrus-Beck).
 
-        if not intersections:
+        Returns:
+            Optional[float]: The parameter of the first intersection with the boundary, or None if there is none.
+        """
+        t_enter, t_exit = -math.inf, math.inf
+        for nx, ny, c in edges:
+            distance = c - (nx * dx + ny * dy)
+            speed = nx * vx + ny * vy
+            if speed == 0:
+                if distance < 0:
+                    return None  # Parallel to the edge and outside of it
+            elif speed > 0:
+                t_exit = min(t_exit, distance / speed)
+            else:
+                t_enter = max(t_enter, distance / speed)
+
+        if t_exit < max(t_enter, 0.0) or math.isinf(t_exit):
             return None
+        return t_enter if t_enter >= 0 else t_exit
 
-        # Choose the intersection closest to (dx, dy)
-        min_dist = float('inf')
-        closest_point = (0.0, 0.0)
-        for x, y in intersections:
-            dist = math.hypot(x - dx, y - dy)
-            if dist < min_dist:
-                min_dist = dist
-                closest_point = (x, y)
+    @staticmethod
+    def __ellipse_parameter(dx: float, dy: float, vx: float, vy: float, a: float, b: float) -> Optional[float]:
+        A = (vx**2) / a**2 + (vy**2) / b**2
+        B = 2 * (dx * vx) / a**2 + 2 * (dy * vy) / b**2
+        C = (dx**2) / a**2 + (dy**2) / b**2 - 1
 
-        return Vector2D.rotate(closest_point[0], closest_point[1], angle)
+        discriminant = B**2 - 4 * A * C
+        if discriminant < 0 or A == 0:
+            return None
+
+        sqrt_discriminant = math.sqrt(discriminant)
+        ts = [t for t in ((-B - sqrt_discriminant) / (2 * A), (-B + sqrt_discriminant) / (2 * A)) if t >= 0]
+        return min(ts) if ts else None
+
+    @staticmethod
+    def __batch_numpy(numpy, shape: str, dx: float, dy: float, directions: Sequence[Point], a: float, b: float, cos_a: float, sin_a: float) -> list[Optional[Point]]:
+        v = numpy.asarray(directions, dtype=float)
+        vx = v[:, 0] * cos_a + v[:, 1] * sin_a
+        vy = -v[:, 0] * sin_a + v[:, 1] * cos_a
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            if shape == "ellipse":
+                A = vx**2 / a**2 + vy**2 / b**2
+                B = 2 * dx * vx / a**2 + 2 * dy * vy / b**2
+                C = dx**2 / a**2 + dy**2 / b**2 - 1
+                discriminant = B**2 - 4 * A * C
+                root = numpy.sqrt(numpy.maximum(discriminant, 0))
+                t1, t2 = (-B - root) / (2 * A), (-B + root) / (2 * A)
+                t = numpy.where(t1 >= 0, t1, t2)
+                valid = (discriminant >= 0) & (A != 0) & (t >= 0)
+            else:
+                edges = HalfLineIntersection.__rectangle_edges(a, b) if shape == "rectangle" else HalfLineIntersection.__diamond_edges(a, b)
+                t_enter = numpy.full(len(v), -numpy.inf)
+                t_exit = numpy.full(len(v), numpy.inf)
+                valid = numpy.ones(len(v), dtype=bool)
+                for nx, ny, c in edges:
+                    distance = c - (nx * dx + ny * dy)
+                    speed = nx * vx + ny * vy
+                    ratio = distance / speed
+                    t_exit = numpy.where(speed > 0, numpy.minimum(t_exit, ratio), t_exit)
+                    t_enter = numpy.where(speed < 0, numpy.maximum(t_enter, ratio), t_enter)
+                    valid &= (speed != 0) | (distance >= 0)
+                valid &= (t_exit >= numpy.maximum(t_enter, 0)) & numpy.isfinite(t_exit)
+                t = numpy.where(t_enter >= 0, t_enter, t_exit)
+
+        ix, iy = dx + t * vx, dy + t * vy
+        xs = (ix * cos_a - iy * sin_a).tolist()
+        ys = (ix * sin_a + iy * cos_a).tolist()
+        return [(x, y) if ok else None for x, y, ok in zip(xs, ys, valid.tolist())]
 
     @staticmethod
     def half_line_line_intersection(px, py, vx, vy, x1, y1, x2, y2) -> Optional[Point]:
@@ -0,0 +1,29 @@
+"""
+Description: Optional NumPy support for computations on large batches of values.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from types import ModuleType
+import functools
+
+class NumPySupport:
+    """Gives the NumPy module to the batch computations, if it is installed and the batch is large enough.
+
+    Converting the values to NumPy arrays has a fixed cost, so below a threshold of the batch size
+    the pure Python loop is faster. Each computation sets its own threshold as the `NUMPY_THRESHOLD`
+    constant of its class.
+    """
+    @staticmethod
+    def for_batch(size: int, threshold: float) -> ModuleType | None:
+        """Get the NumPy module for a batch of the size, None for a small batch or if NumPy is not installed."""
+        return NumPySupport.__numpy() if size >= threshold else None
+
+    @staticmethod
+    @functools.cache
+    def __numpy() -> ModuleType | None:
+        try:
+            import numpy
+            return numpy
+        except ImportError:
+            return None
@@ -0,0 +1,91 @@
+"""
+Description: Outline of an element used to find where connections touch it.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from .HalfLineIntersection import HalfLineIntersection
+from .CircleIntersection import CircleIntersection
+from .Point import Point
+
+from typing import Optional, Sequence
+import math
+
+class Outline:
+    """The shape, center, half extents and rotation of an element in one place.
+
+    The rotation is computed once per outline, so intersecting the outline with many connections
+    does not repeat the trigonometry. Elements keep their outline until their geometry changes,
+    see `AbstractElement._outline()`.
+    """
+    SHAPES = {"rectangle": "rectangle", "image": "rectangle", "text": "rectangle", "diamond": "diamond", "ellipse": "ellipse"}
+
+    def __init__(self, element_type: str, x: float, y: float, width: float, height: float, angle: float):
+        if element_type not in Outline.SHAPES:
+            raise TypeError(f"Cannot find intersection with unknown type {element_type}")
+        self._shape = Outline.SHAPES[element_type]
+        self._center: Point = (x + 0.5 * width, y + 0.5 * height)
+        self._a = width / 2
+        self._b = height / 2
+        self._angle = angle
+        self._cos = math.cos(angle)
+        self._sin = math.sin(angle)
+
+    def to_local(self, x: float, y: float) -> Point:
+        """Rotate a vector from the scene to the frame of the element."""
+        if self._angle == 0:
+            return x, y
+        return x * self._cos + y * self._sin, -x * self._sin + y * self._cos
+
+    def to_scene(self, x: float, y: float) -> Point:
+        """Rotate a vector from the frame of the element to the scene."""
+        if self._angle == 0:
+            return x, y
+        return x * self._cos - y * self._sin, x * self._sin + y * self._cos
+
+    def intersect_half_line(self, vx: float, vy: float) -> Optional[Point]:
+        """Find where the half-line from the center in the direction (vx, vy) leaves the outline.
+
+        Returns:
+            Optional[Point]: The intersection in scene coordinates, or None if there is none.
+        """
+        vxl, vyl = self.to_local(vx, vy)
+        match self._shape:
+            case "rectangle":
+                intersection = HalfLineIntersection.with_rectangle(0.0, 0.0, vxl, vyl, self._a, self._b, 0)
+            case "diamond":
+                intersection = HalfLineIntersection.with_diamond(0.0, 0.0, vxl, vyl, self._a, self._b, 0)
+            case _:
+                intersection = HalfLineIntersection.with_ellipse(0.0, 0.0, vxl, vyl, self._a, self._b, 0)
+
+        return None if intersection is None else self.__to_scene_point(intersection)
+
+    def intersect_half_lines(self, directions: Sequence[Point]) -> list[Optional[Point]]:
+        """Find where the half-lines from the center leave the outline, all in one batch.
+
+        Returns:
+            list[Optional[Point]]: The intersections in scene coordinates, None for directions without an intersection.
+        """
+        intersections = HalfLineIntersection.with_shape_batch(self._shape, 0.0, 0.0, directions, self._a, self._b, self._angle)
+        return [None if point is None else (point[0] + self._center[0], point[1] + self._center[1]) for point in intersections]
+
+    def intersect_circle(self, cx: float, cy: float, radius: float) -> list[Point]:
+        """Find the intersections of the outline with a circle.
+
+        Returns:
+            list[Point]: The intersections in scene coordinates.
+        """
+        dx, dy = self.to_local(cx - self._center[0], cy - self._center[1])
+        match self._shape:
+            case "rectangle":
+                intersections = CircleIntersection.with_rectangle(dx, dy, radius, self._a, self._b, 0)
+            case "diamond":
+                intersections = CircleIntersection.with_diamond(dx, dy, radius, self._a, self._b, 0)
+            case _:
+                intersections = CircleIntersection.with_ellipse(dx, dy, radius, self._a, self._b, 0)
+
+        return [self.__to_scene_point(point) for point in intersections]
+
+    def __to_scene_point(self, point: Point) -> Point:
+        x, y = self.to_scene(*point)
+        return x + self._center[0], y + self._center[1]
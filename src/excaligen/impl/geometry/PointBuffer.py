@@ -0,0 +1,184 @@
+"""
+Description: Compact storage of the points of lines and arrows.
+The coordinates are stored as doubles in growable arrays, and the bounding box is updated incrementally.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from .Point import Point
+from array import array
+from itertools import chain
+from typing import Any, Iterable, Iterator, Sequence
+
+class PointBuffer:
+    """A growable sequence of points backed by arrays of doubles.
+
+    Points appended at the end go to one array, points prepended go to another one in reverse order,
+    so both operations are amortized O(1) per point. The bounds are updated with each added point,
+    so the size of a line is known without iterating over all of its points.
+    Indexing and iteration return (x, y) tuples, so the buffer can be used in place of a list of points.
+    Coordinates added as integers are returned as integers, so the serialized points stay as they were given.
+    """
+    __slots__ = ("__front", "__back", "__front_ints", "__back_ints", "__min_x", "__min_y", "__max_x", "__max_y")
+
+    def __init__(self, points: Iterable[Point] = ()):
+        self.__front = array('d')  # Prepended points, in reverse order
+        self.__back: array | memoryview = array('d')
+        # One byte per coordinate, set for the coordinates added as integers
+        self.__front_ints = bytearray()
+        self.__back_ints = bytearray()
+        self.__min_x: float = float('inf')
+        self.__min_y: float = float('inf')
+        self.__max_x: float = float('-inf')
+        self.__max_y: float = float('-inf')
+        self.extend(points)
+
+    @classmethod
+    def from_buffer(cls, buffer: Any) -> "PointBuffer":
+        """Wrap interleaved x, y doubles without copying them.
+
+        Args:
+            buffer (Any): An object supporting the buffer protocol with C-contiguous doubles, e.g. `array('d')`
+                or a NumPy array of shape (n, 2) and dtype float64. It must not be modified afterwards.
+                The data are copied only when more points are added.
+
+        Returns:
+            PointBuffer: The buffer viewing the data.
+
+        Raises:
+            ValueError: If the buffer does not contain an even number of doubles.
+        """
+        view = memoryview(buffer)
+        if view.format != 'd' or not view.c_contiguous:
+            raise ValueError("The buffer must contain C-contiguous doubles (float64).")
+        view = view.cast('B').cast('d')
+        if len(view) % 2:
+            raise ValueError("The buffer must contain an even number of values, x and y of each point.")
+
+        points = cls()
+        points.__back = view
+        points.__back_ints = bytearray(len(view))
+        points.__update_bounds(view)
+        return points
+
+    def append(self, point: Point) -> None:
+        x, y = point
+        self.__writable_back().extend((x, y))
+        self.__back_ints.extend((type(x) is int, type(y) is int))
+        self.__update_bounds((x, y))
+
+    def extend(self, points: Iterable[Point]) -> None:
+        values = list(chain.from_iterable(points))
+        self.__writable_back().extend(array('d', values))
+        self.__back_ints.extend(type(value) is int for value in values)
+        self.__update_bounds(values)
+
+    def prepend(self, points: Iterable[Point]) -> None:
+        values = list(chain.from_iterable(reversed(list(points))))
+        self.__front.extend(array('d', values))
+        self.__front_ints.extend(type(value) is int for value in values)
+        self.__update_bounds(values)
+
+    def bounds(self) -> tuple[float, float, float, float] | None:
+        """Get the bounding box of the points.
+
+        Returns:
+            tuple[float, float, float, float] | None: The min x, min y, max x and max y, None if there are no points.
+        """
+        if not self:
+            return None
+        return self.__min_x, self.__min_y, self.__max_x, self.__max_y
+
+    def coordinates(self) -> array:
+        """Get the interleaved x, y coordinates of all points in order."""
+        coordinates = array('d')
+        if self.__front:
+            # Reversing the values reverses the points, but also swaps x and y within each point
+            reversed_values = array('d', reversed(self.__front))
+            coordinates.frombytes(bytes(coordinates.itemsize * len(reversed_values)))
+            coordinates[0::2], coordinates[1::2] = reversed_values[1::2], reversed_values[0::2]
+        coordinates.frombytes(memoryview(self.__back).cast('B'))
+        return coordinates
+
+    def to_list(self) -> list[Point]:
+        ints = self.__ints()
+        if not ints.count(0):
+            values = map(int, self.coordinates())
+        elif not ints.count(1):
+            values = iter(self.coordinates())
+        else:
+            values = (int(value) if is_int else value for value, is_int in zip(self.coordinates(), ints))
+        return list(zip(values, values))
+
+    def __len__(self) -> int:
+        return (len(self.__front) + len(self.__back)) // 2
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return self.to_list()[index]
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Point index out of range.")
+
+        front = len(self.__front) // 2
+        if index < front:
+            values, ints, i = self.__front, self.__front_ints, 2 * (front - 1 - index)
+        else:
+            values, ints, i = self.__back, self.__back_ints, 2 * (index - front)
+        x, y = values[i], values[i + 1]
+        return int(x) if ints[i] else x, int(y) if ints[i + 1] else y
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self.to_list())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PointBuffer):
+            return self.coordinates() == other.coordinates()
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == [tuple(point) for point in other]
+        return NotImplemented
+
+    def __copy__(self) -> "PointBuffer":
+        copy = PointBuffer()
+        copy.__front = array('d', self.__front)
+        copy.__back = array('d', self.__back) if isinstance(self.__back, array) else self.__back  # A wrapped buffer is never written
+        copy.__front_ints, copy.__back_ints = bytearray(self.__front_ints), bytearray(self.__back_ints)
+        copy.__min_x, copy.__min_y, copy.__max_x, copy.__max_y = self.__min_x, self.__min_y, self.__max_x, self.__max_y
+        return copy
+
+    def __getstate__(self) -> tuple:
+        # A wrapped buffer, e.g. a memoryview, is pickled as the array of its values
+        back = self.__back if isinstance(self.__back, array) else array('d', self.__back)
+        return (self.__front, back, self.__front_ints, self.__back_ints, self.__min_x, self.__min_y, self.__max_x, self.__max_y)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.__front, self.__back, self.__front_ints, self.__back_ints, self.__min_x, self.__min_y, self.__max_x, self.__max_y = state
+
+    def __repr__(self) -> str:
+        return f"PointBuffer({self.to_list()!r})"
+
+    def __writable_back(self) -> array:
+        if isinstance(self.__back, memoryview):
+            back = array('d')
+            back.frombytes(self.__back.cast('B'))  # Copy on write of a wrapped buffer
+            self.__back = back
+        return self.__back
+
+    def __ints(self) -> bytearray:
+        """Get the integer flags of all coordinates in the order of `coordinates()`."""
+        ints = bytearray(len(self.__front_ints))
+        # The same reordering as of the prepended coordinates
+        reversed_ints = self.__front_ints[::-1]
+        ints[0::2], ints[1::2] = reversed_ints[1::2], reversed_ints[0::2]
+        return ints + self.__back_ints
+
+    def __update_bounds(self, coordinates: Sequence[float]) -> None:
+        # The values keep their types, integer bounds give integer sizes as with a list of points
+        if not coordinates:
+            return
+        xs, ys = coordinates[0::2], coordinates[1::2]
+        self.__min_x, self.__max_x = min(self.__min_x, min(xs)), max(self.__max_x, max(xs))
+        self.__min_y, self.__max_y = min(self.__min_y, min(ys)), max(self.__max_y, max(ys))
@@ -0,0 +1,164 @@
+"""
+Description: Simplification of polylines with many points.
+Implements the Ramer-Douglas-Peucker and Visvalingam-Whyatt algorithms without recursion.
+The distance computation of Ramer-Douglas-Peucker is vectorized if the optional NumPy package is installed.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from .Point import Point
+from .NumPySupport import NumPySupport
+import heapq
+import math
+
+class PolylineSimplification:
+    """Removes points that deviate less than a tolerance from the simplified polyline.
+
+    The first and the last point are always kept. A closed polyline (the last point equals the first one)
+    stays closed: it is split at the point farthest from its start and both halves are simplified separately.
+    """
+
+    DOUGLAS_PEUCKER = "douglas-peucker"
+    VISVALINGAM = "visvalingam"
+    METHODS = (DOUGLAS_PEUCKER, VISVALINGAM)
+
+    # Lines of fewer points are simplified in pure Python, see NumPySupport
+    NUMPY_THRESHOLD = 512
+
+    @staticmethod
+    def simplify(points: list[Point], tolerance: float, method: str = DOUGLAS_PEUCKER) -> list[Point]:
+        """Simplify the polyline.
+
+        Args:
+            points (list[Point]): The points of the polyline.
+            tolerance (float): For Ramer-Douglas-Peucker, the maximal distance of a removed point from the simplified polyline.
+                For Visvalingam-Whyatt, points are removed while the area of the triangle they form with their neighbours
+                is smaller than tolerance².
+            method (str): Either 'douglas-peucker' or 'visvalingam'. Defaults to 'douglas-peucker'.
+
+        Returns:
+            list[Point]: The kept points, in their original order.
+
+        Raises:
+            ValueError: If the tolerance is negative or the method is unknown.
+        """
+        if tolerance < 0:
+            raise ValueError("The tolerance must not be negative.")
+        match method:
+            case PolylineSimplification.DOUGLAS_PEUCKER:
+                simplify_open = PolylineSimplification.__douglas_peucker
+            case PolylineSimplification.VISVALINGAM:
+                simplify_open = PolylineSimplification.__visvalingam
+            case _:
+                raise ValueError(f"Invalid simplification method '{method}'. Use one of {', '.join(PolylineSimplification.METHODS)}.")
+
+        if len(points) < 3:
+            return list(points)
+
+        if points[0] != points[-1]:
+            return simplify_open(points, tolerance)
+
+        # Closed polyline: both halves between the start and the farthest point are open polylines
+        x0, y0 = points[0]
+        split = max(range(len(points)), key=lambda i: (points[i][0] - x0) ** 2 + (points[i][1] - y0) ** 2)
+        if split == 0:
+            return [points[0], points[-1]]
+        first = simplify_open(points[:split + 1], tolerance)
+        second = simplify_open(points[split:], tolerance)
+        return first + second[1:]
+
+    @staticmethod
+    def __douglas_peucker(points: list[Point], tolerance: float) -> list[Point]:
+        numpy = NumPySupport.for_batch(len(points), PolylineSimplification.NUMPY_THRESHOLD)
+        if numpy is not None:
+            coordinates = numpy.asarray(points, dtype=float)
+            farthest = lambda start, end: PolylineSimplification.__farthest_numpy(numpy, coordinates, start, end)
+        else:
+            farthest = lambda start, end: PolylineSimplification.__farthest(points, start, end)
+
+        keep = [False] * len(points)
+        keep[0] = keep[-1] = True
+        stack = [(0, len(points) - 1)]
+        while stack:
+            start, end = stack.pop()
+            if end - start < 2:
+                continue
+            index, distance = farthest(start, end)
+            if distance > tolerance:
+                keep[index] = True
+                stack.append((start, index))
+                stack.append((index, end))
+
+        return [point for point, kept in zip(points, keep) if kept]
+
+    @staticmethod
+    def __farthest(points: list[Point], start: int, end: int) -> tuple[int, float]:
+        """Find the point between start and end farthest from the segment connecting them."""
+        x1, y1 = points[start]
+        x2, y2 = points[end]
+        dx, dy = x2 - x1, y2 - y1
+        length_squared = dx * dx + dy * dy
+
+        max_index, max_distance_squared = start, -1.0
+        for i in range(start + 1, end):
+            px, py = points[i]
+            t = 0.0 if length_squared == 0 else max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length_squared))
+            ex, ey = px - x1 - t * dx, py - y1 - t * dy
+            distance_squared = ex * ex + ey * ey
+            if distance_squared > max_distance_squared:
+                max_index, max_distance_squared = i, distance_squared
+
+        return max_index, math.sqrt(max_distance_squared)
+
+    @staticmethod
+    def __farthest_numpy(numpy, coordinates, start: int, end: int) -> tuple[int, float]:
+        """Vectorized variant of `__farthest` over a NumPy array of the coordinates."""
+        p1, p2 = coordinates[start], coordinates[end]
+        d = p2 - p1
+        length_squared = float(d @ d)
+        relative = coordinates[start + 1:end] - p1
+        if length_squared == 0:
+            t = numpy.zeros(len(relative))
+        else:
+            t = numpy.clip(relative @ d / length_squared, 0.0, 1.0)
+        errors = relative - t[:, None] * d
+        distances_squared = numpy.einsum("ij,ij->i", errors, errors)
+        index = int(numpy.argmax(distances_squared))
+        return start + 1 + index, math.sqrt(float(distances_squared[index]))
+
+    @staticmethod
+    def __visvalingam(points: list[Point], tolerance: float) -> list[Point]:
+        min_area = tolerance * tolerance
+        count = len(points)
+        prev_index = list(range(-1, count - 1))
+        next_index = list(range(1, count + 1))
+        areas = [math.inf] * count
+
+        def area(i: int) -> float:
+            (x1, y1), (x2, y2), (x3, y3) = points[prev_index[i]], points[i], points[next_index[i]]
+            return abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1)) / 2
+
+        heap = []
+        for i in range(1, count - 1):
+            areas[i] = area(i)
+            heap.append((areas[i], i))
+        heapq.heapify(heap)
+
+        removed = [False] * count
+        while heap:
+            current, i = heapq.heappop(heap)
+            if removed[i] or current != areas[i]:
+                continue  # Stale entry, the area was updated after a neighbour was removed
+            if current >= min_area:
+                break
+
+            removed[i] = True
+            before, after = prev_index[i], next_index[i]
+            next_index[before], prev_index[after] = after, before
+            for neighbour in (before, after):
+                if 0 < neighbour < count - 1:
+                    # The effective area never decreases, so the removal order stays monotonic
+                    areas[neighbour] = max(area(neighbour), current)
+                    heapq.heappush(heap, (areas[neighbour], neighbour))
+
+        return [point for point, is_removed in zip(points, removed) if not is_removed]
@@ -0,0 +1,162 @@
+"""
+Description: Archive of image assets (icon library) packed in a single zip or tar file.
+The archive is opened once and indexed by member name. Member payloads are read from
+a memory map of the archive by their offset, without opening the members as files.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from typing import Self
+import mmap
+import os
+import struct
+import tarfile
+import threading
+import zipfile
+import zlib
+
+class AssetBundle:
+    _ZIP_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+    _ZIP_LOCAL_SIGNATURE = b"PK\x03\x04"
+
+    class _Entry:
+        __slots__ = ("offset", "size", "compression")
+
+        def __init__(self, offset: int, size: int, compression: int):
+            self.offset = offset
+            self.size = size
+            self.compression = compression
+
+    def __init__(self, path: str):
+        """Open and index the archive.
+
+        Raises:
+            ValueError: If the file is not a zip or an uncompressed tar archive.
+        """
+        self.path = os.path.abspath(path)
+        self.__file = open(self.path, "rb")
+        self.__lock = threading.Lock()
+        self.__zip: zipfile.ZipFile | None = None
+        self.__data: mmap.mmap | bytes = b""
+        try:
+            size = os.fstat(self.__file.fileno()).st_size
+            if size:
+                self.__data = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__entries = self._index()
+        except Exception:
+            self.close()
+            raise
+
+        self.__aliases = self._aliases(self.__entries)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, name: str) -> bool:
+        return self._resolve(name) is not None
+
+    def names(self) -> list[str]:
+        """The member names in the archive order."""
+        return list(self.__entries)
+
+    def resolve(self, name: str) -> str:
+        """Get the member name for a name, which may be given without the file extension.
+
+        Raises:
+            KeyError: If there is no such asset.
+        """
+        member = self._resolve(name)
+        if member is None:
+            raise KeyError(f"Asset '{name}' not found in '{self.path}'.")
+        return member
+
+    def read(self, name: str) -> bytes:
+        """Read the content of an asset.
+
+        Args:
+            name (str): The member name, optionally without the file extension.
+
+        Returns:
+            bytes: The uncompressed content.
+
+        Raises:
+            KeyError: If there is no such asset.
+        """
+        member = self.resolve(name)
+        entry = self.__entries[member]
+        match entry.compression:
+            case zipfile.ZIP_STORED:
+                return self.__data[entry.offset:entry.offset + entry.size]
+            case zipfile.ZIP_DEFLATED:
+                return zlib.decompress(self.__data[entry.offset:entry.offset + entry.size], -zlib.MAX_WBITS)
+            case _:
+                # Rare compression methods are left to zipfile, which is not thread safe
+                with self.__lock:
+                    return self.__zip.read(member) # type: ignore the archive is a zip when there is a compression
+
+    def __reduce__(self):
+        # The archive is opened and indexed again where the bundle is unpickled
+        return (AssetBundle, (self.path,))
+
+    def close(self) -> None:
+        if self.__zip is not None:
+            self.__zip.close()
+        if isinstance(self.__data, mmap.mmap):
+            self.__data.close()
+        self.__file.close()
+
+    def _index(self) -> dict[str, _Entry]:
+        if zipfile.is_zipfile(self.__file):
+            return self._index_zip()
+
+        self.__file.seek(0)
+        try:
+            with tarfile.open(fileobj=self.__file, mode="r:") as archive:
+                return self._index_tar(archive)
+        except tarfile.TarError as e:
+            raise ValueError(f"Unsupported asset bundle '{self.path}'. Use a zip or an uncompressed tar archive.") from e
+
+    def _index_zip(self) -> dict[str, _Entry]:
+        self.__zip = zipfile.ZipFile(self.__file)
+        entries = {}
+        for info in self.__zip.infolist():
+            if info.is_dir():
+                continue
+
+            # The central directory does not know the size of the extra field in the local header
+            header = self._ZIP_LOCAL_HEADER.unpack_from(self.__data, info.header_offset)
+            if header[0] != self._ZIP_LOCAL_SIGNATURE:
+                raise ValueError(f"Corrupted asset bundle '{self.path}': bad local header of '{info.filename}'.")
+            name_length, extra_length = header[-2:]
+            offset = info.header_offset + self._ZIP_LOCAL_HEADER.size + name_length + extra_length
+
+            entries[info.filename] = self._Entry(offset, info.compress_size, info.compress_type)
+        return entries
+
+    def _index_tar(self, archive: tarfile.TarFile) -> dict[str, _Entry]:
+        return {
+            member.name: self._Entry(member.offset_data, member.size, zipfile.ZIP_STORED)
+            for member in archive
+            if member.isfile()
+        }
+
+    def _resolve(self, name: str) -> str | None:
+        if name in self.__entries:
+            return name
+        return self.__aliases.get(name)
+
+    @staticmethod
+    def _aliases(entries: dict[str, _Entry]) -> dict[str, str]:
+        """Map member names without the extension to the member, if the name is unambiguous."""
+        aliases: dict[str, str | None] = {}
+        for name in entries:
+            stem, extension = os.path.splitext(name)
+            if extension and stem not in entries:
+                aliases[stem] = None if stem in aliases else name
+        return {alias: name for alias, name in aliases.items() if name is not None}
@@ -1,20 +1,58 @@
 """
 Description: Data container for Image.
+The payload is kept raw (in memory or as a file path) and it is base64-encoded
+only when the data URL is needed, chunk by chunk.
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
+from typing import Iterator
+import base64
+
 class ImageData:
+    # A multiple of 3, so the base64 encoded chunks can be concatenated without padding in between
+    CHUNK_SIZE = 3 * 64 * 1024
+
     def __init__(
         self,
         width: float,
         height: float,
         mime_type: str,
-        data_url: str,
-        content: str | bytes | None = None
+        content: str | bytes | None = None,
+        path: str | None = None
     ):
+        if content is None and path is None:
+            raise ValueError("Image data needs either content or a file path.")
+
         self.width = width
         self.height = height
         self.mime_type = mime_type
-        self.data_url = data_url
         self.content = content
+        self.path = path
+
+    @property
+    def data_url(self) -> str:
+        """The complete data URL. Prefer `iter_data_url()` for writing to a stream."""
+        return ''.join(self.iter_data_url())
+
+    def iter_data_url(self) -> Iterator[str]:
+        """Yield the data URL in chunks, encoding the payload on the fly."""
+        yield f"data:{self.mime_type};base64,"
+        for chunk in self._iter_payload():
+            yield base64.b64encode(chunk).decode('ascii')
+
+    def read(self) -> bytes:
+        """Read the whole raw payload."""
+        return b''.join(self._iter_payload())
+
+    def _iter_payload(self) -> Iterator[bytes | memoryview]:
+        """Yield the raw payload in chunks of CHUNK_SIZE bytes (the last one may be shorter)."""
+        if self.content is None:
+            with open(self.path, "rb") as file: # type: ignore path is set when content is not
+                while chunk := file.read(self.CHUNK_SIZE):
+                    yield chunk
+        else:
+            data = self.content.encode('utf-8') if isinstance(self.content, str) else self.content
+            view = memoryview(data)
+            for start in range(0, len(view), self.CHUNK_SIZE):
+                yield view[start:start + self.CHUNK_SIZE]
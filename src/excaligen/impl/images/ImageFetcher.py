@@ -0,0 +1,158 @@
+"""
+Description: HTTP(S) fetcher for remote images.
+Keeps idle keep-alive connections pooled per host, applies timeouts and retries,
+and fetches batches of URLs concurrently with a bounded number of workers.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+import http.client
+import threading
+import time
+
+Connection = http.client.HTTPConnection | http.client.HTTPSConnection
+HostKey = tuple[str, str, int]
+
+class ImageFetcher:
+    DEFAULT_TIMEOUT = 10.0
+    DEFAULT_RETRIES = 2
+    DEFAULT_WORKERS = 8
+    MAX_REDIRECTS = 5
+
+    _RETRY_DELAY = 0.1
+    _RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+    _REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+    _HEADERS = {
+        "User-Agent": "excaligen",
+        "Accept": "image/svg+xml, image/png, image/jpeg, image/gif",
+        "Connection": "keep-alive",
+    }
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES, workers: int = DEFAULT_WORKERS):
+        if retries < 0:
+            raise ValueError("The number of retries must not be negative.")
+        if workers < 1:
+            raise ValueError("The number of workers must be at least 1.")
+
+        self._timeout = timeout
+        self._retries = retries
+        self._workers = workers
+        self.__idle: dict[HostKey, list[Connection]] = {}
+        self.__lock = threading.Lock()
+
+    def fetch(self, url: str) -> tuple[str | None, bytes]:
+        """Fetch a single URL, following redirects.
+
+        Returns:
+            tuple[str | None, bytes]: The media type (without parameters) and the response body.
+
+        Raises:
+            ValueError: If the URL cannot be fetched.
+        """
+        location = url
+        for _ in range(self.MAX_REDIRECTS + 1):
+            status, headers, body = self.__request_with_retries(location)
+
+            if status in self._REDIRECT_STATUSES and headers.get("Location"):
+                location = urljoin(location, headers["Location"])
+                continue
+
+            if status != 200:
+                raise ValueError(f"Failed to fetch image '{url}': HTTP {status}.")
+
+            content_type = headers.get("Content-Type")
+            return (content_type.split(";")[0].strip().lower() if content_type else None), body
+
+        raise ValueError(f"Failed to fetch image '{url}': too many redirects.")
+
+    def fetch_all(self, urls: list[str], workers: int | None = None) -> dict[str, tuple[str | None, bytes] | Exception]:
+        """Fetch several URLs concurrently.
+
+        At most `workers` requests are in flight at the same time. Duplicate URLs are fetched once.
+
+        Returns:
+            dict[str, tuple[str | None, bytes] | Exception]: The result of `fetch()` for every URL,
+            or the exception it raised.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+
+        max_workers = min(workers or self._workers, len(unique_urls))
+        with ThreadPoolExecutor(max_workers = max_workers) as executor:
+            results = list(executor.map(self.__fetch_or_error, unique_urls))
+
+        return dict(zip(unique_urls, results))
+
+    def __reduce__(self):
+        # The pooled connections and the lock are not transferred, a copy opens its own connections
+        return (ImageFetcher, (self._timeout, self._retries, self._workers))
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self.__lock:
+            connections = [connection for pool in self.__idle.values() for connection in pool]
+            self.__idle.clear()
+
+        for connection in connections:
+            connection.close()
+
+    def __fetch_or_error(self, url: str) -> tuple[str | None, bytes] | Exception:
+        try:
+            return self.fetch(url)
+        except Exception as e:
+            return e
+
+    def __request_with_retries(self, url: str) -> tuple[int, http.client.HTTPMessage, bytes]:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported image URL '{url}'. Only http and https URLs are supported.")
+
+        key: HostKey = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        attempt = 0
+        while True:
+            connection, is_reused = self.__acquire(key)
+            try:
+                connection.request("GET", path, headers = self._HEADERS)
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                if is_reused:
+                    continue  # The server dropped an idle keep-alive connection, this is not a failed attempt.
+                if attempt >= self._retries:
+                    raise ValueError(f"Failed to fetch image '{url}': {e}") from e
+            else:
+                self.__release(key, connection, not response.will_close)
+                if response.status not in self._RETRY_STATUSES or attempt >= self._retries:
+                    return response.status, response.headers, body
+
+            time.sleep(self._RETRY_DELAY * 2 ** attempt)
+            attempt += 1
+
+    def __acquire(self, key: HostKey) -> tuple[Connection, bool]:
+        with self.__lock:
+            pool = self.__idle.get(key)
+            if pool:
+                return pool.pop(), True
+
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout = self._timeout), False
+        return http.client.HTTPConnection(host, port, timeout = self._timeout), False
+
+    def __release(self, key: HostKey, connection: Connection, is_reusable: bool) -> None:
+        if is_reusable:
+            with self.__lock:
+                pool = self.__idle.setdefault(key, [])
+                if len(pool) < self._workers:
+                    pool.append(connection)
+                    return
+
+        connection.close()
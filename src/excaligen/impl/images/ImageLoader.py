@@ -1,87 +1,200 @@
 """
 Image loader implementation that handles loading images from files, URLs, and raw data.
 Supports SVG, PNG, JPEG, and GIF formats with automatic format detection and size extraction.
+Remote images are fetched through a pooled ImageFetcher and can be prefetched concurrently.
+Image files are probed by their header only, their payload is read at serialization time.
+SVG sources are parsed once and can be minified before they are embedded.
+Images can be served by name from asset bundles (zip or tar archives).
 """
-# Copyright (c) 2024 - 2025 Milan Piskla
+# Copyright (c) 2024 - 2026 Milan Piskla
 # Licensed under the MIT License - see LICENSE file for details
 
 from ..base.AbstractImageLoader import AbstractImageLoader
+from .AssetBundle import AssetBundle
 from .ImageData import ImageData
+from .ImageFetcher import ImageFetcher
+from .SvgMinifier import SvgMinifier
+from typing import Mapping
 import os
-import base64
+import mmap
 import struct
+import uuid
 from xml.etree import ElementTree as ET
-import urllib.request
 
 class ImageLoader(AbstractImageLoader):
+    _PROBE_CHUNK_SIZE = 4096
+    _SVG_TAGS = ('{http://www.w3.org/2000/svg}svg', 'svg')
+
+    def __init__(self, fetcher: ImageFetcher | None = None):
+        self.__fetcher = fetcher if fetcher is not None else ImageFetcher()
+        self.__prefetched: dict[str, ImageData | Exception] = {}
+        self.__minifier: SvgMinifier | None = None
+        self.__svg_bytes_saved = 0
+        self.__bundles: list[AssetBundle] = []
+        self.__assets: dict[str, tuple[str, ImageData]] = {}
+        self.__members: dict[tuple[int, str], tuple[str, ImageData]] = {}
+
+    @property
+    def svg_bytes_saved(self) -> int:
+        """The total number of bytes removed from SVG sources by minification."""
+        return self.__svg_bytes_saved
+
+    def minify_svg(self, enabled: bool) -> None:
+        """Enable or disable minification of SVG images loaded afterwards."""
+        self.__minifier = SvgMinifier() if enabled else None
+
     def load_from_file(self, file_path: str) -> ImageData:
         # Read the file extension to determine the type
         file_extension = os.path.splitext(file_path)[1].lower()
 
-        if file_extension == ".svg":
+        if file_extension == ".svg" and self.__minifier is not None:
+            # Minification needs the whole document, the file cannot be just probed
             with open(file_path, "r", encoding="utf-8") as svg_file:
-                svg_content = svg_file.read()
-            return self._process_svg(svg_content)
+                return self._process_svg(svg_file.read())
+        elif file_extension == ".svg":
+            width, height = self._probe_svg_file(file_path)
+            return ImageData(width, height, "image/svg+xml", path=os.path.abspath(file_path))
         else:
-            with open(file_path, "rb") as image_file:
-                binary_data = image_file.read()
-            return self._process_binary_image(binary_data)
+            mime_type, (width, height) = self._probe_binary_file(file_path)
+            return ImageData(width, height, mime_type, path=os.path.abspath(file_path))
 
     def load_from_data(self, data: bytes | str) -> ImageData:
         if isinstance(data, str):
-            if self._is_valid_svg(data):
-                return self._process_svg(data)
-            else:
-                raise ValueError("Invalid SVG data. Ensure the string is a well-formed SVG.")
+            return self._process_svg(data)
         elif isinstance(data, bytes):
             return self._process_binary_image(data)
         else:
             raise TypeError("Unsupported data type. Use 'bytes' for images and 'str' for SVG.")
 
     def load_from_url(self, url: str) -> ImageData:
-        with urllib.request.urlopen(url) as response:
-            content_type = response.headers.get('Content-Type')
-            data = response.read()
-        
-            content_type = response.headers.get('Content-Type')
-            if content_type == 'image/svg+xml':
-                return self._process_svg(data.decode('utf-8'))
-            elif content_type in ['image/png', 'image/jpeg', 'image/gif']:
-                return self._process_binary_image(data)
+        prefetched = self.__prefetched.get(url)
+        match prefetched:
+            case ImageData():
+                return prefetched
+            case Exception():
+                raise prefetched
+            case _:
+                content_type, data = self.__fetcher.fetch(url)
+                return self._process_remote_image(content_type, data)
+
+    def add_bundle(self, bundle: AssetBundle) -> None:
+        """Register an asset bundle. Names are looked up in the bundles in the order of registration."""
+        self.__bundles.append(bundle)
+
+    def load_from_asset(self, name: str) -> tuple[str, ImageData]:
+        """Load an image from the asset bundles.
+
+        Returns:
+            tuple[str, ImageData]: The file id shared by all images showing the asset, and the image data.
+        """
+        asset = self.__assets.get(name)
+        if asset is not None:
+            return asset
+
+        index = next((i for i, bundle in enumerate(self.__bundles) if name in bundle), None)
+        if index is None:
+            raise ValueError(f"Asset '{name}' not found in the asset bundles.")
+
+        bundle = self.__bundles[index]
+        member = bundle.resolve(name)
+        # Different names of one member, e.g. with and without the extension, share its file
+        asset = self.__members.get((index, member))
+        if asset is None:
+            data = bundle.read(member)
+            if os.path.splitext(member)[1].lower() == ".svg":
+                image_data = self._process_svg(data.decode('utf-8'))
             else:
-                raise ValueError("Unsupported image format. Only SVG, PNG, JPEG, and GIF are supported.")
+                image_data = self._process_binary_image(data)
+            asset = self.__members[(index, member)] = (str(uuid.uuid4()), image_data)
 
-        response.raise_for_status()
+        # The data is immutable, images using the same asset share it and are written to the file once
+        self.__assets[name] = asset
+        return asset
+
+    def prefetch(self, urls: list[str], workers: int | None = None) -> None:
+        pending = [url for url in urls if url not in self.__prefetched]
+        for url, result in self.__fetcher.fetch_all(pending, workers).items():
+            if isinstance(result, Exception):
+                # Remember the failure, it is raised when the image is actually requested
+                self.__prefetched[url] = result
+                continue
+
+            try:
+                self.__prefetched[url] = self._process_remote_image(*result)
+            except ValueError as e:
+                self.__prefetched[url] = e
+
+    def _process_remote_image(self, content_type: str | None, data: bytes) -> ImageData:
+        if content_type == 'image/svg+xml':
+            return self._process_svg(data.decode('utf-8'))
+        elif content_type in ['image/png', 'image/jpeg', 'image/gif']:
+            return self._process_binary_image(data)
+        else:
+            raise ValueError("Unsupported image format. Only SVG, PNG, JPEG, and GIF are supported.")
 
     def _process_svg(self, svg_content: str) -> ImageData:
-        width, height = self._get_svg_size(svg_content)
-        mime_type = "image/svg+xml"
-        content_base64 = base64.b64encode(svg_content.encode('utf-8')).decode('utf-8')
-        data_url = f"data:{mime_type};base64,{content_base64}"
-        return ImageData(width, height, mime_type, data_url, content=svg_content)
+        # The tree is parsed once and used for the validation, the size and the minification
+        root = self._parse_svg(svg_content)
+        width, height = self._svg_size_from_attributes(root.attrib)
+
+        if self.__minifier is not None:
+            minified = self.__minifier.minify(root)
+            saved = len(svg_content.encode('utf-8')) - len(minified.encode('utf-8'))
+            if saved > 0:
+                self.__svg_bytes_saved += saved
+                svg_content = minified
+
+        return ImageData(width, height, "image/svg+xml", content=svg_content)
 
     def _process_binary_image(self, data: bytes) -> ImageData:
         mime_type = self._detect_mime_type(data)
         if mime_type is None:
             raise ValueError("Unsupported image format. Only SVG, PNG, JPEG, and GIF are supported.")
         width, height = self._detect_image_size(data, mime_type)
-        encoded_data = base64.b64encode(data).decode('utf-8')
-        data_url = f"data:{mime_type};base64,{encoded_data}"
-        return ImageData(width, height, mime_type, data_url, content=data)
+        return ImageData(width, height, mime_type, content=data)
 
-    def _is_valid_svg(self, data: str) -> bool:
+    def _probe_svg_file(self, file_path: str) -> tuple[float, float]:
+        """Get the SVG size by parsing the file only up to the start tag of the root element."""
+        parser = ET.XMLPullParser(events=("start",))
+        try:
+            with open(file_path, "rb") as svg_file:
+                while chunk := svg_file.read(self._PROBE_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    root = next((element for _, element in parser.read_events()), None)
+                    if root is not None and root.tag in self._SVG_TAGS:
+                        return self._svg_size_from_attributes(root.attrib)
+                    if root is not None:
+                        break
+        except ET.ParseError:
+            pass  # Not XML, reported as invalid SVG below
+        raise ValueError("Invalid SVG data. Ensure the string is a well-formed SVG.")
+
+    def _probe_binary_file(self, file_path: str) -> tuple[str, tuple[int, int]]:
+        """Detect the MIME type and size of a binary image from a memory map, touching only the header pages."""
+        with open(file_path, "rb") as image_file:
+            if os.fstat(image_file.fileno()).st_size == 0:
+                raise ValueError("Unsupported image format. Only SVG, PNG, JPEG, and GIF are supported.")
+
+            with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                mime_type = self._detect_mime_type(data)
+                if mime_type is None:
+                    raise ValueError("Unsupported image format. Only SVG, PNG, JPEG, and GIF are supported.")
+                return mime_type, self._detect_image_size(data, mime_type)
+
+    def _parse_svg(self, data: str) -> ET.Element:
         try:
             root = ET.fromstring(data)
-            return root.tag == '{http://www.w3.org/2000/svg}svg' or root.tag == 'svg'
         except ET.ParseError:
-            return False
+            root = None
+
+        if root is None or root.tag not in self._SVG_TAGS:
+            raise ValueError("Invalid SVG data. Ensure the string is a well-formed SVG.")
+        return root
 
-    def _get_svg_size(self, svg_data: str) -> tuple[float, float]:
-        root = ET.fromstring(svg_data)
-        
+    def _svg_size_from_attributes(self, attributes: Mapping[str, str]) -> tuple[float, float]:
         # Check for width and height attributes
-        width = root.attrib.get('width')
-        height = root.attrib.get('height')
+        width = attributes.get('width')
+        height = attributes.get('height')
 
         if width and height:
             # Attempt to parse width and height values if they are present
@@ -91,7 +204,7 @@ class ImageLoader(AbstractImageLoader):
                 pass  # If parsing fails, we'll fall back to viewBox
 
         # Check for viewBox attribute as a fallback
-        viewBox = root.attrib.get('viewBox')
+        viewBox = attributes.get('viewBox')
         if viewBox:
             viewBox_values = viewBox.strip().split()
             if len(viewBox_values) == 4:
@@ -104,17 +217,17 @@ class ImageLoader(AbstractImageLoader):
         # Return default size if neither width/height nor viewBox are available or valid
         return 0, 0
 
-    def _detect_mime_type(self, data: bytes) -> str | None:
-        if data.startswith(b'\x89PNG\r\n\x1a\n'):
+    def _detect_mime_type(self, data: bytes | mmap.mmap) -> str | None:
+        if data[:8] == b'\x89PNG\r\n\x1a\n':
             return 'image/png'
-        elif data.startswith(b'\xff\xd8'):
+        elif data[:2] == b'\xff\xd8':
             return 'image/jpeg'
-        elif data.startswith(b'GIF8'):
+        elif data[:4] == b'GIF8':
             return 'image/gif'
         else:
             return None
 
-    def _detect_image_size(self, data: bytes, mime_type: str) -> tuple[int, int]:
+    def _detect_image_size(self, data: bytes | mmap.mmap, mime_type: str) -> tuple[int, int]:
         if mime_type == "image/png":
             return self._get_png_size(data)
         elif mime_type == "image/jpeg":
@@ -123,7 +236,7 @@ class ImageLoader(AbstractImageLoader):
             return self._get_gif_size(data)
         return 0, 0
 
-    def _get_png_size(self, data: bytes) -> tuple[int, int]:
+    def _get_png_size(self, data: bytes | mmap.mmap) -> tuple[int, int]:
         """Get the width and height of a PNG image from its binary data."""
         try:
             width, height = struct.unpack(">II", data[16:24])
@@ -131,7 +244,7 @@ class ImageLoader(AbstractImageLoader):
         except struct.error:
             return 0, 0
 
-    def _get_jpeg_size(self, data: bytes) -> tuple[int, int]:
+    def _get_jpeg_size(self, data: bytes | mmap.mmap) -> tuple[int, int]:
         """Get the width and height of a JPEG image from its binary data."""
         try:
             index = 0
@@ -163,7 +276,7 @@ class ImageLoader(AbstractImageLoader):
         except (IndexError, struct.error):
             return 0, 0
 
-    def _get_gif_size(self, data: bytes) -> tuple[int, int]:
+    def _get_gif_size(self, data: bytes | mmap.mmap) -> tuple[int, int]:
         """Get the width and height of a GIF image from its binary data."""
         try:
             width, height = struct.unpack("<HH", data[6:10])
@@ -0,0 +1,106 @@
+"""
+Description: Downscaling of embedded raster images.
+Re-encodes the image payload to the displayed size multiplied by a device pixel ratio,
+optionally capped by a pixel budget. Requires the optional Pillow package.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from .ImageData import ImageData
+import io
+import math
+
+class ImageResampler:
+    DEFAULT_DPR = 2.0
+    DEFAULT_QUALITY = 85
+
+    _FORMATS = {"image/png": "PNG", "image/jpeg": "JPEG", "image/gif": "GIF"}
+
+    def __init__(self, dpr: float = DEFAULT_DPR, max_pixels: int | None = None, quality: int = DEFAULT_QUALITY):
+        if dpr <= 0:
+            raise ValueError("The device pixel ratio must be positive.")
+        if max_pixels is not None and max_pixels < 1:
+            raise ValueError("The pixel budget must be at least 1.")
+        if not 1 <= quality <= 100:
+            raise ValueError("The quality must be between 1 and 100.")
+
+        try:
+            from PIL import Image as PILImage
+        except ImportError as e:
+            raise ImportError("Image downscaling requires the Pillow package. Install it with 'pip install excaligen[images]'.") from e
+
+        self._dpr = dpr
+        self._max_pixels = max_pixels
+        self._quality = quality
+        self.__pil = PILImage
+
+    def __reduce__(self):
+        # Pillow is imported again where the resampler is unpickled
+        return (ImageResampler, (self._dpr, self._max_pixels, self._quality))
+
+    def target_size(self, width: int, height: int, display_width: float, display_height: float) -> tuple[int, int]:
+        """Compute the pixel size the image is stored with.
+
+        Args:
+            width (int): The width of the image in pixels.
+            height (int): The height of the image in pixels.
+            display_width (float): The displayed width in scene units, 0 if unknown.
+            display_height (float): The displayed height in scene units, 0 if unknown.
+
+        Returns:
+            tuple[int, int]: The target size, never larger than the original size.
+        """
+        if width <= 0 or height <= 0:
+            return width, height
+
+        scale = 1.0
+        if display_width > 0 and display_height > 0:
+            scale = min(scale, max(display_width * self._dpr / width, display_height * self._dpr / height))
+        if self._max_pixels is not None:
+            scale = min(scale, math.sqrt(self._max_pixels / (width * height)))
+
+        if scale >= 1.0:
+            return width, height
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def resample(self, image_data: ImageData, display_width: float, display_height: float) -> ImageData:
+        """Downscale the image for the displayed size.
+
+        SVG images, animated GIFs and images already small enough are returned unchanged,
+        as well as images that would not get smaller by re-encoding.
+
+        Args:
+            image_data (ImageData): The original image.
+            display_width (float): The displayed width in scene units.
+            display_height (float): The displayed height in scene units.
+
+        Returns:
+            ImageData: The downscaled image or the original one.
+        """
+        image_format = self._FORMATS.get(image_data.mime_type)
+        if image_format is None:
+            return image_data
+
+        width, height = self.target_size(int(image_data.width), int(image_data.height), display_width, display_height)
+        if (width, height) == (image_data.width, image_data.height):
+            return image_data
+
+        original = image_data.read()
+        with self.__pil.open(io.BytesIO(original)) as image:
+            if getattr(image, "n_frames", 1) > 1:
+                return image_data
+
+            if image_format == "JPEG" and image.mode not in ("RGB", "L", "CMYK"):
+                image = image.convert("RGB")
+            resized = image.resize((width, height), self.__pil.Resampling.LANCZOS)
+
+            output = io.BytesIO()
+            if image_format == "JPEG":
+                resized.save(output, "JPEG", quality = self._quality, optimize = True)
+            else:
+                resized.save(output, image_format, optimize = True)
+
+        content = output.getvalue()
+        if len(content) >= len(original):
+            return image_data
+        return ImageData(width, height, image_data.mime_type, content = content)
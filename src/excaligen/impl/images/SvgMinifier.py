@@ -0,0 +1,149 @@
+"""
+Description: Minifier for SVG images.
+Serializes a parsed SVG tree without comments, metadata, editor specific content
+and insignificant whitespace.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
+
+class SvgMinifier:
+    SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+    XLINK_NAMESPACE = "http://www.w3.org/1999/xlink"
+    XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+    # Namespaces written by drawing tools, they carry no rendering information
+    EDITOR_NAMESPACES = {
+        "http://www.inkscape.org/namespaces/inkscape",
+        "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+        "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+        "http://creativecommons.org/ns#",
+        "http://purl.org/dc/elements/1.1/",
+        "http://ns.adobe.com/AdobeIllustrator/10.0/",
+        "http://ns.adobe.com/AdobeSVGViewerExtensions/3.0/",
+        "http://ns.adobe.com/Extensibility/1.0/",
+        "http://ns.adobe.com/Graphs/1.0/",
+        "http://ns.adobe.com/SaveForWeb/1.0/",
+        "http://ns.adobe.com/Variables/1.0/",
+        "http://ns.adobe.com/xap/1.0/",
+        "http://www.bohemiancoding.com/sketch/ns",
+    }
+
+    # Elements whose text content is rendered, whitespace in them is significant
+    TEXT_ELEMENTS = {"text", "tspan", "textPath", "style", "title", "desc"}
+    REMOVED_ELEMENTS = {"metadata"}
+
+    _KNOWN_PREFIXES = {
+        SVG_NAMESPACE: "",
+        XLINK_NAMESPACE: "xlink",
+        XML_NAMESPACE: "xml",
+    }
+
+    def minify(self, root: ET.Element) -> str:
+        """Serialize the SVG tree in the minified form.
+
+        Comments and processing instructions are already dropped by the parser.
+
+        Args:
+            root (ET.Element): The root element of the parsed SVG.
+
+        Returns:
+            str: The minified SVG document.
+        """
+        prefixes = self._collect_prefixes(root)
+        declarations = ''.join(
+            f' xmlns{":" + prefix if prefix else ""}={quoteattr(namespace)}'
+            for namespace, prefix in prefixes.items()
+            if namespace != self.XML_NAMESPACE
+        )
+
+        parts: list[str] = []
+        self._write_element(root, parts, prefixes, declarations, preserve_space = False)
+        return ''.join(parts)
+
+    def _collect_prefixes(self, root: ET.Element) -> dict[str, str]:
+        """Assign a prefix to every namespace used by the kept elements and attributes."""
+        prefixes: dict[str, str] = {}
+        pending = [root]
+        while pending:
+            element = pending.pop()
+            namespaces = [self._split(element.tag)[0]]
+            # Unprefixed attributes have no namespace, so SVG attributes never need a prefix
+            namespaces += [namespace for namespace, _ in map(self._split, element.attrib) if namespace != self.SVG_NAMESPACE]
+
+            for namespace in namespaces:
+                if namespace and namespace not in self.EDITOR_NAMESPACES and namespace not in prefixes:
+                    prefix = self._KNOWN_PREFIXES.get(namespace)
+                    prefixes[namespace] = prefix if prefix is not None else f"ns{len(prefixes)}"
+
+            pending.extend(child for child in element if self._is_kept(child))
+        return prefixes
+
+    def _write_element(
+        self,
+        element: ET.Element,
+        parts: list[str],
+        prefixes: dict[str, str],
+        declarations: str,
+        preserve_space: bool
+    ) -> None:
+        namespace, local_name = self._split(element.tag)
+        name = self._qualified_name(namespace, local_name, prefixes)
+
+        space = element.get(f"{{{self.XML_NAMESPACE}}}space")
+        if space is not None:
+            preserve_space = space == "preserve"
+        keeps_text = preserve_space or local_name in self.TEXT_ELEMENTS
+
+        attributes = ''.join(
+            f' {self._qualified_name(*self._split(key), prefixes, is_attribute = True)}={quoteattr(value)}'
+            for key, value in element.attrib.items()
+            if self._split(key)[0] not in self.EDITOR_NAMESPACES
+        )
+        attributes = declarations + attributes
+
+        content: list[str] = [self._text(element.text, keeps_text)]
+        for child in element:
+            if self._is_kept(child):
+                self._write_element(child, content, prefixes, "", preserve_space)
+            # The tail belongs to the parent, it is kept even when the child is removed
+            content.append(self._text(child.tail, keeps_text))
+
+        if any(content):
+            parts.append(f"<{name}{attributes}>")
+            parts.extend(content)
+            parts.append(f"</{name}>")
+        else:
+            parts.append(f"<{name}{attributes}/>")
+
+    def _is_kept(self, element: ET.Element) -> bool:
+        if not isinstance(element.tag, str):
+            return False  # Comments and processing instructions kept by a custom parser
+
+        namespace, local_name = self._split(element.tag)
+        if namespace in self.EDITOR_NAMESPACES:
+            return False
+        return not (namespace in ("", self.SVG_NAMESPACE) and local_name in self.REMOVED_ELEMENTS)
+
+    def _text(self, text: str | None, keeps_text: bool) -> str:
+        if not text:
+            return ""
+        if not keeps_text and not text.strip():
+            return ""
+        return escape(text)
+
+    def _qualified_name(self, namespace: str, local_name: str, prefixes: dict[str, str], is_attribute: bool = False) -> str:
+        if not namespace or (is_attribute and namespace == self.SVG_NAMESPACE):
+            return local_name
+
+        prefix = prefixes[namespace]
+        return f"{prefix}:{local_name}" if prefix else local_name
+
+    @staticmethod
+    def _split(tag: str) -> tuple[str, str]:
+        if tag.startswith("{"):
+            namespace, local_name = tag[1:].split("}", 1)
+            return namespace, local_name
+        return "", tag
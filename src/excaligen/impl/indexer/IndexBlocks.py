@@ -0,0 +1,69 @@
+"""
+Description: Hands out fractional indexes to threads creating elements concurrently.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from .IndexGenerator import IndexGenerator
+import threading
+
+class IndexBlocks:
+    """Fractional indexes for many threads, each taking them from a block reserved for the thread.
+
+    Only the reservation of a block takes the lock, so threads creating elements do not contend for every index.
+    The indexes of one thread increase. The blocks of different threads interleave, so elements appended
+    by several threads must be sorted by their indexes before they are written, see `concurrent()`.
+    A single thread gets the same sequence as from the generator alone.
+    """
+    BLOCK_SIZE = 64
+
+    def __init__(self, first: str):
+        self.__first: str | None = first
+        self.__generator = IndexGenerator(first)
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__generation = 0
+        self.__thread: int | None = None
+        self.__concurrent = False
+
+    def next(self) -> str:
+        local = self.__local
+        block = getattr(local, "block", None)
+        if not block or local.generation != self.__generation:
+            block = local.block = self.__reserve()
+            local.generation = self.__generation
+        return block.pop()
+
+    def concurrent(self) -> bool:
+        """Whether more than one thread has taken indexes, so the elements may be out of order."""
+        return self.__concurrent
+
+    def release(self) -> None:
+        """Drop the reserved blocks, the indexes handed out next are greater than all indexes handed out so far."""
+        with self.__lock:
+            # The block of a single thread already continues after all indexes handed out
+            if self.__concurrent:
+                self.__generation += 1
+
+    def __reserve(self) -> list[str]:
+        with self.__lock:
+            thread = threading.get_ident()
+            self.__concurrent = self.__concurrent or (self.__thread is not None and self.__thread != thread)
+            self.__thread = thread
+            block = [self.__generator.next() for _ in range(self.BLOCK_SIZE - (self.__first is not None))]
+            if self.__first is not None:
+                block.insert(0, self.__first)
+                self.__first = None
+        block.reverse()
+        return block
+
+    def __getstate__(self) -> dict:
+        # The reserved blocks stay unused, the copy continues after them
+        return {"first": self.__first, "generator": self.__generator, "concurrent": self.__concurrent}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__first, self.__generator, self.__concurrent = state["first"], state["generator"], state["concurrent"]
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__generation = 0
+        self.__thread = None
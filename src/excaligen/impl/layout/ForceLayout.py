@@ -0,0 +1,319 @@
+"""
+Description: Force-directed layout of undirected graphs.
+Implements the Fruchterman-Reingold model with Barnes-Hut approximation of the repulsive forces.
+The forces are vectorized if the optional NumPy package is installed.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from ..geometry.Point import Point
+from ..geometry.NumPySupport import NumPySupport
+import math
+import random
+
+class QuadTree:
+    """A quadtree over points stored in flat lists, one entry per cell.
+
+    Each cell knows the number of its points, their center of mass and its side.
+    Leaves hold one point, or several coincident points at the maximal depth.
+    """
+    MAX_DEPTH = 24
+
+    def __init__(self, xs: list[float], ys: list[float]):
+        self.mass: list[int] = []
+        self.com_x: list[float] = []
+        self.com_y: list[float] = []
+        self.side: list[float] = []
+        self.children: list[list[int]] = []  # Empty for leaves
+
+        x0, y0 = min(xs, default=0.0), min(ys, default=0.0)
+        side = max(max(xs, default=0.0) - x0, max(ys, default=0.0) - y0) or 1.0
+        stack = [(self.__add_cell(xs, ys, list(range(len(xs))), side), list(range(len(xs))), x0, y0, side, 0)]
+        while stack:
+            cell, indices, x0, y0, side, depth = stack.pop()
+            if len(indices) < 2 or depth == QuadTree.MAX_DEPTH:
+                continue
+            half = side / 2
+            mx, my = x0 + half, y0 + half
+            quadrants: list[list[int]] = [[], [], [], []]
+            for i in indices:
+                quadrants[(xs[i] >= mx) + 2 * (ys[i] >= my)].append(i)
+            for quadrant, members in enumerate(quadrants):
+                if members:
+                    child = self.__add_cell(xs, ys, members, half)
+                    self.children[cell].append(child)
+                    stack.append((child, members, mx if quadrant & 1 else x0, my if quadrant & 2 else y0, half, depth + 1))
+
+    def __len__(self) -> int:
+        return len(self.mass)
+
+    def __add_cell(self, xs: list[float], ys: list[float], indices: list[int], side: float) -> int:
+        self.mass.append(len(indices))
+        self.com_x.append(sum(xs[i] for i in indices) / len(indices) if indices else 0.0)
+        self.com_y.append(sum(ys[i] for i in indices) / len(indices) if indices else 0.0)
+        self.side.append(side)
+        self.children.append([])
+        return len(self.mass) - 1
+
+class ForceLayout:
+    """Places the nodes of an undirected graph so that connected nodes are close and all nodes repel each other.
+
+    Each iteration moves the nodes by the sum of the forces, limited by a temperature that cools down linearly:
+
+    - Edges attract their nodes with the force d² / k, where k is the ideal edge length.
+    - All nodes repel each other with the force C k² / d. Far groups of nodes are approximated by their center
+      of mass in a quadtree (Barnes-Hut), so an iteration takes O(n log n) instead of O(n²).
+    - A weak gravity keeps disconnected parts of the graph together.
+
+    Finally, overlapping nodes are pushed apart using their sizes. The initial positions are random,
+    the same seed gives the same layout.
+    """
+    DEFAULT_ITERATIONS = 100
+    THETA = 0.8  # Cells smaller than THETA times their distance are approximated by their center of mass
+    REPULSION = 0.2  # Relative strength of the repulsion, as in the spring-electrical model of Yifan Hu
+    GRAVITY = 0.05
+    MAX_OVERLAP_PASSES = 100
+    OVERLAP_EXPANSION = 1.01
+
+    # Layouts of fewer elements are simulated in pure Python, see NumPySupport
+    NUMPY_THRESHOLD = 256
+
+    def __init__(self, iterations: int = DEFAULT_ITERATIONS, spacing: float = 40.0, seed: int = 0):
+        if iterations < 0:
+            raise ValueError("The number of iterations must not be negative.")
+        if spacing < 0:
+            raise ValueError("The spacing must not be negative.")
+        self._iterations = iterations
+        self._spacing = spacing
+        self._seed = seed
+
+    def place(self, sizes: list[tuple[float, float]], edges: list[tuple[int, int]], previous: list[Point | None] | None = None) -> list[Point]:
+        """Compute the centers of the nodes.
+
+        Args:
+            sizes (list[tuple[float, float]]): The width and height of each node.
+            edges (list[tuple[int, int]]): The edges as pairs of node indices.
+            previous (list[Point | None] | None): The centers of the nodes in a previous layout, None for new nodes.
+                If given, the simulation starts from them, with new nodes next to their neighbours,
+                and the temperature starts low, so the nodes move only as much as the changes require.
+
+        Returns:
+            list[Point]: The centers of the nodes, with the top left corner of the layout at (0, 0).
+        """
+        count = len(sizes)
+        if count == 0:
+            return []
+        edges = list(dict.fromkeys((min(u, v), max(u, v)) for u, v in edges if u != v))
+
+        k = sum(max(w, h) for w, h in sizes) / count + self._spacing or 1.0
+        rng = random.Random(self._seed)
+        extent = k * math.sqrt(count)
+        xs = [rng.uniform(0, extent) for _ in range(count)]
+        ys = [rng.uniform(0, extent) for _ in range(count)]
+        start_temperature = extent / 10
+        if previous is not None:
+            self.__start_from(previous, edges, xs, ys, k, rng)
+            start_temperature = k
+
+        numpy = NumPySupport.for_batch(count, ForceLayout.NUMPY_THRESHOLD)
+        if numpy is not None:
+            xs, ys = self.__simulate_numpy(numpy, xs, ys, edges, k, start_temperature)
+        else:
+            self.__simulate(xs, ys, edges, k, start_temperature)
+
+        self.__remove_overlaps(xs, ys, sizes)
+
+        min_x = min(x - w / 2 for x, (w, _) in zip(xs, sizes))
+        min_y = min(y - h / 2 for y, (_, h) in zip(ys, sizes))
+        return [(x - min_x, y - min_y) for x, y in zip(xs, ys)]
+
+    @staticmethod
+    def __start_from(previous: list[Point | None], edges: list[tuple[int, int]], xs: list[float], ys: list[float], k: float, rng: random.Random) -> None:
+        """Start known nodes at their previous centers and new nodes around their known neighbours."""
+        known = [center is not None for center in previous]
+        for node, center in enumerate(previous):
+            if center is not None:
+                xs[node], ys[node] = center
+
+        neighbours: list[list[int]] = [[] for _ in previous]
+        for u, v in edges:
+            neighbours[u].append(v)
+            neighbours[v].append(u)
+        placed = [node for node in range(len(previous)) if known[node]]
+        if placed:
+            x0, y0 = min(xs[node] for node in placed), min(ys[node] for node in placed)
+            x1, y1 = max(xs[node] for node in placed), max(ys[node] for node in placed)
+        for node in range(len(previous)):
+            if known[node]:
+                continue
+            anchors = [other for other in neighbours[node] if known[other]]
+            if anchors:
+                xs[node] = sum(xs[other] for other in anchors) / len(anchors) + rng.uniform(-k, k) / 2
+                ys[node] = sum(ys[other] for other in anchors) / len(anchors) + rng.uniform(-k, k) / 2
+            elif placed:
+                xs[node], ys[node] = rng.uniform(x0, x1), rng.uniform(y0, y1)
+
+    def __simulate(self, xs: list[float], ys: list[float], edges: list[tuple[int, int]], k: float, start_temperature: float) -> None:
+        count = len(xs)
+        repulsion = ForceLayout.REPULSION * k * k
+        theta2 = ForceLayout.THETA * ForceLayout.THETA
+        for iteration in range(self._iterations):
+            tree = QuadTree(xs, ys)
+            cx, cy = tree.com_x[0], tree.com_y[0]
+            fx, fy = [0.0] * count, [0.0] * count
+            for i in range(count):
+                x, y = xs[i], ys[i]
+                sx, sy = -(x - cx) * ForceLayout.GRAVITY, -(y - cy) * ForceLayout.GRAVITY
+                stack = [0]
+                while stack:
+                    cell = stack.pop()
+                    dx, dy = x - tree.com_x[cell], y - tree.com_y[cell]
+                    d2 = dx * dx + dy * dy
+                    if tree.children[cell] and tree.side[cell] * tree.side[cell] >= theta2 * d2:
+                        stack.extend(tree.children[cell])
+                    elif d2 > 0:
+                        f = repulsion * tree.mass[cell] / d2
+                        sx += dx * f
+                        sy += dy * f
+                fx[i], fy[i] = sx, sy
+
+            for u, v in edges:
+                dx, dy = xs[u] - xs[v], ys[u] - ys[v]
+                f = math.hypot(dx, dy) / k
+                fx[u] -= dx * f
+                fy[u] -= dy * f
+                fx[v] += dx * f
+                fy[v] += dy * f
+
+            temperature = start_temperature * (1 - iteration / self._iterations)
+            for i in range(count):
+                length = math.hypot(fx[i], fy[i])
+                if length > 0:
+                    step = min(length, temperature) / length
+                    xs[i] += fx[i] * step
+                    ys[i] += fy[i] * step
+
+    def __simulate_numpy(self, numpy, xs: list[float], ys: list[float], edges: list[tuple[int, int]], k: float, start_temperature: float) -> tuple[list[float], list[float]]:
+        """Vectorized variant of `__simulate`: the quadtree is built and traversed for all nodes at once, one level per step."""
+        count = len(xs)
+        px, py = numpy.asarray(xs, dtype=float), numpy.asarray(ys, dtype=float)
+        u, v = numpy.asarray(edges, dtype=int).reshape(-1, 2).T
+        repulsion = ForceLayout.REPULSION * k * k
+        theta2 = ForceLayout.THETA * ForceLayout.THETA
+        for iteration in range(self._iterations):
+            mass, com_x, com_y, side2, children = ForceLayout.__quadtree_numpy(numpy, px, py)
+            is_leaf = (children < 0).all(axis=1)
+
+            fx = -(px - com_x[0]) * ForceLayout.GRAVITY
+            fy = -(py - com_y[0]) * ForceLayout.GRAVITY
+            bodies, cells = numpy.arange(count), numpy.zeros(count, dtype=int)
+            while len(bodies):
+                dx, dy = px[bodies] - com_x[cells], py[bodies] - com_y[cells]
+                d2 = dx * dx + dy * dy
+                accepted = is_leaf[cells] | (side2[cells] < theta2 * d2)
+                apply = accepted & (d2 > 0)
+                f = repulsion * mass[cells[apply]] / d2[apply]
+                fx += numpy.bincount(bodies[apply], weights=dx[apply] * f, minlength=count)
+                fy += numpy.bincount(bodies[apply], weights=dy[apply] * f, minlength=count)
+
+                opened = ~accepted
+                expanded = children[cells[opened]].ravel()
+                valid = expanded >= 0
+                bodies = numpy.repeat(bodies[opened], 4)[valid]
+                cells = expanded[valid]
+
+            dx, dy = px[u] - px[v], py[u] - py[v]
+            f = numpy.hypot(dx, dy) / k
+            fx += numpy.bincount(v, weights=dx * f, minlength=count) - numpy.bincount(u, weights=dx * f, minlength=count)
+            fy += numpy.bincount(v, weights=dy * f, minlength=count) - numpy.bincount(u, weights=dy * f, minlength=count)
+
+            temperature = start_temperature * (1 - iteration / self._iterations)
+            length = numpy.hypot(fx, fy)
+            step = numpy.minimum(length, temperature) / numpy.where(length > 0, length, 1.0)
+            px += fx * step
+            py += fy * step
+        return px.tolist(), py.tolist()
+
+    @staticmethod
+    def __quadtree_numpy(numpy, px, py):
+        """Build the cells of a quadtree level by level, see `QuadTree`.
+
+        Returns:
+            The mass, center of mass, squared side and children (-1 for none, four per cell) of the cells.
+        """
+        x0, y0 = px.min(), py.min()
+        side = max(px.max() - x0, py.max() - y0) or 1.0
+        mass, com_x, com_y, sides, children = [[len(px)]], [[px.mean()]], [[py.mean()]], [[side]], [numpy.full((1, 4), -1)]
+        corner_x, corner_y = numpy.array([x0]), numpy.array([y0])
+        points = numpy.arange(len(px))
+        cell_of_point = numpy.zeros(len(px), dtype=int)  # Index of the cell within its level
+        level_start, level_mass = 0, numpy.array([len(px)])
+
+        for _ in range(QuadTree.MAX_DEPTH):
+            split = level_mass[cell_of_point] >= 2
+            points, cell_of_point = points[split], cell_of_point[split]
+            if not len(points):
+                break
+            half = side / 2
+            right = px[points] >= corner_x[cell_of_point] + half
+            lower = py[points] >= corner_y[cell_of_point] + half
+            keys = cell_of_point * 4 + right + 2 * lower
+            unique_keys, child_of_point, counts = numpy.unique(keys, return_inverse=True, return_counts=True)
+
+            next_start = level_start + len(level_mass)
+            children[-1][unique_keys // 4, unique_keys % 4] = next_start + numpy.arange(len(unique_keys))
+            mass.append(counts)
+            com_x.append(numpy.bincount(child_of_point, weights=px[points]) / counts)
+            com_y.append(numpy.bincount(child_of_point, weights=py[points]) / counts)
+            sides.append(numpy.full(len(unique_keys), half))
+            children.append(numpy.full((len(unique_keys), 4), -1))
+
+            corner_x = corner_x[unique_keys // 4] + half * (unique_keys % 2)
+            corner_y = corner_y[unique_keys // 4] + half * (unique_keys // 2 % 2)
+            cell_of_point, level_start, level_mass, side = child_of_point, next_start, counts, half
+
+        return (numpy.concatenate(mass).astype(float), numpy.concatenate(com_x), numpy.concatenate(com_y),
+                numpy.concatenate(sides) ** 2, numpy.concatenate(children))
+
+    def __remove_overlaps(self, xs: list[float], ys: list[float], sizes: list[tuple[float, float]]) -> None:
+        """Push overlapping nodes apart along the axis of the smaller overlap, until at least half the spacing separates them.
+
+        Candidate pairs are found in a grid with cells as large as the largest node, so a pass is linear for evenly sized nodes.
+        """
+        gap = self._spacing / 2
+        cell = max(max(w, h) for w, h in sizes) + gap or 1.0
+        neighbours = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+        for _ in range(ForceLayout.MAX_OVERLAP_PASSES):
+            grid: dict[tuple[int, int], list[int]] = {}
+            for i, (x, y) in enumerate(zip(xs, ys)):
+                grid.setdefault((math.floor(x / cell), math.floor(y / cell)), []).append(i)
+
+            moved = False
+            for (gx, gy), members in grid.items():
+                for ox, oy in neighbours:
+                    others = grid.get((gx + ox, gy + oy))
+                    if others is None:
+                        continue
+                    for a_index, i in enumerate(members):
+                        for j in (members[a_index + 1:] if (ox, oy) == (0, 0) else others):
+                            dx, dy = xs[j] - xs[i], ys[j] - ys[i]
+                            overlap_x = (sizes[i][0] + sizes[j][0]) / 2 + gap - abs(dx)
+                            overlap_y = (sizes[i][1] + sizes[j][1]) / 2 + gap - abs(dy)
+                            if overlap_x <= 0 or overlap_y <= 0:
+                                continue
+                            moved = True
+                            if overlap_x < overlap_y:
+                                shift = (overlap_x / 2) * (1 if dx >= 0 else -1)
+                                xs[i] -= shift
+                                xs[j] += shift
+                            else:
+                                shift = (overlap_y / 2) * (1 if dy >= 0 else -1)
+                                ys[i] -= shift
+                                ys[j] += shift
+            if not moved:
+                break
+            # Dense clusters are resolved faster if the whole layout is spread a little after each pass
+            cx, cy = sum(xs) / len(xs), sum(ys) / len(ys)
+            for i in range(len(xs)):
+                xs[i] = cx + (xs[i] - cx) * ForceLayout.OVERLAP_EXPANSION
+                ys[i] = cy + (ys[i] - cy) * ForceLayout.OVERLAP_EXPANSION
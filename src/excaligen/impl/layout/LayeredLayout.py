@@ -0,0 +1,359 @@
+"""
+Description: Layered (Sugiyama) layout of directed graphs.
+The graph is made acyclic, split into layers, the nodes in the layers are ordered to reduce edge crossings,
+and finally the nodes get their coordinates.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from ..geometry.Point import Point
+
+class LayeredLayout:
+    """Places the nodes of a directed graph into layers, so that edges point in one direction.
+
+    The nodes are given by their sizes and the edges by the indices of their nodes. The steps are:
+
+    1. Cycle breaking: edges closing a cycle in a depth first search are reversed.
+    2. Layer assignment: longest path from the sources, sources are then pulled next to their successors.
+    3. Edges spanning several layers are split by dummy nodes, one per crossed layer.
+    4. Crossing minimization: the layers are sorted by the barycenters of the neighbours, sweeping down and up.
+    5. Coordinate assignment: the nodes are moved towards their neighbours as far as the order and spacing allow.
+
+    All steps are linear in the size of the graph, up to sorting, so graphs with thousands of nodes are laid out in seconds.
+    """
+    DIRECTIONS = ("TB", "BT", "LR", "RL")
+    DEFAULT_SWEEPS = 8
+    DEFAULT_REFINEMENTS = 4
+
+    def __init__(self, direction: str = "TB", layer_spacing: float = 80.0, node_spacing: float = 40.0, sweeps: int = DEFAULT_SWEEPS):
+        if direction not in LayeredLayout.DIRECTIONS:
+            raise ValueError(f"Invalid direction '{direction}'. Use one of {', '.join(LayeredLayout.DIRECTIONS)}.")
+        if layer_spacing < 0 or node_spacing < 0:
+            raise ValueError("The spacing must not be negative.")
+        self._direction = direction
+        self._layer_spacing = layer_spacing
+        self._node_spacing = node_spacing
+        self._sweeps = sweeps
+        self._layer_of: list[int] = []
+        self._layers: list[list[int]] = []
+        self._reversed: set[tuple[int, int]] = set()
+        self._chains: dict[tuple[int, int], list[int]] = {}
+        self._bends: dict[tuple[int, int], list[float]] = {}
+
+    def place(self, sizes: list[tuple[float, float]], edges: list[tuple[int, int]], previous: list[Point | None] | None = None, previous_bends: dict[tuple[int, int], list[float]] | None = None) -> list[Point]:
+        """Compute the centers of the nodes.
+
+        Args:
+            sizes (list[tuple[float, float]]): The width and height of each node.
+            edges (list[tuple[int, int]]): The edges as pairs of node indices, from the source to the target.
+            previous (list[Point | None] | None): The centers of the nodes in a previous layout, None for new nodes.
+                If given, the previous order within the layers is kept instead of minimizing crossings,
+                new nodes are inserted next to their neighbours and the other nodes stay where they were, as far as possible.
+            previous_bends (dict[tuple[int, int], list[float]] | None): The `bends()` of the previous layout, by the node indices
+                of this one. Edges keeping their layers keep their bends, without them only the nodes are anchored.
+
+        Returns:
+            list[Point]: The centers of the nodes, with the top left corner of the layout at (0, 0).
+        """
+        count = len(sizes)
+        edges = list(dict.fromkeys((u, v) for u, v in edges if u != v))
+
+        self._reversed = self._break_cycles(count, edges)
+        dag = list(dict.fromkeys((v, u) if (u, v) in self._reversed else (u, v) for u, v in edges))
+        self._layer_of = self._assign_layers(count, dag)
+
+        layer_of, up, down = self._insert_dummies(count, dag)
+        if previous is None:
+            self._layers = self._initial_order(count, dag, layer_of)
+            self._minimize_crossings(up, down)
+            return self._assign_coordinates(sizes, layer_of, up, down)
+
+        across = 0 if self._direction in ("TB", "BT") else 1
+        anchors: list[float | None] = [None if center is None else center[across] for center in previous] + [None] * (len(layer_of) - count)
+        for edge, chain in self._chains.items():
+            bends = (previous_bends or {}).get(edge)
+            if bends is not None and len(bends) == len(chain):
+                for dummy, bend in zip(chain, bends):
+                    anchors[dummy] = bend
+        keys = self._stable_order(layer_of, up, down, anchors)
+        return self._assign_coordinates(sizes, layer_of, up, down, anchors, keys)
+
+    def is_reversed(self, source: int, target: int) -> bool:
+        """Check whether the edge was reversed to break a cycle, i.e. it points against the layout direction."""
+        return (source, target) in self._reversed
+
+    def layer(self, node: int) -> int:
+        """Get the layer the node was placed in by the last `place()`."""
+        return self._layer_of[node]
+
+    def bends(self) -> dict[tuple[int, int], list[float]]:
+        """Get the positions across the layers where the edges spanning several layers, as directed by the last `place()`,
+        cross the layers in between. They are in the coordinates of the returned centers.
+        """
+        return self._bends
+
+    @staticmethod
+    def _break_cycles(count: int, edges: list[tuple[int, int]]) -> set[tuple[int, int]]:
+        successors: list[list[int]] = [[] for _ in range(count)]
+        for u, v in edges:
+            successors[u].append(v)
+
+        # 0 not visited, 1 on the stack of the search, 2 finished
+        state = [0] * count
+        reversed_edges = set()
+        for root in range(count):
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [(root, 0)]
+            while stack:
+                u, i = stack[-1]
+                if i < len(successors[u]):
+                    stack[-1] = (u, i + 1)
+                    v = successors[u][i]
+                    if state[v] == 1:
+                        reversed_edges.add((u, v))
+                    elif state[v] == 0:
+                        state[v] = 1
+                        stack.append((v, 0))
+                else:
+                    state[u] = 2
+                    stack.pop()
+        return reversed_edges
+
+    @staticmethod
+    def _topological_order(count: int, dag: list[tuple[int, int]]) -> list[int]:
+        successors: list[list[int]] = [[] for _ in range(count)]
+        in_degree = [0] * count
+        for u, v in dag:
+            successors[u].append(v)
+            in_degree[v] += 1
+
+        order = [node for node in range(count) if in_degree[node] == 0]
+        for u in order:  # The list grows while it is iterated
+            for v in successors[u]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    order.append(v)
+        return order
+
+    @staticmethod
+    def _assign_layers(count: int, dag: list[tuple[int, int]]) -> list[int]:
+        successors: list[list[int]] = [[] for _ in range(count)]
+        has_predecessor = [False] * count
+        for u, v in dag:
+            successors[u].append(v)
+            has_predecessor[v] = True
+
+        order = LayeredLayout._topological_order(count, dag)
+        layer = [0] * count
+        for u in order:
+            for v in successors[u]:
+                layer[v] = max(layer[v], layer[u] + 1)
+
+        # Sources are placed right above their closest successor, not all in the first layer
+        for u in reversed(order):
+            if not has_predecessor[u] and successors[u]:
+                layer[u] = min(layer[v] for v in successors[u]) - 1
+        return layer
+
+    def _insert_dummies(self, count: int, dag: list[tuple[int, int]]) -> tuple[list[int], list[list[int]], list[list[int]]]:
+        layer_of = list(self._layer_of)
+        up: list[list[int]] = [[] for _ in range(count)]
+        down: list[list[int]] = [[] for _ in range(count)]
+        self._chains = {}
+
+        for u, v in dag:
+            previous = u
+            chain = self._chains[(u, v)] = []
+            for layer in range(layer_of[u] + 1, layer_of[v]):
+                dummy = len(layer_of)
+                layer_of.append(layer)
+                up.append([previous])
+                down.append([])
+                down[previous].append(dummy)
+                chain.append(dummy)
+                previous = dummy
+            down[previous].append(v)
+            up[v].append(previous)
+        return layer_of, up, down
+
+    def _initial_order(self, count: int, dag: list[tuple[int, int]], layer_of: list[int]) -> list[list[int]]:
+        layers: list[list[int]] = [[] for _ in range(max(layer_of, default=-1) + 1)]
+        placed = [False] * len(layer_of)
+        for node in self._topological_order(count, dag):
+            layers[layer_of[node]].append(node)
+            placed[node] = True
+        for node, layer in enumerate(layer_of):
+            if not placed[node]:
+                layers[layer].append(node)
+        return layers
+
+    def _stable_order(self, layer_of: list[int], up: list[list[int]], down: list[list[int]], anchors: list[float | None]) -> list[float]:
+        """Order the layers by the previous positions. Nodes without one, new nodes and the dummies of new edges,
+        get the mean position of their neighbours, looking up first and down if there is nothing above.
+        """
+        keys: list[float | None] = list(anchors)
+        layers: list[list[int]] = [[] for _ in range(max(layer_of, default=-1) + 1)]
+        for node, layer in enumerate(layer_of):
+            layers[layer].append(node)
+
+        for neighbours, order in ((up, layers), (down, layers[::-1])):
+            for layer in order:
+                for node in layer:
+                    if keys[node] is None:
+                        known = [keys[other] for other in neighbours[node] if keys[other] is not None]
+                        keys[node] = sum(known) / len(known) if known else None # type: ignore only known keys are summed
+
+        resolved = [0.0 if key is None else key for key in keys]
+        self._layers = [sorted(layer, key=resolved.__getitem__) for layer in layers]
+        return resolved
+
+    def _minimize_crossings(self, up: list[list[int]], down: list[list[int]]) -> None:
+        position = [0] * len(up)
+        for layer in self._layers:
+            for i, node in enumerate(layer):
+                position[node] = i
+
+        best_crossings = self._crossings(position, down)
+        best_layers = [list(layer) for layer in self._layers]
+        for sweep in range(self._sweeps):
+            if best_crossings == 0:
+                break
+            downward = sweep % 2 == 0
+            indices = range(1, len(self._layers)) if downward else range(len(self._layers) - 2, -1, -1)
+            neighbours = up if downward else down
+            for index in indices:
+                layer = self._layers[index]
+                barycenter = {}
+                for node in layer:
+                    adjacent = neighbours[node]
+                    barycenter[node] = sum(position[other] for other in adjacent) / len(adjacent) if adjacent else position[node]
+                layer.sort(key=barycenter.__getitem__)
+                for i, node in enumerate(layer):
+                    position[node] = i
+
+            crossings = self._crossings(position, down)
+            if crossings < best_crossings:
+                best_crossings = crossings
+                best_layers = [list(layer) for layer in self._layers]
+
+        self._layers = best_layers
+
+    def _crossings(self, position: list[int], down: list[list[int]]) -> int:
+        """Count the edge crossings between all pairs of neighbouring layers as inversions, with a Fenwick tree."""
+        total = 0
+        for index in range(len(self._layers) - 1):
+            targets = [position[v] for u in self._layers[index] for v in sorted(down[u], key=position.__getitem__)]
+            size = len(self._layers[index + 1])
+            tree = [0] * (size + 1)
+            for seen, target in enumerate(targets):
+                # Count the earlier edges ending right of this one
+                i, smaller_or_equal = target + 1, 0
+                while i > 0:
+                    smaller_or_equal += tree[i]
+                    i -= i & -i
+                total += seen - smaller_or_equal
+                i = target + 1
+                while i <= size:
+                    tree[i] += 1
+                    i += i & -i
+        return total
+
+    def _assign_coordinates(self, sizes: list[tuple[float, float]], layer_of: list[int], up: list[list[int]], down: list[list[int]], anchors: list[float | None] | None = None, keys: list[float] | None = None) -> list[Point]:
+        horizontal_layers = self._direction in ("TB", "BT")
+        across = [(w if horizontal_layers else h) for w, h in sizes] + [0.0] * (len(layer_of) - len(sizes))
+        along = [(h if horizontal_layers else w) for w, h in sizes] + [0.0] * (len(layer_of) - len(sizes))
+        is_dummy = lambda node: node >= len(sizes)
+
+        separations = []
+        for layer in self._layers:
+            gaps = [0.0]
+            for left, right in zip(layer, layer[1:]):
+                spacing = self._node_spacing / 2 if is_dummy(left) or is_dummy(right) else self._node_spacing
+                gaps.append((across[left] + across[right]) / 2 + spacing)
+            separations.append(gaps)
+
+        x = [0.0] * len(layer_of)
+        if anchors is not None and keys is not None:
+            # Nodes stay at their previous positions, the others follow their neighbours above
+            for layer, gaps in zip(self._layers, separations):
+                desired = []
+                for node in layer:
+                    if anchors[node] is not None:
+                        desired.append(anchors[node])
+                    elif up[node]:
+                        desired.append(sum(x[other] for other in up[node]) / len(up[node]))
+                    else:
+                        desired.append(keys[node])
+                for node, value in zip(layer, self._place_in_order(desired, gaps)): # type: ignore anchors are checked
+                    x[node] = value
+        else:
+            for layer, gaps in zip(self._layers, separations):
+                offset = 0.0
+                for node, gap in zip(layer, gaps):
+                    offset += gap
+                    x[node] = offset
+                for node in layer:
+                    x[node] -= offset / 2
+
+            for refinement in range(self.DEFAULT_REFINEMENTS):
+                downward = refinement % 2 == 0
+                indices = range(1, len(self._layers)) if downward else range(len(self._layers) - 2, -1, -1)
+                neighbours = up if downward else down
+                for index in indices:
+                    layer = self._layers[index]
+                    desired = [sum(x[other] for other in neighbours[node]) / len(neighbours[node]) if neighbours[node] else x[node] for node in layer]
+                    for node, value in zip(layer, self._place_in_order(desired, separations[index])):
+                        x[node] = value
+
+        thickness = [max((along[node] for node in layer), default=0.0) for layer in self._layers]
+        y_of_layer, y = [], 0.0
+        for i, t in enumerate(thickness):
+            y += t / 2 if i == 0 else (thickness[i - 1] + t) / 2 + self._layer_spacing
+            y_of_layer.append(y)
+
+        centers = []
+        for node in range(len(sizes)):
+            cx, cy = x[node], y_of_layer[layer_of[node]]
+            match self._direction:
+                case "BT":
+                    cy = -cy
+                case "LR":
+                    cx, cy = cy, cx
+                case "RL":
+                    cx, cy = -cy, cx
+            centers.append((cx, cy))
+
+        if not centers:
+            self._bends = {}
+            return centers
+        min_x = min(cx - w / 2 for (cx, _), (w, _) in zip(centers, sizes))
+        min_y = min(cy - h / 2 for (_, cy), (_, h) in zip(centers, sizes))
+        shift = min_x if horizontal_layers else min_y
+        self._bends = {edge: [x[dummy] - shift for dummy in chain] for edge, chain in self._chains.items() if chain}
+        return [(cx - min_x, cy - min_y) for cx, cy in centers]
+
+    @staticmethod
+    def _place_in_order(desired: list[float], gaps: list[float]) -> list[float]:
+        """Find positions closest to the desired ones (least squares) keeping the order and the gaps between the nodes.
+
+        Subtracting the accumulated gaps turns this into an isotonic regression, solved by pool adjacent violators.
+        """
+        offsets, offset = [], 0.0
+        for gap in gaps:
+            offset += gap
+            offsets.append(offset)
+
+        blocks: list[list[float]] = []  # [sum, count] of pooled targets
+        for value, offset in zip(desired, offsets):
+            blocks.append([value - offset, 1])
+            while len(blocks) > 1 and blocks[-2][0] * blocks[-1][1] > blocks[-1][0] * blocks[-2][1]:
+                total, count = blocks.pop()
+                blocks[-1][0] += total
+                blocks[-1][1] += count
+
+        positions = []
+        for total, count in blocks:
+            positions.extend([total / count] * int(count))
+        return [position + offset for position, offset in zip(positions, offsets)]
@@ -0,0 +1,373 @@
+"""
+Description: Automatic layout of the elements of a scene.
+The layout algorithms work with node indices and sizes, this class maps them to the elements and arrows of the scene.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from ..base.AbstractElement import AbstractElement
+from ..base.AbstractLabeledElement import AbstractLabeledElement
+from ..elements.Arrow import Arrow
+from ..elements.Frame import Frame
+from .LayeredLayout import LayeredLayout
+from .ForceLayout import ForceLayout
+from .TreeLayout import TreeLayout
+from .PackLayout import PackLayout
+from .LayoutResult import LayoutResult, EdgeKey
+
+from typing import Any, Callable, Sequence
+import math
+import statistics
+
+Edge = tuple[AbstractElement, AbstractElement]
+ShapeFactory = Callable[[str], AbstractLabeledElement]
+Connect = Callable[[Arrow | None, AbstractElement, AbstractElement], Arrow]
+
+class Layout:
+    """Computes the positions of elements, so that they do not have to be placed one by one.
+
+    The layouts move existing elements with `center()` and optionally connect them with arrows.
+    Only the positions are changed, the sizes of the elements are respected.
+
+    Each layout accepts the result of its previous call as `previous`. The changes since then (added, removed
+    and resized nodes, added and removed edges) are then found by comparing the nodes and edges, and the layout
+    only adapts the previous placement: unchanged elements keep their positions as far as possible,
+    and arrows of unchanged edges are kept, recomputed only if their nodes moved. This is much faster than a new
+    layout and keeps the changes of the generated file small.
+
+    > [!WARNING]
+    > Do not instantiate this class directly. Use `SceneBuilder.layout()` instead.
+    """
+    # Start and end directions of elbow arrows for each direction of the layout
+    ELBOWS = {"TB": ("D", "U"), "BT": ("U", "D"), "LR": ("R", "L"), "RL": ("L", "R")}
+
+    # How much larger than the label box a shape must be to contain it
+    SHAPE_SCALES = {"rectangle": 1.0, "ellipse": math.sqrt(2), "diamond": 2.0}
+
+    # Nodes moved less than this keep their position, and their arrows are not recomputed
+    TOLERANCE = 1e-6
+
+    def __init__(self, arrow: Callable[[], Arrow], shapes: dict[str, ShapeFactory], remove: Callable[[list[AbstractElement]], None]):
+        self.__arrow = arrow
+        self.__shapes = shapes
+        self.__remove = remove
+
+    def layered(self, nodes: Sequence[AbstractElement], edges: Sequence[Edge], direction: str = "TB", layer_spacing: float = 80.0, node_spacing: float = 40.0, arrows: bool = True, previous: LayoutResult | None = None) -> LayoutResult:
+        """Arrange a directed graph in layers, e.g. a dependency graph or a flowchart.
+
+        The nodes are placed in layers so that most edges point in the direction of the layout,
+        and the order within the layers is chosen to reduce edge crossings. Cycles are allowed,
+        some of their edges then point against the direction.
+
+        Args:
+            nodes (Sequence[AbstractElement]): The elements to arrange, e.g. rectangles or ellipses.
+            edges (Sequence[tuple[AbstractElement, AbstractElement]]): The edges as (source, target) pairs of the nodes.
+            direction (str): 'TB' (top to bottom), 'BT' (bottom to top), 'LR' (left to right) or 'RL' (right to left).
+                Defaults to 'TB'.
+            layer_spacing (float): The gap between neighbouring layers. Defaults to 80.
+            node_spacing (float): The gap between neighbouring nodes in a layer. Defaults to 40.
+            arrows (bool): Whether to connect the edges with elbow arrows. Defaults to True.
+            previous (LayoutResult | None): The result of a previous layered layout to update. The previous order
+                within the layers is kept and new nodes are inserted next to their neighbours. Defaults to None.
+
+        Returns:
+            LayoutResult: The [LayoutResult](layoutresult.md) with the positions and arrows.
+
+        Raises:
+            ValueError: If the direction is unknown, a spacing is negative, an edge refers to an element not in the nodes,
+                or the previous result is from another layout.
+        """
+        self.__check_previous(previous, "layered")
+        engine = LayeredLayout(direction, layer_spacing, node_spacing)
+        index = self.__index(nodes)
+        edge_indices = self.__edge_indices(index, edges)
+
+        # The bends of long edges are anchored too, otherwise they would push the nodes of their layers aside
+        previous_bends = None
+        if previous is not None:
+            previous_bends = {(index[u], index[v]): bends for (u, v), bends in previous._bends().items() if u in index and v in index}
+        centers = engine.place([(node._width, node._height) for node in nodes], edge_indices, self.__previous_centers(nodes, previous), previous_bends)
+        moved, (dx, dy) = self.__move(nodes, centers, previous)
+        shift = dx if direction in ("TB", "BT") else dy
+        bends = {(nodes[u]._id, nodes[v]._id): [bend + shift for bend in chain] for (u, v), chain in engine.bends().items()}
+
+        # The directions are a part of the key, so an edge reversed since the previous layout gets a new arrow
+        start, end = Layout.ELBOWS[direction]
+        elbows: dict[tuple[str, str], tuple[str, str]] = {}
+        pairs = []
+        for (source, target), (u, v) in zip(edges, edge_indices):
+            elbow = elbows[source._id, target._id] = (end, start) if engine.is_reversed(u, v) else (start, end)
+            pairs.append(((source._id, target._id, *elbow), source, target))
+
+        def connect(arrow: Arrow | None, source: AbstractElement, target: AbstractElement) -> Arrow:
+            return (arrow or self.__arrow().elbow(*elbows[source._id, target._id])).bind(source, target)
+
+        return LayoutResult("layered", list(nodes), [node.center() for node in nodes], self.__connect(pairs, arrows, moved, previous, connect), bends=bends)
+
+    def force(self, nodes: Sequence[AbstractElement], edges: Sequence[Edge], iterations: int = ForceLayout.DEFAULT_ITERATIONS, spacing: float = 40.0, seed: int = 0, arrows: bool = True, previous: LayoutResult | None = None) -> LayoutResult:
+        """Arrange an undirected graph by simulating forces, e.g. a network map or a social graph.
+
+        Connected nodes attract each other and all nodes repel each other, so clusters of the graph
+        end up close together. Overlapping nodes are then moved apart using their sizes.
+        The computation takes O(n log n) per iteration and uses NumPy if it is installed.
+
+        Args:
+            nodes (Sequence[AbstractElement]): The elements to arrange, e.g. rectangles or ellipses.
+            edges (Sequence[tuple[AbstractElement, AbstractElement]]): The edges as pairs of the nodes.
+            iterations (int): The number of simulation steps. More steps give a calmer layout. Defaults to 100.
+            spacing (float): Added to the average node size to get the ideal edge length.
+                Nodes are kept at least half of it apart. Defaults to 40.
+            seed (int): The seed of the random initial positions. The same seed gives the same layout. Defaults to 0.
+            arrows (bool): Whether to connect the edges with straight arrows without arrowheads. Defaults to True.
+            previous (LayoutResult | None): The result of a previous force layout to update. The simulation starts
+                from the previous positions and moves the nodes only a little. Fewer iterations are usually enough.
+                Defaults to None.
+
+        Returns:
+            LayoutResult: The [LayoutResult](layoutresult.md) with the positions and arrows.
+
+        Raises:
+            ValueError: If the number of iterations or the spacing is negative, an edge refers to an element not in the nodes,
+                or the previous result is from another layout.
+        """
+        self.__check_previous(previous, "force")
+        engine = ForceLayout(iterations, spacing, seed)
+        edge_indices = self.__edge_indices(self.__index(nodes), edges)
+
+        centers = engine.place([(node._width, node._height) for node in nodes], edge_indices, self.__previous_centers(nodes, previous))
+        moved, _ = self.__move(nodes, centers, previous)
+
+        def connect(arrow: Arrow | None, source: AbstractElement, target: AbstractElement) -> Arrow:
+            return (arrow or self.__arrow().arrowheads(None, None)).bind(source, target)
+
+        pairs = [((source._id, target._id), source, target) for source, target in edges]
+        return LayoutResult("force", list(nodes), [node.center() for node in nodes], self.__connect(pairs, arrows, moved, previous, connect))
+
+    def tree(self, tree: dict[str, Any], direction: str = "TB", shape: str = "rectangle", level_spacing: float = 80.0, sibling_spacing: float = 20.0, padding: float = 10.0, arrows: bool = True, previous: LayoutResult | None = None) -> LayoutResult:
+        """Create the nodes of a tree, e.g. a mind map or an organization chart, and arrange them.
+
+        The tree is given by nested dicts of labels. The value of a label are its children: a dict, a list of labels
+        (or dicts), a single label, or None for a leaf, e.g. `{"Root": {"A": ["A1", "A2"], "B": None}}`.
+        Each node is a shape sized to its measured label. Parents are centered over their children and subtrees
+        are packed tightly (Reingold-Tilford, in linear time), so trees with tens of thousands of nodes are fine.
+
+        Args:
+            tree (dict[str, Any]): The tree with a single root label.
+            direction (str): 'TB' (top to bottom), 'BT', 'LR' (left to right), 'RL', or 'radial' with the root
+                in the center and the levels on rings around it. Defaults to 'TB'.
+            shape (str): The shape of the nodes, 'rectangle', 'ellipse' or 'diamond'. Defaults to 'rectangle'.
+            level_spacing (float): The gap between neighbouring levels. Defaults to 80.
+            sibling_spacing (float): The gap between neighbouring nodes in a level. Defaults to 20.
+            padding (float): The space between the label and the shape. Defaults to 10.
+            arrows (bool): Whether to connect parents to their children with curved arrows. Defaults to True.
+            previous (LayoutResult | None): The result of a previous tree layout to update. Nodes with the same path
+                of labels from the root are kept with their ids, only new nodes are created, and the nodes
+                of removed branches are taken out of the scene. Defaults to None.
+
+        Returns:
+            LayoutResult: The [LayoutResult](layoutresult.md) with the nodes in pre-order (the root first),
+            their positions and the arrows.
+
+        Raises:
+            ValueError: If the tree does not have a single root or contains invalid children, the direction or shape is unknown,
+                a spacing is negative, or the previous result is from another layout.
+        """
+        if shape not in self.__shapes:
+            raise ValueError(f"Invalid shape '{shape}'. Use one of {', '.join(self.__shapes)}.")
+        self.__check_previous(previous, "tree")
+        engine = TreeLayout(direction, level_spacing, sibling_spacing)
+        labels, parents = self.__parse_tree(tree)
+        paths = self.__paths(labels, parents)
+
+        scale = Layout.SHAPE_SCALES[shape]
+        nodes = []
+        for label, path in zip(labels, paths):
+            node = previous._node_at(path) if previous is not None else None
+            if node is None or node._type != shape:
+                node = self.__shapes[shape](label)
+            text = node._get_label()  # type: ignore only labeled shapes are created
+            width = (text._width + 2 * (node.LABEL_HORIZONTAL_INSET + padding)) * scale  # type: ignore the label is set
+            height = (text._height + 2 * (node.LABEL_VERTICAL_INSET + padding)) * scale  # type: ignore
+            if (node._width, node._height) != (width, height):
+                node.size(width, height)
+            nodes.append(node)
+
+        if previous is not None:
+            kept = {node._id for node in nodes}
+            removed = [node for node in previous.nodes() if node._id not in kept]
+            if removed:
+                self.__remove(removed)
+
+        centers = engine.place([(node._width, node._height) for node in nodes], parents)
+        moved, _ = self.__move(nodes, centers, previous)
+
+        def connect(arrow: Arrow | None, parent: AbstractElement, child: AbstractElement) -> Arrow:
+            if direction != "radial":
+                return (arrow or self.__arrow().curve(*Layout.ELBOWS[direction])).bind(parent, child)
+            # The angles follow the direction from the parent to the child, setting them recomputes a bound arrow
+            (px, py), (cx, cy) = parent.center(), child.center()
+            start = math.atan2(cy - py, cx - px)
+            return arrow.curve(start, start + math.pi) if arrow else self.__arrow().curve(start, start + math.pi).bind(parent, child)
+
+        pairs = [((nodes[parent]._id, nodes[child]._id), nodes[parent], nodes[child]) for child, parent in enumerate(parents) if parent >= 0]
+        return LayoutResult("tree", nodes, [node.center() for node in nodes], self.__connect(pairs, arrows, moved, previous, connect), paths)
+
+    def pack(self, elements: Sequence[AbstractElement], width: float | None = None, frames: Sequence[Frame] | None = None, gutter: float = 20.0) -> LayoutResult:
+        """Pack elements of different sizes tightly, e.g. images and cards of a catalog board.
+
+        The elements are packed into a column of the given width, or into the frames one after another:
+        the first frame is filled, the elements that do not fit go to the next one, and so on.
+        The frames keep their size and position, each gets its elements with a single call of `Frame.elements()`.
+        Tens of thousands of elements are packed in a fraction of a second.
+
+        Args:
+            elements (Sequence[AbstractElement]): The elements to pack.
+            width (float | None): The width of the column to pack the elements into, with the top left corner at (0, 0).
+                Ignored if frames are given. Defaults to None.
+            frames (Sequence[Frame] | None): The frames to pack the elements into. They must have a size. Defaults to None.
+            gutter (float): The gap between the elements and between the elements and the sides of the frames. Defaults to 20.
+
+        Returns:
+            LayoutResult: The [LayoutResult](layoutresult.md) with the positions, it has no arrows.
+
+        Raises:
+            ValueError: If neither the width nor the frames are given, a frame has no size, the gutter is negative,
+                an element is wider than the column or a frame, or the elements do not fit into the frames.
+        """
+        engine = PackLayout(gutter)
+        self.__index(elements)
+        sizes = [(element._width, element._height) for element in elements]
+        if not frames:
+            if width is None:
+                raise ValueError("Give the width or the frames to pack the elements into.")
+            for element, center in zip(elements, engine.place(sizes, width)):
+                element.center(*center) # type: ignore the height is unlimited, all elements fit
+            return LayoutResult("pack", list(elements), [element.center() for element in elements], [])
+
+        if any(frame._width <= 0 or frame._height <= 0 for frame in frames):
+            raise ValueError("The frames to pack the elements into must have a size.")
+        placed = engine.place_into(sizes, [(frame._width - 2 * gutter, frame._height - 2 * gutter) for frame in frames])
+        missing = sum(1 for found in placed if found is None)
+        if missing:
+            raise ValueError(f"{missing} of the elements do not fit into the frames.")
+
+        inside: list[list[AbstractElement]] = [[] for _ in frames]
+        for element, (area, (x, y)) in zip(elements, placed): # type: ignore all elements fit
+            element.center(frames[area]._x + gutter + x, frames[area]._y + gutter + y)
+            inside[area].append(element)
+        for frame, contained in zip(frames, inside):
+            if contained:
+                frame.elements(*contained)
+        return LayoutResult("pack", list(elements), [element.center() for element in elements], [])
+
+    def __check_previous(self, previous: LayoutResult | None, kind: str) -> None:
+        if previous is not None and previous._kind() != kind:
+            raise ValueError(f"The previous result is from the {previous._kind()} layout, not from the {kind} layout.")
+
+    @staticmethod
+    def __previous_centers(nodes: Sequence[AbstractElement], previous: LayoutResult | None) -> list[tuple[float, float] | None] | None:
+        return None if previous is None else [previous._center(node._id) for node in nodes]
+
+    @staticmethod
+    def __move(nodes: Sequence[AbstractElement], centers: list[tuple[float, float]], previous: LayoutResult | None) -> tuple[set[str], tuple[float, float]]:
+        """Write the centers to the nodes and get the ids of the nodes whose outline changed, and the translation of the centers.
+
+        With a previous result the centers are first translated by the median displacement of the known nodes,
+        so nodes the changes did not affect stay where they were, even if the changes moved the edge of the layout.
+        """
+        dx = dy = 0.0
+        if previous is not None:
+            known = [(center, anchor) for node, center in zip(nodes, centers) if (anchor := previous._center(node._id)) is not None]
+            if known:
+                dx = statistics.median(anchor[0] - center[0] for center, anchor in known)
+                dy = statistics.median(anchor[1] - center[1] for center, anchor in known)
+                centers = [(x + dx, y + dy) for x, y in centers]
+
+        moved = set()
+        for node, (x, y) in zip(nodes, centers):
+            cx, cy = node.center()
+            unchanged = previous is not None and previous._size(node._id) == (node._width, node._height)
+            if unchanged and math.isclose(cx, x, abs_tol=Layout.TOLERANCE) and math.isclose(cy, y, abs_tol=Layout.TOLERANCE):
+                continue
+            node.center(x, y)
+            moved.add(node._id)
+        return moved, (dx, dy)
+
+    def __connect(self, pairs: list[tuple[EdgeKey, AbstractElement, AbstractElement]], arrows: bool, moved: set[str], previous: LayoutResult | None, connect: Connect) -> list[tuple[EdgeKey, Arrow | None]]:
+        """Connect the edges, reusing the arrows of the previous result and removing those of the edges that are gone."""
+        available = previous._edge_arrows() if previous is not None else {}
+        connected: list[tuple[EdgeKey, Arrow | None]] = []
+        for key, source, target in pairs:
+            arrow = None
+            if arrows and source is not target:
+                reused = available.get(key)
+                if reused:
+                    arrow = reused.pop(0)
+                    if source._id in moved or target._id in moved:
+                        connect(arrow, source, target)
+                else:
+                    arrow = connect(None, source, target)
+            connected.append((key, arrow))
+
+        stale = [arrow for remaining in available.values() for arrow in remaining]
+        if stale:
+            self.__remove(stale) # type: ignore arrows are elements
+        return connected
+
+    @staticmethod
+    def __parse_tree(tree: dict[str, Any]) -> tuple[list[str], list[int]]:
+        """Flatten the nested tree to labels and parent indices in pre-order."""
+        if not isinstance(tree, dict) or len(tree) != 1:
+            raise ValueError("The tree must be a dict with a single root label.")
+
+        labels: list[str] = []
+        parents: list[int] = []
+        stack: list[tuple[Any, Any, int]] = [(label, children, -1) for label, children in tree.items()]
+        while stack:
+            label, children, parent = stack.pop()
+            labels.append(str(label))
+            parents.append(parent)
+            node = len(labels) - 1
+
+            match children:
+                case None:
+                    items = []
+                case dict():
+                    items = list(children.items())
+                case list() | tuple():
+                    items = []
+                    for child in children:
+                        items.extend(child.items() if isinstance(child, dict) else [(child, None)])
+                case str() | int() | float():
+                    items = [(children, None)]
+                case _:
+                    raise ValueError(f"Invalid children of '{label}'. Use a dict, a list, a label or None.")
+            stack.extend((child, grandchildren, node) for child, grandchildren in reversed(items))
+
+        return labels, parents
+
+    @staticmethod
+    def __paths(labels: list[str], parents: list[int]) -> list[tuple[str, ...]]:
+        """Identify the nodes by the labels on the path from the root, siblings with the same label are numbered."""
+        paths: list[tuple[str, ...]] = []
+        seen: dict[tuple[str, ...], int] = {}
+        for label, parent in zip(labels, parents):
+            path = (paths[parent] if parent >= 0 else ()) + (label,)
+            occurrence = seen.get(path, 0)
+            seen[path] = occurrence + 1
+            paths.append(path[:-1] + (f"{label}#{occurrence}",) if occurrence else path)
+        return paths
+
+    @staticmethod
+    def __index(nodes: Sequence[AbstractElement]) -> dict[str, int]:
+        index = {node._id: i for i, node in enumerate(nodes)}
+        if len(index) != len(nodes):
+            raise ValueError("The nodes of a layout must be distinct elements.")
+        return index
+
+    @staticmethod
+    def __edge_indices(index: dict[str, int], edges: Sequence[Edge]) -> list[tuple[int, int]]:
+        try:
+            return [(index[source._id], index[target._id]) for source, target in edges]
+        except KeyError:
+            raise ValueError("The edges of a layout must connect its nodes.") from None
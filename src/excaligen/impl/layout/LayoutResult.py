@@ -0,0 +1,85 @@
+"""
+Description: Result of an automatic layout.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from ..base.AbstractElement import AbstractElement
+from ..elements.Arrow import Arrow
+from ..geometry.Point import Point
+
+EdgeKey = tuple[str, str]
+
+class LayoutResult:
+    """The placement computed by a layout: the centers of the nodes and the arrows created for the edges.
+
+    The positions are already written to the elements, the result allows to inspect them
+    and to style the created arrows. Pass it as `previous` to the next call of the same layout
+    to update the placement incrementally.
+
+    > [!WARNING]
+    > Do not instantiate this class directly. It is returned by the methods of [Layout](layout.md).
+    """
+    def __init__(self, kind: str, nodes: list[AbstractElement], centers: list[Point], edges: list[tuple[EdgeKey, Arrow | None]], paths: list[tuple[str, ...]] | None = None, bends: dict[tuple[str, str], list[float]] | None = None):
+        self.__kind = kind
+        self.__nodes = nodes
+        self.__centers = {node._id: center for node, center in zip(nodes, centers)}
+        self.__sizes = {node._id: (node._width, node._height) for node in nodes}
+        self.__edges = edges
+        self.__paths = dict(zip(paths, nodes)) if paths is not None else {}
+        self.__bends = bends or {}
+
+    def nodes(self) -> list[AbstractElement]:
+        """Get the nodes of the layout, in the order they were given or, for `Layout.tree()`, created.
+
+        Returns:
+            list[AbstractElement]: The nodes.
+        """
+        return list(self.__nodes)
+
+    def position(self, element: AbstractElement) -> Point:
+        """Get the center the layout assigned to a node.
+
+        Args:
+            element (AbstractElement): A node passed to the layout.
+
+        Returns:
+            Point: The x and y coordinates of the center.
+
+        Raises:
+            ValueError: If the element is not a node of the layout.
+        """
+        if element._id not in self.__centers:
+            raise ValueError("The element is not a node of the layout.")
+        return self.__centers[element._id]
+
+    def arrows(self) -> list[Arrow]:
+        """Get the arrows created for the edges, in the order of the edges. Self-loops have no arrow.
+
+        Returns:
+            list[Arrow]: The arrows, empty if the layout was called with `arrows=False`.
+        """
+        return [arrow for _, arrow in self.__edges if arrow is not None]
+
+    def _kind(self) -> str:
+        return self.__kind
+
+    def _center(self, id: str) -> Point | None:
+        return self.__centers.get(id)
+
+    def _size(self, id: str) -> tuple[float, float] | None:
+        return self.__sizes.get(id)
+
+    def _node_at(self, path: tuple[str, ...]) -> AbstractElement | None:
+        return self.__paths.get(path)
+
+    def _bends(self) -> dict[tuple[str, str], list[float]]:
+        return self.__bends
+
+    def _edge_arrows(self) -> dict[EdgeKey, list[Arrow]]:
+        """Get the arrows by the ids of the nodes they connect, a fresh dict for the next layout to take them from."""
+        arrows: dict[EdgeKey, list[Arrow]] = {}
+        for key, arrow in self.__edges:
+            if arrow is not None:
+                arrows.setdefault(key, []).append(arrow)
+        return arrows
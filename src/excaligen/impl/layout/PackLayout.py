@@ -0,0 +1,144 @@
+"""
+Description: Packing of rectangles into a strip or a box.
+Implements the skyline bottom-left heuristic on the rectangles sorted by decreasing height.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from ..geometry.Point import Point
+from collections import deque
+import math
+
+class PackLayout:
+    """Packs rectangles of different sizes tightly, without overlaps and with a gutter between them.
+
+    The rectangles are placed from the highest one down, each at the lowest position where it fits,
+    the leftmost one of equal positions. The free space is tracked by the skyline, the upper outline
+    of the placed rectangles, as a list of horizontal segments. Gaps below the skyline are not reused,
+    which keeps the packing fast: sorting takes O(n log n), and a rectangle is placed in one pass over the skyline,
+    whose length is bounded by the number of rectangles that fit side by side.
+    """
+    # Tolerance of comparing the sides of the rectangles with the skyline
+    EPSILON = 1e-9
+
+    def __init__(self, gutter: float = 20.0):
+        if gutter < 0:
+            raise ValueError("The gutter must not be negative.")
+        self._gutter = gutter
+
+    def place(self, sizes: list[tuple[float, float]], width: float, height: float = math.inf) -> list[Point | None]:
+        """Compute the centers of the rectangles.
+
+        Args:
+            sizes (list[tuple[float, float]]): The width and height of each rectangle.
+            width (float): The width of the area.
+            height (float): The height of the area. Defaults to unlimited.
+
+        Returns:
+            list[Point | None]: The centers of the rectangles, with the top left corner of the area at (0, 0),
+            None for those that do not fit.
+
+        Raises:
+            ValueError: If a rectangle is wider than the area.
+        """
+        return [None if placed is None else placed[1] for placed in self.place_into(sizes, [(width, height)])]
+
+    def place_into(self, sizes: list[tuple[float, float]], areas: list[tuple[float, float]]) -> list[tuple[int, Point] | None]:
+        """Compute the centers of the rectangles in several areas, filled one after another.
+
+        Args:
+            sizes (list[tuple[float, float]]): The width and height of each rectangle.
+            areas (list[tuple[float, float]]): The width and height of each area.
+
+        Returns:
+            list[tuple[int, Point] | None]: The index of the area and the center in it, with the top left corner
+            of the area at (0, 0), for each rectangle, None for those that do not fit into any area.
+
+        Raises:
+            ValueError: If a rectangle is wider than the widest area.
+        """
+        gutter = self._gutter
+        widest = max((width for width, _ in areas), default=-math.inf)
+        if any(w > widest for w, _ in sizes):
+            raise ValueError("An element is wider than the area to pack it into.")
+
+        placed: list[tuple[int, Point] | None] = [None] * len(sizes)
+        remaining = sorted(range(len(sizes)), key=lambda node: (-sizes[node][1], -sizes[node][0]))
+        narrowest = min((w for w, _ in sizes), default=0.0) + gutter
+        lowest_height = min((h for _, h in sizes), default=0.0) + gutter
+        for area, (width, height) in enumerate(areas):
+            if not remaining:
+                break
+            # Each rectangle takes the gutter at its right and bottom side, so the area is larger by one gutter
+            limit_x, limit_y = width + gutter, height + gutter
+            skyline: list[list[float]] = [[0.0, limit_x, 0.0]]  # x, width and y of the segments, left to right
+
+            # The skyline only rises, so a rectangle at least as wide as one of the same height that did not fit cannot fit either
+            narrowest_failed, failed_height = math.inf, None
+            failed = []
+            for i, node in enumerate(remaining):
+                w, h = sizes[node][0] + gutter, sizes[node][1] + gutter
+                if h != failed_height:
+                    narrowest_failed = math.inf
+                found = self.__lowest(skyline, w, limit_x) if w < narrowest_failed else None
+                if found is None or found[1] + h > limit_y:
+                    narrowest_failed, failed_height = min(narrowest_failed, w), h
+                    failed.append(node)
+                    # Nothing fits once the narrowest and lowest rectangle does not
+                    lowest = self.__lowest(skyline, narrowest, limit_x)
+                    if lowest is None or lowest[1] + lowest_height > limit_y:
+                        failed.extend(remaining[i + 1:])
+                        break
+                    continue
+                index, y = found
+                x = skyline[index][0]
+                self.__raise(skyline, index, x, w, y + h)
+                placed[node] = (area, (x + sizes[node][0] / 2, y + sizes[node][1] / 2))
+            remaining = failed
+        return placed
+
+    @staticmethod
+    def __lowest(skyline: list[list[float]], w: float, limit_x: float) -> tuple[int, float] | None:
+        """Find the segment to start the rectangle at, and its y, the highest segment under the rectangle.
+
+        The end of the window under the rectangle only moves right, and a deque of the segments in the window
+        by decreasing y gives the highest one, so the whole skyline is scanned once.
+        """
+        best: tuple[int, float] | None = None
+        window: deque[int] = deque()
+        end = 0
+        for start in range(len(skyline)):
+            left = skyline[start][0]
+            if left + w > limit_x + PackLayout.EPSILON:
+                break
+            while end < len(skyline) and (end <= start or skyline[end][0] < left + w - PackLayout.EPSILON):
+                while window and skyline[window[-1]][2] <= skyline[end][2]:
+                    window.pop()
+                window.append(end)
+                end += 1
+            while window[0] < start:
+                window.popleft()
+            y = skyline[window[0]][2]
+            if best is None or y < best[1]:
+                best = (start, y)
+        return best
+
+    @staticmethod
+    def __raise(skyline: list[list[float]], index: int, x: float, w: float, top: float) -> None:
+        """Replace the skyline under the placed rectangle by its top side."""
+        right = x + w
+        end = index
+        while end < len(skyline) and skyline[end][0] + skyline[end][1] <= right + PackLayout.EPSILON:
+            end += 1
+        # The last segment under the rectangle may stick out to the right
+        if end < len(skyline) and skyline[end][0] < right:
+            segment = skyline[end]
+            segment[1] -= right - segment[0]
+            segment[0] = right
+        skyline[index:end] = [[x, w, top]]
+
+        # Neighbours of the same height are merged to keep the skyline short
+        for neighbour in (index + 1, index):
+            if 0 < neighbour < len(skyline) and skyline[neighbour - 1][2] == skyline[neighbour][2]:
+                skyline[neighbour - 1][1] += skyline[neighbour][1]
+                del skyline[neighbour]
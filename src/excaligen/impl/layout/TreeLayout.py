@@ -0,0 +1,247 @@
+"""
+Description: Tidy layout of trees in linear time.
+Implements the Walker algorithm as improved by Buchheim, Jünger and Leipert, generalized to nodes of different sizes,
+with layered and radial placement of the levels.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+from ..geometry.Point import Point
+import math
+
+class TreeLayout:
+    """Places the nodes of a rooted tree so that levels are aligned, parents are centered above their children
+    and subtrees are packed as close as their contours allow.
+
+    The subtrees are compared only along their contours, which are followed through threads,
+    and the shifts of subtrees are accumulated lazily, so the whole layout takes O(n).
+    Both walks over the tree are iterative, deep trees do not hit the recursion limit.
+
+    For the radial variant, the tidy layout is wrapped around the root: the position in the level becomes
+    an angle and the level becomes a ring, with the radius large enough to keep neighbours apart.
+    """
+    DIRECTIONS = ("TB", "BT", "LR", "RL", "radial")
+
+    def __init__(self, direction: str = "TB", level_spacing: float = 80.0, sibling_spacing: float = 20.0):
+        if direction not in TreeLayout.DIRECTIONS:
+            raise ValueError(f"Invalid direction '{direction}'. Use one of {', '.join(TreeLayout.DIRECTIONS)}.")
+        if level_spacing < 0 or sibling_spacing < 0:
+            raise ValueError("The spacing must not be negative.")
+        self._direction = direction
+        self._level_spacing = level_spacing
+        self._sibling_spacing = sibling_spacing
+
+    def place(self, sizes: list[tuple[float, float]], parents: list[int]) -> list[Point]:
+        """Compute the centers of the nodes.
+
+        Args:
+            sizes (list[tuple[float, float]]): The width and height of each node.
+            parents (list[int]): The parent of each node in pre-order, -1 for the root at index 0.
+
+        Returns:
+            list[Point]: The centers of the nodes. For the radial variant the root is at (0, 0),
+            otherwise the top left corner of the layout is at (0, 0).
+        """
+        count = len(sizes)
+        if count == 0:
+            return []
+        if parents[0] != -1 or any(not 0 <= parent < node for node, parent in enumerate(parents) if node):
+            raise ValueError("The nodes must be in pre-order with the root first.")
+
+        self.__children: list[list[int]] = [[] for _ in range(count)]
+        for node in range(1, count):
+            self.__children[parents[node]].append(node)
+        self.__depth = [0] * count
+        for node in range(1, count):
+            self.__depth[node] = self.__depth[parents[node]] + 1
+
+        match self._direction:
+            case "TB" | "BT":
+                self.__across = [w for w, _ in sizes]
+                along = [h for _, h in sizes]
+            case "LR" | "RL":
+                self.__across = [h for _, h in sizes]
+                along = [w for w, _ in sizes]
+            case _:
+                # The orientation of the nodes on a ring varies, so they are kept apart by their larger side
+                self.__across = [max(w, h) for w, h in sizes]
+                along = self.__across
+
+        x = self.__tidy(parents)
+        levels = max(self.__depth) + 1
+        thickness = [0.0] * levels
+        for node in range(count):
+            thickness[self.__depth[node]] = max(thickness[self.__depth[node]], along[node])
+
+        if self._direction == "radial":
+            return self.__radial(x, thickness)
+
+        level_position, position = [], 0.0
+        for level, t in enumerate(thickness):
+            position += t / 2 if level == 0 else (thickness[level - 1] + t) / 2 + self._level_spacing
+            level_position.append(position)
+
+        centers = []
+        for node in range(count):
+            across, level = x[node], level_position[self.__depth[node]]
+            match self._direction:
+                case "TB":
+                    centers.append((across, level))
+                case "BT":
+                    centers.append((across, -level))
+                case "LR":
+                    centers.append((level, across))
+                case _:
+                    centers.append((-level, across))
+
+        min_x = min(cx - w / 2 for (cx, _), (w, _) in zip(centers, sizes))
+        min_y = min(cy - h / 2 for (_, cy), (_, h) in zip(centers, sizes))
+        return [(cx - min_x, cy - min_y) for cx, cy in centers]
+
+    def __separation(self, left: int, right: int) -> float:
+        return (self.__across[left] + self.__across[right]) / 2 + self._sibling_spacing
+
+    def __tidy(self, parents: list[int]) -> list[float]:
+        """Compute the positions within the levels, the first walk in post-order and the second one in pre-order."""
+        count = len(parents)
+        children = self.__children
+        self.__prelim = [0.0] * count
+        self.__mod = [0.0] * count
+        self.__shift = [0.0] * count
+        self.__change = [0.0] * count
+        self.__thread: list[int | None] = [None] * count
+        self.__ancestor = list(range(count))
+        self.__number = [0] * count
+        self.__left_sibling: list[int | None] = [None] * count
+        self.__parents = parents
+        for siblings in children:
+            for number, node in enumerate(siblings):
+                self.__number[node] = number
+                self.__left_sibling[node] = siblings[number - 1] if number else None
+
+        # The pre-order of the input reversed visits all children before their parent
+        midpoint = [0.0] * count
+        for node in range(count - 1, -1, -1):
+            if children[node]:
+                default_ancestor = children[node][0]
+                for child in children[node]:
+                    self.__place_next_to_sibling(child, midpoint[child])
+                    default_ancestor = self.__apportion(child, default_ancestor)
+                self.__execute_shifts(node)
+                midpoint[node] = (self.__prelim[children[node][0]] + self.__prelim[children[node][-1]]) / 2
+        self.__place_next_to_sibling(0, midpoint[0])
+
+        x = [0.0] * count
+        modifier_sum = [0.0] * count
+        for node in range(count):
+            parent = parents[node]
+            modifier_sum[node] = modifier_sum[parent] + self.__mod[parent] if node else 0.0
+            x[node] = self.__prelim[node] + modifier_sum[node]
+        return x
+
+    def __place_next_to_sibling(self, node: int, midpoint: float) -> None:
+        sibling = self.__left_sibling[node]
+        if sibling is None:
+            self.__prelim[node] = midpoint
+        else:
+            self.__prelim[node] = self.__prelim[sibling] + self.__separation(sibling, node)
+            if self.__children[node]:
+                self.__mod[node] = self.__prelim[node] - midpoint
+
+    def __next_left(self, node: int) -> int | None:
+        return self.__children[node][0] if self.__children[node] else self.__thread[node]
+
+    def __next_right(self, node: int) -> int | None:
+        return self.__children[node][-1] if self.__children[node] else self.__thread[node]
+
+    def __apportion(self, node: int, default_ancestor: int) -> int:
+        """Push the subtree of the node right of its left siblings, comparing the contours level by level."""
+        sibling = self.__left_sibling[node]
+        if sibling is None:
+            return default_ancestor
+
+        prelim, mod = self.__prelim, self.__mod
+        # The inner and outer contours of the subtree of the node and of its left siblings
+        inner_right = outer_right = node
+        inner_left = sibling
+        outer_left = self.__children[self.__parents[node]][0]
+        shift_inner_right, shift_outer_right = mod[inner_right], mod[outer_right]
+        shift_inner_left, shift_outer_left = mod[inner_left], mod[outer_left]
+
+        next_inner_left, next_inner_right = self.__next_right(inner_left), self.__next_left(inner_right)
+        while next_inner_left is not None and next_inner_right is not None:
+            inner_left, inner_right = next_inner_left, next_inner_right
+            outer_left = self.__next_left(outer_left)  # type: ignore the outer contours are at least as deep
+            outer_right = self.__next_right(outer_right)  # type: ignore
+            self.__ancestor[outer_right] = node
+            shift = prelim[inner_left] + shift_inner_left - (prelim[inner_right] + shift_inner_right) + self.__separation(inner_left, inner_right)
+            if shift > 0:
+                self.__move_subtree(self.__greatest_distinct_ancestor(inner_left, node, default_ancestor), node, shift)
+                shift_inner_right += shift
+                shift_outer_right += shift
+            shift_inner_left += mod[inner_left]
+            shift_inner_right += mod[inner_right]
+            shift_outer_left += mod[outer_left]
+            shift_outer_right += mod[outer_right]
+            next_inner_left, next_inner_right = self.__next_right(inner_left), self.__next_left(inner_right)
+
+        if next_inner_left is not None and self.__next_right(outer_right) is None:
+            self.__thread[outer_right] = next_inner_left
+            mod[outer_right] += shift_inner_left - shift_outer_right
+        if next_inner_right is not None and self.__next_left(outer_left) is None:
+            self.__thread[outer_left] = next_inner_right
+            mod[outer_left] += shift_inner_right - shift_outer_left
+            default_ancestor = node
+        return default_ancestor
+
+    def __greatest_distinct_ancestor(self, inner_left: int, node: int, default_ancestor: int) -> int:
+        ancestor = self.__ancestor[inner_left]
+        return ancestor if self.__parents[ancestor] == self.__parents[node] else default_ancestor
+
+    def __move_subtree(self, left: int, right: int, shift: float) -> None:
+        # The shift is spread over the subtrees in between by execute_shifts
+        subtrees = self.__number[right] - self.__number[left]
+        self.__change[right] -= shift / subtrees
+        self.__shift[right] += shift
+        self.__change[left] += shift / subtrees
+        self.__prelim[right] += shift
+        self.__mod[right] += shift
+
+    def __execute_shifts(self, node: int) -> None:
+        shift = change = 0.0
+        for child in reversed(self.__children[node]):
+            self.__prelim[child] += shift
+            self.__mod[child] += shift
+            change += self.__change[child]
+            shift += self.__shift[child] + change
+
+    def __radial(self, x: list[float], thickness: list[float]) -> list[Point]:
+        """Wrap the levels around the root, x becomes the angle and the level the radius."""
+        count = len(x)
+        if count == 1:
+            return [(0.0, 0.0)]
+
+        levels: list[list[int]] = [[] for _ in thickness]
+        for node in range(count):
+            levels[self.__depth[node]].append(node)
+
+        # A full turn spans all nodes plus the gap between the last and the first one
+        low = min(x[node] - self.__across[node] / 2 for node in range(1, count))
+        high = max(x[node] + self.__across[node] / 2 for node in range(1, count))
+        circumference = high - low + self._sibling_spacing
+        angle = [2 * math.pi * (x[node] - low) / circumference for node in range(count)]
+
+        radius = [0.0] * len(levels)
+        for level in range(1, len(levels)):
+            required = radius[level - 1] + (thickness[level - 1] + thickness[level]) / 2 + self._level_spacing
+            nodes = sorted(levels[level], key=angle.__getitem__)
+            for left, right in zip(nodes, nodes[1:] + nodes[:1]):
+                if left == right:
+                    continue
+                gap = (angle[right] - angle[left]) % (2 * math.pi)
+                # Neighbours on the ring must be a separation apart along the chord
+                if 0 < gap < math.pi:
+                    required = max(required, self.__separation(left, right) / (2 * math.sin(gap / 2)))
+            radius[level] = required
+
+        return [(radius[self.__depth[node]] * math.cos(angle[node]), radius[self.__depth[node]] * math.sin(angle[node])) for node in range(count)]
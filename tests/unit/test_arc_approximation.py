@@ -0,0 +1,89 @@
+"""
+Description: Unit tests for the tolerance based arc approximation.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import math
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.geometry.ArcApproximation import ArcApproximation
+
+def max_deviation(points, center, radius) -> float:
+    """The largest distance of the chord midpoints from the circle."""
+    cx, cy = center
+    deviation = 0.0
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        mx, my = (x1 + x2) / 2, (y1 + y2) / 2
+        deviation = max(deviation, radius - math.hypot(mx - cx, my - cy))
+    return deviation
+
+@pytest.mark.parametrize("radius, span, tolerance", [
+    (10, math.pi / 2, 0.1),
+    (500, 2 * math.pi, 0.5),
+    (2000, -math.pi / 3, 0.25),
+    (3, math.pi, 1),
+])
+def test_sample_within_tolerance(radius, span, tolerance):
+    points = ArcApproximation.sample((50, -20), radius, 0.3, span, tolerance)
+
+    assert max_deviation(points, (50, -20), radius) <= tolerance + 1e-9
+    for x, y in points:
+        assert math.hypot(x - 50, y + 20) == pytest.approx(radius)
+    assert points[-1] == pytest.approx((50 + radius * math.cos(0.3 + span), -20 + radius * math.sin(0.3 + span)))
+
+def test_sample_is_minimal():
+    segments = ArcApproximation.segment_count(500, math.pi, 0.5)
+    points = ArcApproximation.sample((0, 0), 500, 0, math.pi, 0.5)
+    assert len(points) == segments + 1
+
+    fewer = [(500 * math.cos(math.pi * i / (segments - 1)), 500 * math.sin(math.pi * i / (segments - 1))) for i in range(segments)]
+    assert max_deviation(fewer, (0, 0), 500) > 0.5
+
+def test_point_count_follows_curvature():
+    # Large arcs need fewer points than the fixed spacing, small arcs need more
+    large = ArcApproximation.generate_points((0, 0), 1000, (1000, 0), (0, 1000), tolerance=1)
+    large_default = ArcApproximation.generate_points((0, 0), 1000, (1000, 0), (0, 1000))
+    small = ArcApproximation.generate_points((0, 0), 20, (20, 0), (0, 20), tolerance=0.05)
+    small_default = ArcApproximation.generate_points((0, 0), 20, (20, 0), (0, 20))
+
+    assert len(large) < len(large_default)
+    assert len(small) > len(small_default)
+
+def test_invalid_tolerance():
+    with pytest.raises(ValueError):
+        ArcApproximation.sample((0, 0), 10, 0, math.pi, 0)
+    with pytest.raises(ValueError):
+        SceneBuilder().line().arc(0, 0, 10, 0, math.pi, tolerance=-1)
+    with pytest.raises(ValueError):
+        SceneBuilder().arrow().arc(100, tolerance=0)
+
+def test_line_arc_with_tolerance():
+    line = SceneBuilder().line().arc(0, 0, 100, 0, math.pi / 2, tolerance=0.5)
+    points = [(line._x + x, line._y + y) for x, y in line._points]
+
+    assert points[0] == pytest.approx((100, 0))
+    assert points[-1] == pytest.approx((0, 100), abs=1e-9)
+    assert max_deviation(points, (0, 0), 100) <= 0.5 + 1e-9
+
+def test_tolerance_does_not_change_the_arc():
+    # A span over a half turn draws the shorter arc, with or without the tolerance
+    sampled = SceneBuilder().line().arc(0, 0, 100, 0, 1.5 * math.pi, tolerance=0.5)
+    default = SceneBuilder().line().arc(0, 0, 100, 0, 1.5 * math.pi)
+    for line in (sampled, default):
+        points = [(line._x + x, line._y + y) for x, y in line._points]
+        assert points[0] == pytest.approx((100, 0))
+        assert points[-1] == pytest.approx((0, -100), abs=1e-9)
+        assert all(x >= -1e-9 and y <= 1e-9 for x, y in points)  # The quarter turn clockwise
+    assert len(sampled._points) != len(default._points)
+
+def test_arrow_arc_with_tolerance():
+    scene = SceneBuilder()
+    start = scene.ellipse().size(20, 20).center(0, 0)
+    end = scene.ellipse().size(20, 20).center(600, 0)
+    coarse = scene.arrow().arc(400, tolerance=2).bind(start, end)
+    default = scene.arrow().arc(400).bind(start, end)
+
+    assert len(coarse._points) < len(default._points)
+    assert coarse._points[0] == default._points[0]
+    assert coarse._points[-1] == pytest.approx(default._points[-1])
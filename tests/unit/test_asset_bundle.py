@@ -0,0 +1,110 @@
+"""
+Description: Unit tests for asset bundles.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import base64
+import io
+import json
+import pickle
+import struct
+import tarfile
+import zipfile
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.images.AssetBundle import AssetBundle
+
+def svg(width: int, height: int) -> bytes:
+    return f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}"></svg>'.encode("utf-8")
+
+PNG = b'\x89PNG\r\n\x1a\n' + struct.pack(">I4sII", 13, b"IHDR", 30, 20) + bytes(32)
+
+ASSETS = {
+    "icons/robot.svg": svg(24, 16),
+    "icons/photo.png": PNG,
+    "icons/large.svg": svg(64, 64) + b" " * 100_000,
+    "logo.svg": svg(10, 10),
+    "logo.png": PNG,
+}
+
+@pytest.fixture(params=["stored", "deflated", "tar"])
+def bundle_path(request, tmp_path):
+    path = tmp_path / f"assets.{'tar' if request.param == 'tar' else 'zip'}"
+    if request.param == "tar":
+        with tarfile.open(path, "w") as archive:
+            for name, data in ASSETS.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+    else:
+        compression = zipfile.ZIP_STORED if request.param == "stored" else zipfile.ZIP_DEFLATED
+        with zipfile.ZipFile(path, "w", compression) as archive:
+            archive.writestr("icons/", b"")
+            for name, data in ASSETS.items():
+                archive.writestr(name, data)
+    return str(path)
+
+def test_bundle_reads_members(bundle_path):
+    with AssetBundle(bundle_path) as bundle:
+        assert bundle.names() == list(ASSETS)
+        for name, data in ASSETS.items():
+            assert bundle.read(name) == data
+
+def test_bundle_aliases(bundle_path):
+    with AssetBundle(bundle_path) as bundle:
+        assert bundle.resolve("icons/robot") == "icons/robot.svg"
+        assert "icons/photo" in bundle
+        # Ambiguous without the extension
+        assert "logo" not in bundle
+        with pytest.raises(KeyError):
+            bundle.read("logo")
+
+def test_unsupported_bundle(tmp_path):
+    path = tmp_path / "assets.zip"
+    path.write_bytes(b"not an archive" * 100)
+    with pytest.raises(ValueError, match="Unsupported asset bundle"):
+        AssetBundle(str(path))
+
+def test_image_asset(bundle_path):
+    scene = SceneBuilder().assets(bundle_path)
+    robot = scene.image().asset("icons/robot")
+    photo = scene.image().asset("icons/photo.png")
+    another_robot = scene.image().asset("icons/robot")
+
+    assert robot.size() == (24, 16)
+    assert photo.size() == (30, 20)
+    assert robot._file_id == another_robot._file_id != photo._file_id
+    assert len(scene._files) == 2
+
+    icons = [scene.image().asset("icons/robot.svg") for _ in range(100)]
+    document = json.loads(scene.json())
+    assert len(document["files"]) == 2  # One entry per asset, not per use
+    assert {icon._file_id for icon in icons} == {robot._file_id}
+
+    another_robot.data(svg(8, 8).decode("utf-8"))  # The other images keep the asset
+    assert another_robot._file_id != robot._file_id
+    assert scene._files[robot._file_id]["dataURL"].width == 24
+
+    data_url = scene._files[photo._file_id]["dataURL"].data_url
+    assert data_url == "data:image/png;base64," + base64.b64encode(PNG).decode("ascii")
+
+def test_image_asset_from_later_bundle(bundle_path, tmp_path):
+    other_path = tmp_path / "other.zip"
+    with zipfile.ZipFile(other_path, "w") as archive:
+        archive.writestr("extra/star.svg", svg(5, 7))
+
+    scene = SceneBuilder().assets(bundle_path).assets(str(other_path))
+    assert scene.image().asset("extra/star").size() == (5, 7)
+
+def test_image_asset_not_found(bundle_path):
+    scene = SceneBuilder().assets(bundle_path)
+    with pytest.raises(ValueError, match="not found"):
+        scene.image().asset("icons/missing")
+
+def test_scene_with_bundle_is_picklable(bundle_path):
+    scene = SceneBuilder().assets(bundle_path)
+    scene.image().asset("icons/robot")
+    copy = pickle.loads(pickle.dumps(scene))
+    copy.image().asset("logo.svg")
+    assert len(copy._files) == 2
@@ -0,0 +1,56 @@
+"""
+Description: Unit tests for the circle and ellipse intersection.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import math
+import random
+from excaligen.impl.geometry.CircleIntersection import CircleIntersection
+
+def on_both(points, dx, dy, R, a, b, angle):
+    for x, y in points:
+        assert math.hypot(x - dx, y - dy) == pytest.approx(R, abs=1e-9)
+        c, s = math.cos(-angle), math.sin(-angle)
+        xr, yr = x * c - y * s, x * s + y * c
+        assert (xr / a) ** 2 + (yr / b) ** 2 == pytest.approx(1, abs=1e-9)
+
+def test_four_intersections():
+    points = CircleIntersection.with_ellipse(0, 0, 50, 80, 30, 0)
+    assert len(points) == 4
+    on_both(points, 0, 0, 50, 80, 30, 0)
+
+def test_intersection_at_half_turn():
+    # The circle passes through (-a, 0), where tan(theta / 2) is infinite
+    points = CircleIntersection.with_ellipse(-100, 0, 60, 40, 20, 0)
+    assert points == [pytest.approx((-40, 0))]
+
+def test_tangent_circle():
+    points = CircleIntersection.with_ellipse(0, 0, 80, 80, 30, 0)
+    assert sorted(points) == [pytest.approx((-80, 0), abs=1e-6), pytest.approx((80, 0), abs=1e-6)]
+
+def test_no_intersection():
+    assert CircleIntersection.with_ellipse(0, 0, 10, 80, 30, 0) == []
+    assert CircleIntersection.with_ellipse(500, 0, 10, 80, 30, 0.3) == []
+
+def test_randomized_intersections():
+    rng = random.Random(3)
+    for _ in range(300):
+        a, b, angle = rng.uniform(10, 200), rng.uniform(10, 200), rng.uniform(-math.pi, math.pi)
+        dx, dy, R = rng.uniform(-300, 300), rng.uniform(-300, 300), rng.uniform(20, 500)
+        points = CircleIntersection.with_ellipse(dx, dy, R, a, b, angle)
+        on_both(points, dx, dy, R, a, b, angle)
+
+        # The count follows the sign changes of the distance from the circle along the ellipse
+        thetas = [i * 2 * math.pi / 3600 for i in range(3600)]
+        signs = [math.hypot(a * math.cos(t) - dx * math.cos(angle) - dy * math.sin(angle),
+                            b * math.sin(t) + dx * math.sin(angle) - dy * math.cos(angle)) > R for t in thetas]
+        assert len(points) == sum(s1 != s2 for s1, s2 in zip(signs, signs[1:] + signs[:1]))
+
+def test_polynomial_roots():
+    assert CircleIntersection.polynomial_roots([1, 0, -5, 0, 4]) == pytest.approx([-2, -1, 1, 2])
+    assert CircleIntersection.polynomial_roots([1, -6, 11, -6]) == pytest.approx([1, 2, 3])
+    assert CircleIntersection.polynomial_roots([1, 0, 1]) == []
+    assert CircleIntersection.polynomial_roots([0, 2, -4]) == pytest.approx([2])
+    assert CircleIntersection.polynomial_roots([1, -2, 1]) == pytest.approx([1])
@@ -179,3 +179,52 @@ def test_chaining():
     c = Color().rgb(255, 0, 0).lighten(10).darken(5)
     # 50 -> 60 -> 55
     assert c.hsl() == (0, 100, 55)
+
+def test_color_name_lookup_is_cached():
+    Color._string.cache_clear()
+    assert Color.from_("darkslategrey") == "DarkSlateGrey"
+    assert Color.from_("darkslategrey") == "DarkSlateGrey"
+    assert Color.from_(" TRANSPARENT ") == "Transparent"
+    assert Color._string.cache_info().hits == 1
+
+    with pytest.raises(ValueError, match="Invalid color name"):
+        Color.from_("NotAColor")
+
+def test_color_ramp():
+    ramp = Color.ramp(["#FF0000", "#0000FF"], 5, "rgb")
+    assert [str(c) for c in ramp] == ["#FF0000", "#BF0040", "#800080", "#4000BF", "#0000FF"]
+
+    ramp = Color.ramp(["#FF0000", Color().rgb(0, 0, 255)], 3, "hsl")
+    assert [str(c) for c in ramp] == ["#FF0000", "#FF00FF", "#0000FF"]
+
+    ramp = Color.ramp(["#000000", "#FFFFFF"], 3)
+    assert [str(c) for c in ramp] == ["#000000", "#636363", "#FFFFFF"]
+
+def test_color_ramp_multiple_stops():
+    ramp = Color.ramp(["#FF0000", "#00FF00", "#0000FF"], 5, "rgb")
+    assert [str(c) for c in ramp] == ["#FF0000", "#808000", "#00FF00", "#008080", "#0000FF"]
+    assert [str(c) for c in Color.ramp(["#FF0000", "#00FF00"], 1)] == ["#FF0000"]
+
+def test_color_ramp_hue_takes_shorter_arc():
+    # Red (0) to magenta (300) goes through 330, not through green
+    ramp = Color.ramp(["#FF0000", "#FF00FF"], 3, "hsl")
+    assert ramp[1].hsl() == (330, 100, 50)
+
+def test_color_ramp_invalid():
+    with pytest.raises(ValueError):
+        Color.ramp(["#FF0000"], 5)
+    with pytest.raises(ValueError):
+        Color.ramp(["#FF0000", "#0000FF"], 0)
+    with pytest.raises(ValueError):
+        Color.ramp(["#FF0000", "#0000FF"], 5, "lab")
+    with pytest.raises(ValueError):
+        Color.ramp(["Red", "Blue"], 5)
+
+def test_color_categorical():
+    palette = Color.categorical(12)
+    assert len(palette) == 12
+    assert len({str(c) for c in palette}) == 12
+    assert [str(c) for c in palette[:3]] == [str(c) for c in Color.categorical(3)]
+
+    lightness = [Color._rgb_to_oklch(c.rgb())[0] for c in palette]
+    assert max(lightness) - min(lightness) < 0.01
@@ -0,0 +1,70 @@
+"""
+Description: Unit tests for creating elements of one scene from several threads.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import json
+import sys
+import threading
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.indexer.IndexBlocks import IndexBlocks
+from excaligen.impl.indexer.IndexGenerator import IndexGenerator
+
+THREADS = 16
+ELEMENTS = 500
+
+@pytest.fixture
+def fast_switching():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    yield
+    sys.setswitchinterval(interval)
+
+def run_threads(target):
+    barrier = threading.Barrier(THREADS)
+    def run(thread):
+        barrier.wait()
+        target(thread)
+    threads = [threading.Thread(target=run, args=(thread,)) for thread in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_single_thread_gets_generator_sequence():
+    blocks = IndexBlocks("a0")
+    generator = IndexGenerator("a0")
+    expected = ["a0"] + [generator.next() for _ in range(4 * IndexBlocks.BLOCK_SIZE)]
+    assert [blocks.next() for _ in expected] == expected
+    assert not blocks.concurrent()
+
+def test_concurrent_elements_have_unique_ordered_indexes(fast_switching):
+    scene = SceneBuilder()
+    created: list[list] = [[] for _ in range(THREADS)]
+    def create(thread):
+        for i in range(ELEMENTS):
+            created[thread].append(scene.rectangle(f"{thread}-{i}").position(i, thread))
+    run_threads(create)
+
+    assert len(scene._elements) == 2 * THREADS * ELEMENTS  # With the labels
+    assert len({element._id for element in scene._elements}) == len(scene._elements)
+    for elements in created:
+        indexes = [element._index for element in elements]
+        assert indexes == sorted(indexes)  # Each thread's elements keep their order
+
+    written = [element["index"] for element in json.loads(scene.json())["elements"]]
+    assert len(set(written)) == len(written) == len(scene._elements)
+    assert written == sorted(written)
+
+def test_concurrent_stream_flushes_in_order(fast_switching, tmp_path):
+    scene = SceneBuilder().stream(str(tmp_path / "scene.excalidraw"))
+    for _ in range(3):
+        run_threads(lambda thread: [scene.ellipse().position(thread, 0) for _ in range(100)])
+        scene.flush()
+    scene.close()
+
+    written = [element["index"] for element in json.loads((tmp_path / "scene.excalidraw").read_text())["elements"]]
+    assert len(set(written)) == len(written) == 3 * THREADS * 100
+    assert written == sorted(written)
@@ -0,0 +1,121 @@
+"""
+Description: Unit tests for frames fitting their members.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import json
+from excaligen.SceneBuilder import SceneBuilder
+
+def geometry(frame):
+    return (frame._x, frame._y, frame._width, frame._height)
+
+def test_frame_fits_elements():
+    scene = SceneBuilder()
+    a = scene.rectangle().size(100, 50).position(0, 0)
+    b = scene.ellipse().size(50, 50).position(200, 100)
+    frame = scene.frame().elements(a, b)
+    assert geometry(frame) == (-30, -30, 310, 210)
+    assert a._frame_id == b._frame_id == frame._id
+
+def test_frame_grows_with_members():
+    scene = SceneBuilder()
+    a = scene.rectangle().size(100, 50).position(0, 0)
+    b = scene.rectangle().size(100, 50).position(200, 0)
+    frame = scene.frame().elements(a, b)
+    b.position(400, 100)
+    assert geometry(frame) == (-30, -30, 560, 210)
+    frame.elements(scene.text("Note").position(-100, 0))
+    assert frame._x == -130
+
+def test_frame_shrinks_when_refitted():
+    scene = SceneBuilder()
+    boxes = [scene.rectangle().size(10, 10).position(100 * i, 0) for i in range(5)]
+    frame = scene.frame().elements(*boxes)
+    boxes[4].position(200, 0)
+    assert frame._width == 470  # Still fits, refitted later
+    scene.json()
+    assert geometry(frame) == (-30, -30, 370, 70)
+
+def test_frame_with_size_does_not_fit():
+    scene = SceneBuilder()
+    box = scene.rectangle().size(100, 50).position(0, 0)
+    frame = scene.frame().size(500, 400).position(-50, -50).elements(box)
+    box.position(1000, 1000)
+    scene.json()
+    assert geometry(frame) == (-50, -50, 500, 400)
+    assert box._frame_id == frame._id
+
+def test_element_moves_to_another_frame():
+    scene = SceneBuilder()
+    a = scene.rectangle().size(10, 10).position(0, 0)
+    b = scene.rectangle().size(10, 10).position(100, 0)
+    first = scene.frame().elements(a, b)
+    second = scene.frame().elements(b)
+    assert first._members() == [a] and second._members() == [b]
+    assert b._frame_id == second._id
+    scene.json()
+    assert geometry(first) == (-30, -30, 70, 70)
+
+def test_nested_frames():
+    scene = SceneBuilder()
+    box = scene.rectangle().size(100, 100).position(0, 0)
+    title = scene.text("Dashboard").position(0, -100)
+    inner = scene.frame("Inner").elements(box)
+    outer = scene.frame("Outer").elements(inner, title)
+    assert geometry(inner) == (-30, -30, 160, 160)
+    assert outer._x == -60 and outer._y + 30 == title._y and outer._y + outer._height == 160
+    assert inner._frame_id is None
+
+    box.position(500, 0)
+    assert outer._x + outer._width == 660
+    box.position(0, 0)
+    scene.json()
+    assert outer._x + outer._width == 160
+
+    data = json.loads(scene.json())
+    assert [e["frameId"] for e in data["elements"] if e["type"] == "frame"] == [None, None]
+
+def test_frame_cannot_nest_itself():
+    scene = SceneBuilder()
+    inner = scene.frame()
+    outer = scene.frame().elements(inner)
+    with pytest.raises(ValueError):
+        inner.elements(outer)
+    with pytest.raises(ValueError):
+        inner.elements(inner)
+
+def test_removed_frame_releases_members():
+    scene = SceneBuilder()
+    box = scene.rectangle().position(0, 0)
+    frame = scene.frame().elements(box)
+    scene._remove_elements([frame])
+    assert box._frame_id is None
+    box.position(1000, 0)
+    assert frame._x == -30
+
+def test_stamped_frame_holds_stamped_members():
+    scene = SceneBuilder()
+    box = scene.rectangle().size(100, 50).position(0, 0)
+    frame = scene.frame().elements(box)
+    template = scene.template(frame=frame, box=box)
+    parts = scene.stamp(template, at=(1000, 0))
+
+    assert parts["box"]._frame_id == parts["frame"]._id
+    assert parts["frame"]._members() == [parts["box"]]
+    parts["box"].position(1000, 500)
+    assert parts["frame"]._y + parts["frame"]._height == 580
+    assert geometry(frame) == (-30, -30, 160, 110)
+
+def test_many_moves_refit_once():
+    scene = SceneBuilder()
+    boxes = [scene.rectangle().size(10, 10).position(20 * i, 0) for i in range(2000)]
+    frame = scene.frame().elements(*boxes)
+    for box in boxes[1000:]:
+        box.position(box._x - 20000, 0)
+    for box in boxes[1000:]:
+        box.position(box._x + 10000, 0)
+    scene.json()
+    xs = [box._x for box in boxes]
+    assert (frame._x, frame._width) == (min(xs) - 30, max(xs) + 10 - min(xs) + 60)
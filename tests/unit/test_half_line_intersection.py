@@ -0,0 +1,77 @@
+"""
+Description: Unit tests for the half-line intersections with shapes.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import importlib.util
+import math
+import random
+from excaligen.impl.geometry.HalfLineIntersection import HalfLineIntersection
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+def polygon_intersection(vx, vy, vertices, angle):
+    """Reference: intersect each edge separately and take the closest intersection."""
+    c, s = math.cos(-angle), math.sin(-angle)
+    vxr, vyr = vx * c - vy * s, vx * s + vy * c
+    hits = []
+    for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1]):
+        hit = HalfLineIntersection.half_line_line_intersection(0, 0, vxr, vyr, x1, y1, x2, y2)
+        if hit:
+            hits.append(hit)
+    x, y = min(hits, key=lambda hit: math.hypot(*hit))
+    return x * math.cos(angle) - y * math.sin(angle), x * math.sin(angle) + y * math.cos(angle)
+
+def rays(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    return [(math.cos(t), math.sin(t)) for t in (rng.uniform(0, 2 * math.pi) for _ in range(count))]
+
+@pytest.mark.parametrize("angle", [0, 0.4, -2.1])
+def test_rectangle_slab_matches_edges(angle):
+    for vx, vy in rays(200):
+        expected = polygon_intersection(vx, vy, [(-60, -20), (-60, 20), (60, 20), (60, -20)], angle)
+        assert HalfLineIntersection.with_rectangle(0, 0, vx, vy, 60, 20, angle) == pytest.approx(expected)
+
+@pytest.mark.parametrize("angle", [0, 1.2])
+def test_diamond_matches_edges(angle):
+    for vx, vy in rays(200):
+        expected = polygon_intersection(vx, vy, [(0, 30), (50, 0), (0, -30), (-50, 0)], angle)
+        assert HalfLineIntersection.with_diamond(0, 0, vx, vy, 50, 30, angle) == pytest.approx(expected)
+
+def test_axis_aligned_rays():
+    assert HalfLineIntersection.with_rectangle(0, 0, 1, 0, 50, 25, 0) == (50, 0)
+    assert HalfLineIntersection.with_rectangle(0, 0, 0, -1, 50, 25, 0) == (0, -25)
+    assert HalfLineIntersection.with_diamond(0, 0, -3, 0, 50, 25, 0) == (-50, 0)
+
+def test_start_outside_the_shape():
+    assert HalfLineIntersection.with_rectangle(-100, 0, 1, 0, 50, 25, 0) == (-50, 0)
+    assert HalfLineIntersection.with_rectangle(-100, 0, -1, 0, 50, 25, 0) is None
+    assert HalfLineIntersection.with_rectangle(-100, 30, 1, 0, 50, 25, 0) is None
+    assert HalfLineIntersection.with_diamond(0, 100, 0, -1, 50, 25, 0) == pytest.approx((0, 25))
+
+@pytest.mark.parametrize("shape", HalfLineIntersection.SHAPES)
+def test_batch_matches_scalar(shape, monkeypatch):
+    monkeypatch.setattr(HalfLineIntersection, "NUMPY_THRESHOLD", math.inf)
+    scalar = getattr(HalfLineIntersection, f"with_{shape}")
+    directions = rays(50)
+    batch = HalfLineIntersection.with_shape_batch(shape, 0, 0, directions, 40, 25, 0.7)
+    for (vx, vy), point in zip(directions, batch):
+        assert point == pytest.approx(scalar(0, 0, vx, vy, 40, 25, 0.7))
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed")
+@pytest.mark.parametrize("shape", HalfLineIntersection.SHAPES)
+def test_batch_numpy_matches_scalar(shape):
+    scalar = getattr(HalfLineIntersection, f"with_{shape}")
+    directions = rays(500) + [(1, 0), (0, 1)]
+    batch = HalfLineIntersection.with_shape_batch(shape, 10, -5, directions, 40, 25, 0.7)
+    for (vx, vy), point in zip(directions, batch):
+        assert point == pytest.approx(scalar(10, -5, vx, vy, 40, 25, 0.7))
+
+    missing = HalfLineIntersection.with_shape_batch(shape, 500, 0, [(1, 0)] * 100, 40, 25, 0)
+    assert missing == [None] * 100
+
+def test_batch_unsupported_shape():
+    with pytest.raises(ValueError, match="Unsupported shape"):
+        HalfLineIntersection.with_shape_batch("line", 0, 0, [(1, 0)], 1, 1, 0)
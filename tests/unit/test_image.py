@@ -8,16 +8,20 @@ import pytest
 from excaligen.impl.elements.Image import Image
 from excaligen.impl.base.AbstractImageListener import AbstractImageListener
 from excaligen.impl.images.ImageLoader import ImageLoader
+from excaligen.impl.images.ImageData import ImageData
 from excaligen.defaults.Defaults import Defaults
+from excaligen.SceneBuilder import SceneBuilder
 import os
 import io
+import base64
+import struct
 
 class DummyImageListener(AbstractImageListener):
     def __init__(self):
         self.images = {}
 
-    def _on_image(self, id: str, mime_type: str, data_url: str):
-        self.images[id] = (mime_type, data_url)
+    def _on_image(self, id: str, image_data: ImageData):
+        self.images[id] = (image_data.mime_type, image_data.data_url)
 
 @pytest.fixture
 def image_listener():
@@ -56,3 +60,82 @@ def test_image_fit(image_listener, image_loader):
     image_element.data(svg_data).fit(100, 100)
     assert image_element._width == 100
     assert image_element._height == 50
+
+PNG_DATA = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x03' \
+           b'\x00\x00\x00\x02\x08\x02\x00\x00\x00\x90wS\xde\x00' \
+           b'\x00\x00\nIDAT\x08\xd7c``\x00\x00\x00\x02\x00\x01' \
+           b'\xe2!\xbc\x33\x00\x00\x00\x00IEND\xaeB`\x82'
+
+def test_image_file_is_probed_lazily(tmp_path, image_loader):
+    path = tmp_path / "pixel.png"
+    path.write_bytes(PNG_DATA)
+
+    image_data = image_loader.load_from_file(str(path))
+    assert (image_data.width, image_data.height) == (3, 2)
+    assert image_data.mime_type == "image/png"
+    assert image_data.content is None
+    assert image_data.data_url == "data:image/png;base64," + base64.b64encode(PNG_DATA).decode('ascii')
+
+def test_image_jpeg_header_probe(tmp_path, image_loader):
+    app0 = b'\xff\xe0' + struct.pack(">H", 2 + 1000) + b'\x00' * 1000
+    sof0 = b'\xff\xc0' + struct.pack(">HBHHB", 11, 8, 480, 640, 1) + b'\x01\x11\x00'
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b'\xff\xd8' + app0 + sof0 + b'\xff\xd9')
+
+    image_data = image_loader.load_from_file(str(path))
+    assert image_data.mime_type == "image/jpeg"
+    assert (image_data.width, image_data.height) == (640, 480)
+
+def test_image_svg_file_probe(tmp_path, image_loader):
+    svg = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 30 20">' + '<rect width="1" height="1"/>' * 5000 + '</svg>'
+    path = tmp_path / "icon.svg"
+    path.write_text(svg, encoding="utf-8")
+
+    image_data = image_loader.load_from_file(str(path))
+    assert (image_data.width, image_data.height) == (30, 20)
+    assert base64.b64decode(image_data.data_url.split(",", 1)[1]) == svg.encode("utf-8")
+
+@pytest.mark.parametrize("content", ["garbage", "", "<html><body>Page</body></html>", "<?xml version='1.0'?>"])
+def test_image_invalid_svg_file(tmp_path, image_loader, content):
+    path = tmp_path / "icon.svg"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError, match="Invalid SVG data"):
+        image_loader.load_from_file(str(path))
+
+def test_image_unsupported_file(tmp_path, image_loader):
+    path = tmp_path / "empty.png"
+    path.write_bytes(b'')
+    with pytest.raises(ValueError, match="Unsupported image format"):
+        image_loader.load_from_file(str(path))
+
+def test_image_data_url_chunks():
+    content = bytes(range(256)) * 3000
+    image_data = ImageData(1, 1, "image/png", content=content)
+    chunks = list(image_data.iter_data_url())
+    assert len(chunks) > 2
+    assert "".join(chunks) == "data:image/png;base64," + base64.b64encode(content).decode('ascii')
+
+def test_image_save_streams_payload(tmp_path):
+    image_path = tmp_path / "pixel.png"
+    image_path.write_bytes(PNG_DATA)
+
+    scene = SceneBuilder()
+    scene.image().file(str(image_path)).center(0, 0)
+    scene.image().data('<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"></svg>')
+
+    output_path = tmp_path / "scene.excalidraw"
+    scene.save(str(output_path))
+    assert output_path.read_text(encoding="utf-8") == scene.json()
+
+def test_image_save_keeps_previous_file_if_image_is_gone(tmp_path):
+    image_path = tmp_path / "pixel.png"
+    image_path.write_bytes(PNG_DATA)
+    output_path = tmp_path / "scene.excalidraw"
+    output_path.write_text("previous", encoding="utf-8")
+
+    scene = SceneBuilder()
+    scene.image().file(str(image_path))
+    image_path.unlink()
+    scene.save(str(output_path))
+    assert output_path.read_text(encoding="utf-8") == "previous"
+    assert os.listdir(tmp_path) == ["scene.excalidraw"]  # No temporary file is left
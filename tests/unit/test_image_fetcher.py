@@ -0,0 +1,151 @@
+"""
+Description: Unit tests for remote image fetching against a local HTTP server.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.images.ImageFetcher import ImageFetcher
+from excaligen.impl.images.ImageLoader import ImageLoader
+
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg" width="24" height="16"></svg>'
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads=True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.connections=0
+        self.requests: list[str] = []
+        self.in_flight=0
+        self.max_in_flight=0
+        self.flaky_failures=1
+        self.lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version="HTTP/1.1"
+    server: StandInServer
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(self.path)
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        try:
+            self._respond()
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _respond(self):
+        if self.path.startswith("/icon"):
+            if "slow" in self.path:
+                time.sleep(0.05)
+            self._send(200, "image/svg+xml; charset=utf-8", SVG)
+        elif self.path == "/flaky":
+            with self.server.lock:
+                fail = self.server.flaky_failures > 0
+                self.server.flaky_failures -= 1
+            self._send(503, "text/plain", b"busy") if fail else self._send(200, "image/svg+xml", SVG)
+        elif self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/icon-moved")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/hang":
+            time.sleep(1.0)
+            self._send(200, "image/svg+xml", SVG)
+        else:
+            self._send(404, "text/plain", b"not found")
+
+    def _send(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server():
+    server = StandInServer()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def test_fetch_reuses_connection(server):
+    fetcher = ImageFetcher()
+    for i in range(10):
+        content_type, body = fetcher.fetch(server.url(f"/icon{i}.svg"))
+        assert content_type == "image/svg+xml"
+        assert body == SVG
+    fetcher.close()
+
+    assert len(server.requests) == 10
+    assert server.connections == 1
+
+def test_fetch_follows_redirect(server):
+    content_type, body = ImageFetcher().fetch(server.url("/moved"))
+    assert content_type == "image/svg+xml"
+    assert server.requests == ["/moved", "/icon-moved"]
+
+def test_fetch_retries_on_server_error(server):
+    _, body = ImageFetcher(retries=1).fetch(server.url("/flaky"))
+    assert body == SVG
+    assert server.requests == ["/flaky", "/flaky"]
+
+def test_fetch_gives_up_after_retries(server):
+    server.flaky_failures=5
+    with pytest.raises(ValueError, match="HTTP 503"):
+        ImageFetcher(retries=2).fetch(server.url("/flaky"))
+    assert len(server.requests) == 3
+
+def test_fetch_timeout(server):
+    with pytest.raises(ValueError, match="Failed to fetch image"):
+        ImageFetcher(timeout=0.1, retries=0).fetch(server.url("/hang"))
+
+def test_fetch_all_bounded_concurrency(server):
+    urls = [server.url(f"/icon-slow{i}.svg") for i in range(12)]
+    results = ImageFetcher().fetch_all(urls + urls, workers=3)
+
+    assert list(results.keys()) == urls
+    assert all(body == SVG for _, body in results.values())
+    assert len(server.requests) == 12
+    assert server.max_in_flight <= 3
+    assert server.connections <= 3
+
+def test_prefetch_serves_images_without_requests(server):
+    scene = SceneBuilder()
+    urls = [server.url(f"/icon{i}.svg") for i in range(20)]
+    scene.prefetch_images(urls)
+    assert len(server.requests) == 20
+
+    images = [scene.image().url(url) for url in urls]
+    assert len(server.requests) == 20
+    assert all(image.size() == (24, 16) for image in images)
+    assert len(scene._files) == 20
+
+def test_prefetch_failure_raised_on_use(server):
+    loader = ImageLoader()
+    loader.prefetch([server.url("/missing.svg")])
+    assert len(server.requests) == 1
+
+    with pytest.raises(ValueError, match="HTTP 404"):
+        loader.load_from_url(server.url("/missing.svg"))
+    assert len(server.requests) == 1
@@ -0,0 +1,136 @@
+"""
+Description: Unit tests for downscaling of embedded images.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import base64
+import importlib.util
+import io
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.images.ImageData import ImageData
+from excaligen.impl.images.ImageResampler import ImageResampler
+
+HAS_PILLOW = importlib.util.find_spec("PIL") is not None
+requires_pillow = pytest.mark.skipif(not HAS_PILLOW, reason="Pillow is not installed")
+
+def photo(width: int, height: int, image_format: str) -> bytes:
+    from PIL import Image as PILImage
+    image = PILImage.new("RGB", (width, height))
+    image.putdata([((x * 7) % 256, (y * 5) % 256, (x * y) % 256) for y in range(height) for x in range(width)])
+    output = io.BytesIO()
+    image.save(output, image_format)
+    return output.getvalue()
+
+def embedded_size(scene: SceneBuilder, image) -> tuple[int, int]:
+    from PIL import Image as PILImage
+    data_url = scene._files[image._file_id]["dataURL"].data_url
+    with PILImage.open(io.BytesIO(base64.b64decode(data_url.split(",")[1]))) as embedded:
+        return embedded.size
+
+@pytest.mark.skipif(HAS_PILLOW, reason="Pillow is installed")
+def test_downscale_requires_pillow():
+    with pytest.raises(ImportError, match="Pillow"):
+        SceneBuilder().downscale_images()
+
+@requires_pillow
+def test_target_size():
+    resampler = ImageResampler(dpr=2.0, max_pixels=10_000)
+    assert resampler.target_size(4000, 3000, 200, 150) == (115, 87)
+    assert ImageResampler(dpr=2.0).target_size(4000, 3000, 200, 150) == (400, 300)
+    assert ImageResampler(dpr=2.0).target_size(300, 200, 200, 150) == (300, 200)
+    assert ImageResampler(dpr=1.0).target_size(300, 200, 0, 0) == (300, 200)
+
+@requires_pillow
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        ImageResampler(dpr=0)
+    with pytest.raises(ValueError):
+        ImageResampler(max_pixels=0)
+    with pytest.raises(ValueError):
+        ImageResampler(quality=101)
+
+@requires_pillow
+def test_downscale_to_displayed_size():
+    scene = SceneBuilder().downscale_images(dpr=2.0)
+    jpeg = scene.image().data(photo(800, 600, "JPEG")).fit(100, 100)
+    png = scene.image().data(photo(400, 200, "PNG")).fit(50, 50)
+    scene.json()
+
+    assert embedded_size(scene, jpeg) == (200, 150)
+    assert embedded_size(scene, png) == (100, 50)
+    assert (jpeg._width, jpeg._height) == (100, 75)
+
+@requires_pillow
+def test_downscale_uses_final_size():
+    scene = SceneBuilder().downscale_images(dpr=1.0)
+    image = scene.image().data(photo(800, 600, "PNG")).fit(100, 100)
+    scene.json()
+    assert embedded_size(scene, image) == (100, 75)
+
+    image.fit(200, 200)
+    scene.json()
+    assert embedded_size(scene, image) == (200, 150)
+
+@requires_pillow
+def test_downscale_keeps_small_and_vector_images():
+    scene = SceneBuilder().downscale_images(dpr=2.0, max_pixels=1_000_000)
+    small = scene.image().data(photo(60, 40, "PNG")).fit(50, 50)
+    svg = scene.image().data('<svg xmlns="http://www.w3.org/2000/svg" width="4000" height="3000"></svg>').fit(10, 10)
+    scene.json()
+
+    assert embedded_size(scene, small) == (60, 40)
+    assert isinstance(scene._files[svg._file_id]["dataURL"], ImageData)
+    assert scene._files[svg._file_id]["dataURL"].width == 4000
+
+@requires_pillow
+def test_downscale_to_pixel_budget(tmp_path):
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(photo(1000, 500, "JPEG"))
+
+    scene = SceneBuilder().downscale_images(max_pixels=20_000)
+    image = scene.image().file(str(path))
+    scene.save(str(tmp_path / "scene.excalidraw"))
+
+    assert embedded_size(scene, image) == (200, 100)
+    assert (image._width, image._height) == (1000, 500)
+
+@requires_pillow
+def test_shared_file_is_resampled_once(monkeypatch):
+    calls = []
+    resample = ImageResampler.resample
+    monkeypatch.setattr(ImageResampler, "resample", lambda self, *args: calls.append(args[1:]) or resample(self, *args))
+
+    scene = SceneBuilder().downscale_images(dpr=1.0)
+    template = scene.template(image=scene.image().data(photo(800, 600, "PNG")).fit(100, 100))
+    scene.stamp(template, at=(0, 0))
+    scene.stamp(template, at=(200, 0))["image"].fit(200, 200)
+    scene.json()
+    scene.json()
+    assert calls == [(200, 150)]  # The largest displayed size
+
+@requires_pillow
+def test_resized_image_replaces_cached_payload():
+    scene = SceneBuilder().downscale_images(dpr=1.0)
+    image = scene.image().data(photo(800, 600, "PNG"))
+    for size in (100, 200, 300):
+        image.fit(size, size)
+        scene.json()
+    cache = scene._ExcaligenStructure__resampled
+    assert list(cache) == [image._file_id] and cache[image._file_id][0] == (300, 225)
+
+@requires_pillow
+def test_merged_file_keeps_largest_displayed_size():
+    content = photo(1000, 1000, "JPEG")
+    scene = SceneBuilder().downscale_images(dpr=1.0)
+    large = scene.image().data(content).fit(400, 400)
+    other = SceneBuilder()
+    other.image().data(content).fit(50, 50)
+    scene.merge(other)
+    small = scene._elements[-1]
+    scene.json()
+
+    assert small._file_id == large._file_id  # The same image is embedded once
+    assert embedded_size(scene, large) == (400, 400)
+    assert (small._width, small._height) == (50, 50)
@@ -0,0 +1,88 @@
+"""
+Description: Unit tests for the force-directed layout.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import math
+import random
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.layout.ForceLayout import ForceLayout, QuadTree
+
+def random_graph(count, seed=3):
+    rng = random.Random(seed)
+    sizes = [(rng.choice((40, 80, 120)), 40) for _ in range(count)]
+    edges = [(rng.randrange(i), i) for i in range(1, count)]
+    return sizes, edges
+
+def assert_no_overlaps(centers, sizes, gap):
+    for i in range(len(centers)):
+        for j in range(i + 1, len(centers)):
+            separated_x = abs(centers[i][0] - centers[j][0]) >= (sizes[i][0] + sizes[j][0]) / 2 + gap - 1e-6
+            separated_y = abs(centers[i][1] - centers[j][1]) >= (sizes[i][1] + sizes[j][1]) / 2 + gap - 1e-6
+            assert separated_x or separated_y
+
+def test_quadtree_cells():
+    xs, ys = [0.0, 1.0, 9.0, 10.0], [0.0, 1.0, 9.0, 10.0]
+    tree = QuadTree(xs, ys)
+    assert tree.mass[0] == 4
+    assert (tree.com_x[0], tree.com_y[0]) == (5.0, 5.0)
+    assert sorted(tree.mass[child] for child in tree.children[0]) == [2, 2]
+    leaves = [cell for cell in range(len(tree)) if not tree.children[cell]]
+    assert sorted((tree.com_x[leaf], tree.com_y[leaf]) for leaf in leaves) == list(zip(xs, ys))
+
+def test_quadtree_coincident_points():
+    tree = QuadTree([1.0, 1.0, 1.0], [2.0, 2.0, 2.0])
+    assert len(tree) == QuadTree.MAX_DEPTH + 1
+    assert tree.mass[-1] == 3
+
+def test_connected_nodes_are_closer():
+    sizes = [(40, 40)] * 6
+    # Two triangles connected by one edge
+    edges = [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (2, 3)]
+    centers = ForceLayout(iterations=200).place(sizes, edges)
+    within = [math.dist(centers[u], centers[v]) for u, v in edges[:6]]
+    between = [math.dist(centers[u], centers[v]) for u in (0, 1) for v in (4, 5)]
+    assert max(within) < min(between)
+
+def test_nodes_do_not_overlap():
+    sizes, edges = random_graph(150)
+    centers = ForceLayout(spacing=20).place(sizes, edges)
+    assert_no_overlaps(centers, sizes, 10)
+    assert min(x - w / 2 for (x, _), (w, _) in zip(centers, sizes)) == pytest.approx(0)
+    assert min(y - h / 2 for (_, y), (_, h) in zip(centers, sizes)) == pytest.approx(0)
+
+def test_seed_makes_layout_deterministic():
+    sizes, edges = random_graph(50)
+    assert ForceLayout(seed=5).place(sizes, edges) == ForceLayout(seed=5).place(sizes, edges)
+    assert ForceLayout(seed=5).place(sizes, edges) != ForceLayout(seed=6).place(sizes, edges)
+
+def test_numpy_matches_python(monkeypatch):
+    pytest.importorskip("numpy")
+    sizes, edges = random_graph(300)
+    vectorized = ForceLayout(iterations=10).place(sizes, edges)
+    monkeypatch.setattr(ForceLayout, "NUMPY_THRESHOLD", 10 ** 9)
+    python = ForceLayout(iterations=10).place(sizes, edges)
+    assert [coordinate for point in vectorized for coordinate in point] == pytest.approx([coordinate for point in python for coordinate in point], abs=1e-3)
+
+def test_scene_force_layout():
+    scene = SceneBuilder()
+    nodes = [scene.ellipse(str(i)).size(60, 60) for i in range(10)]
+    edges = [(nodes[i], nodes[(i + 1) % 10]) for i in range(10)] + [(nodes[0], nodes[0])]
+    result = scene.layout().force(nodes, edges, iterations=50, seed=1)
+
+    assert [result.position(node) for node in nodes] == [node.center() for node in nodes]
+    assert len(result.arrows()) == 10
+    arrow = result.arrows()[0]
+    assert (arrow._start_arrowhead, arrow._end_arrowhead) == (None, None)
+    assert arrow._start_binding["elementId"] == nodes[0]._id
+
+def test_empty_and_invalid():
+    scene = SceneBuilder()
+    assert ForceLayout().place([], []) == []
+    a = scene.rectangle()
+    with pytest.raises(ValueError, match="iterations"):
+        scene.layout().force([a], [], iterations=-1)
+    with pytest.raises(ValueError, match="spacing"):
+        scene.layout().force([a], [], spacing=-1)
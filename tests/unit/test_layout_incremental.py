@@ -0,0 +1,105 @@
+"""
+Description: Unit tests for the incremental updates of the layouts.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import random
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.layout.LayeredLayout import LayeredLayout
+
+def random_graph(scene, count, seed=1):
+    rng = random.Random(seed)
+    nodes = [scene.rectangle().size(rng.choice((80, 120)), 40) for _ in range(count)]
+    edges = set()
+    while len(edges) < 2 * count:
+        u, v = rng.randrange(count), rng.randrange(count)
+        if u < v and v - u < 30:
+            edges.add((u, v))
+    return nodes, [(nodes[u], nodes[v]) for u, v in sorted(edges)]
+
+def element_ids(scene):
+    return {element._id for element in scene._elements}
+
+def test_unchanged_graph_keeps_positions():
+    rng = random.Random(1)
+    sizes = [(rng.choice((80, 120)), 40) for _ in range(200)]
+    edges = sorted({(u, u + rng.randrange(1, 30)) for u in range(170) for _ in range(2)})
+    engine = LayeredLayout()
+    centers = engine.place(sizes, edges)
+    again = LayeredLayout().place(sizes, edges, centers, engine.bends())
+    assert [c for center in again for c in center] == pytest.approx([c for center in centers for c in center])
+
+def test_layered_update_keeps_nodes_and_arrows():
+    scene = SceneBuilder()
+    nodes, edges = random_graph(scene, 200)
+    result = scene.layout().layered(nodes, edges)
+    before = {node._id: node.center() for node in nodes}
+    arrows = {arrow._id for arrow in result.arrows()}
+
+    added = scene.rectangle().size(100, 40)
+    updated = scene.layout().layered(nodes + [added], edges + [(nodes[10], added)], previous=result)
+
+    unchanged = sum(1 for node in nodes if node.center() == pytest.approx(before[node._id]))
+    assert unchanged > 0.8 * len(nodes)
+    assert arrows < {arrow._id for arrow in updated.arrows()}
+    assert len(updated.arrows()) == len(arrows) + 1
+
+def test_removed_edge_removes_its_arrow():
+    scene = SceneBuilder()
+    a, b, c = scene.rectangle(), scene.rectangle(), scene.rectangle()
+    result = scene.layout().layered([a, b, c], [(a, b), (b, c)])
+    removed = result.arrows()[1]
+
+    updated = scene.layout().layered([a, b, c], [(a, b)], previous=result)
+    assert updated.arrows() == result.arrows()[:1]
+    assert removed._id not in element_ids(scene)
+    assert all(bound["id"] != removed._id for node in (b, c) for bound in node._bound_elements or [])
+
+def test_moved_nodes_rebind_arrows():
+    scene = SceneBuilder()
+    a, b = scene.rectangle(), scene.rectangle()
+    result = scene.layout().layered([a, b], [(a, b)])
+    arrow = result.arrows()[0]
+    c = scene.rectangle().size(400, 40)
+    updated = scene.layout().layered([a, b, c], [(a, b), (c, b)], previous=result)
+    assert updated.arrows()[0] is arrow
+    assert (arrow._x, arrow._y) == pytest.approx((a.center()[0], a._y + a._height))
+
+def test_force_update_moves_nodes_little():
+    scene = SceneBuilder()
+    nodes, edges = random_graph(scene, 100, seed=2)
+    result = scene.layout().force(nodes, edges)
+    before = {node._id: node.center() for node in nodes}
+    added = scene.ellipse()
+    scene.layout().force(nodes + [added], edges + [(nodes[0], added)], iterations=20, previous=result)
+
+    shifts = sorted(abs(node.center()[0] - before[node._id][0]) + abs(node.center()[1] - before[node._id][1]) for node in nodes)
+    size = max(max(node._width, node._height) for node in nodes)
+    assert shifts[len(shifts) // 2] < size
+
+def test_tree_update_keeps_nodes():
+    scene = SceneBuilder()
+    result = scene.layout().tree({"Root": {"A": ["A1", "A2"], "B": ["B1"]}})
+    nodes = {node._get_label()._text: node for node in result.nodes()}
+    arrows = {arrow._id for arrow in result.arrows()}
+
+    updated = scene.layout().tree({"Root": {"A": ["A1", "A2", "A3"]}}, previous=result)
+    labels = [node._get_label()._text for node in updated.nodes()]
+    assert labels == ["Root", "A", "A1", "A2", "A3"]
+    assert all(node is nodes[node._get_label()._text] for node in updated.nodes()[:4])
+
+    ids = element_ids(scene)
+    for label in ("B", "B1"):
+        assert nodes[label]._id not in ids
+        assert nodes[label]._get_label()._id not in ids
+    assert len(arrows & {arrow._id for arrow in updated.arrows()}) == 3
+    assert len(ids) == 5 * 2 + 4
+
+def test_previous_from_other_layout():
+    scene = SceneBuilder()
+    a, b = scene.rectangle(), scene.rectangle()
+    result = scene.layout().force([a, b], [(a, b)])
+    with pytest.raises(ValueError):
+        scene.layout().layered([a, b], [(a, b)], previous=result)
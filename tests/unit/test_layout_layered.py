@@ -0,0 +1,106 @@
+"""
+Description: Unit tests for the layered layout of directed graphs.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import random
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.layout.LayeredLayout import LayeredLayout
+
+def overlaps(a, b):
+    return a._x < b._x + b._width and b._x < a._x + a._width and a._y < b._y + b._height and b._y < a._y + a._height
+
+def test_layers_follow_edges():
+    scene = SceneBuilder()
+    a, b, c, d = (scene.rectangle(name).size(100, 40) for name in "abcd")
+    result = scene.layout().layered([a, b, c, d], [(a, b), (a, c), (b, d), (c, d)])
+
+    assert result.position(a)[1] < result.position(b)[1] == result.position(c)[1] < result.position(d)[1]
+    assert result.position(b) == b.center()
+    assert (min(e._x for e in (a, b, c, d)), a._y) == (0, 0)
+    assert not overlaps(b, c)
+    assert abs(b._x - c._x) >= 140
+
+def test_directions():
+    scene = SceneBuilder()
+    a, b = scene.rectangle().size(100, 40), scene.ellipse().size(60, 60)
+    for direction, axis, sign in (("TB", 1, 1), ("BT", 1, -1), ("LR", 0, 1), ("RL", 0, -1)):
+        result = scene.layout().layered([a, b], [(a, b)], direction=direction, layer_spacing=50, arrows=False)
+        assert sign * (result.position(b)[axis] - result.position(a)[axis]) > 0
+        assert result.arrows() == []
+
+def test_spacing_between_layers():
+    scene = SceneBuilder()
+    a, b = scene.rectangle().size(100, 40), scene.rectangle().size(100, 60)
+    scene.layout().layered([a, b], [(a, b)], layer_spacing=30)
+    assert b._y - (a._y + a._height) == 30
+
+def test_arrows_are_elbows_bound_to_nodes():
+    scene = SceneBuilder()
+    a, b, c = (scene.rectangle().size(80, 40) for _ in range(3))
+    result = scene.layout().layered([a, b, c], [(a, b), (b, c), (c, c)], direction="LR")
+
+    arrows = result.arrows()
+    assert len(arrows) == 2  # No arrow for the self-loop
+    assert arrows[0]._start_binding["elementId"] == a._id
+    assert arrows[0]._end_binding["elementId"] == b._id
+    assert arrows[0]._elbowed is True
+    assert all(arrow in scene._elements for arrow in arrows)
+
+def test_cycles_are_broken():
+    scene = SceneBuilder()
+    nodes = [scene.rectangle().size(80, 40) for _ in range(3)]
+    a, b, c = nodes
+    result = scene.layout().layered(nodes, [(a, b), (b, c), (c, a)])
+    layers = sorted({result.position(node)[1] for node in nodes})
+    assert len(layers) == 3
+    assert len(result.arrows()) == 3
+
+def test_sources_are_placed_next_to_successors():
+    engine = LayeredLayout()
+    engine.place([(10, 10)] * 4, [(0, 1), (1, 2), (3, 2)])
+    assert [engine.layer(node) for node in range(4)] == [0, 1, 2, 1]
+
+def test_crossings_are_removed():
+    # Two layers connected crosswise in the initial order
+    engine = LayeredLayout()
+    edges = [(0, 5), (1, 4), (2, 3)] + [(0, 3)]
+    centers = engine.place([(10, 10)] * 6, edges)
+    for (u, v), (s, t) in zip(edges, edges[1:]):
+        assert (centers[u][0] - centers[s][0]) * (centers[v][0] - centers[t][0]) >= 0
+
+def test_nodes_do_not_overlap_in_large_graph():
+    scene = SceneBuilder()
+    rng = random.Random(7)
+    nodes = [scene.rectangle().size(rng.choice((40, 80, 120)), 30) for _ in range(200)]
+    edges = [(nodes[rng.randrange(i)], nodes[i]) for i in range(1, 200) for _ in range(2)]
+    scene.layout().layered(nodes, edges, arrows=False)
+
+    rows: dict[float, list] = {}
+    for node in nodes:
+        rows.setdefault(node._y, []).append(node)
+    for row in rows.values():
+        row.sort(key=lambda node: node._x)
+        for left, right in zip(row, row[1:]):
+            assert right._x - (left._x + left._width) >= 40 - 1e-9
+
+def test_place_in_order_keeps_gaps():
+    positions = LayeredLayout._place_in_order([5.0, 5.0, 5.0], [0.0, 10.0, 10.0])
+    assert positions == pytest.approx([-5.0, 5.0, 15.0])
+    assert LayeredLayout._place_in_order([0.0, 100.0], [0.0, 10.0]) == [0.0, 100.0]
+
+def test_invalid_input():
+    scene = SceneBuilder()
+    a, b = scene.rectangle(), scene.rectangle()
+    with pytest.raises(ValueError, match="direction"):
+        scene.layout().layered([a, b], [], direction="XY")
+    with pytest.raises(ValueError, match="spacing"):
+        scene.layout().layered([a, b], [], node_spacing=-1)
+    with pytest.raises(ValueError, match="connect its nodes"):
+        scene.layout().layered([a], [(a, b)])
+    with pytest.raises(ValueError, match="distinct"):
+        scene.layout().layered([a, a], [])
+    with pytest.raises(ValueError, match="not a node"):
+        scene.layout().layered([a], []).position(b)
@@ -0,0 +1,84 @@
+"""
+Description: Unit tests for the packing layout.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import random
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.layout.PackLayout import PackLayout
+
+def random_sizes(count, seed=1):
+    rng = random.Random(seed)
+    return [(rng.choice((40, 100, 150)), rng.choice((30, 80, 120))) for _ in range(count)]
+
+def assert_packed(centers, sizes, width, gutter):
+    boxes = sorted((x - w / 2, y - h / 2, x + w / 2, y + h / 2) for (x, y), (w, h) in zip(centers, sizes))
+    assert all(left >= -1e-9 and right <= width + 1e-9 and top >= -1e-9 for left, top, right, _ in boxes)
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1:]:
+            if b[0] >= a[2] + gutter - 1e-6:
+                break
+            assert b[1] >= a[3] + gutter - 1e-6 or a[1] >= b[3] + gutter - 1e-6
+
+def test_rectangles_fill_rows():
+    centers = PackLayout(gutter=10).place([(100, 50)] * 4, 210)
+    assert centers == [(50, 25), (160, 25), (50, 85), (160, 85)]
+
+def test_tall_rectangles_first():
+    centers = PackLayout(gutter=0).place([(50, 20), (50, 100), (50, 20)], 100)
+    assert centers[1] == (25, 50)
+    assert centers[0] == (75, 10) and centers[2] == (75, 30)
+
+def test_random_rectangles_do_not_overlap():
+    sizes = random_sizes(500)
+    centers = PackLayout(gutter=15).place(sizes, 1000)
+    assert_packed(centers, sizes, 1000, 15)
+    used = sum(w * h for w, h in sizes) / (1000 * max(y + h / 2 for (_, y), (_, h) in zip(centers, sizes)))
+    assert used > 0.6
+
+def test_limited_height_leaves_out_rectangles():
+    centers = PackLayout(gutter=0).place([(50, 50)] * 5, 100, 100)
+    assert sum(center is None for center in centers) == 1
+
+def test_lower_rectangle_fits_after_higher_one_did_not():
+    centers = PackLayout(gutter=0).place([(100, 60), (60, 50), (100, 40)], 100, 100)
+    assert centers == [(50, 30), None, (50, 80)]
+
+def test_scene_pack_into_width():
+    scene = SceneBuilder()
+    elements = [scene.rectangle().size(w, h) for w, h in random_sizes(200, seed=2)] + [scene.image().size(300, 200)]
+    result = scene.layout().pack(elements, width=800, gutter=10)
+    centers = [result.position(element) for element in elements]
+    assert_packed(centers, [(e._width, e._height) for e in elements], 800, 10)
+    assert result.arrows() == []
+
+def test_scene_pack_into_frames(monkeypatch):
+    scene = SceneBuilder()
+    frames = [scene.frame().size(400, 320).position(x, 0) for x in (0, 500, 1000)]
+    calls = []
+    for frame in frames:
+        original = frame.elements
+        monkeypatch.setattr(frame, "elements", lambda *elements, original=original: calls.append(len(elements)) or original(*elements))
+    elements = [scene.rectangle().size(100, 80) for _ in range(20)]
+    scene.layout().pack(elements, frames=frames, gutter=20)
+
+    assert calls == [9, 9, 2]
+    assert all(element._frame_id == frames[0]._id for element in elements[:9])
+    for frame in frames[:2]:
+        inside = [element for element in elements if element._frame_id == frame._id]
+        assert min(element._x for element in inside) == frame._x + 20
+        assert max(element._y + element._height for element in inside) <= frame._y + frame._height - 20
+
+def test_invalid_pack():
+    scene = SceneBuilder()
+    elements = [scene.rectangle().size(100, 100) for _ in range(10)]
+    with pytest.raises(ValueError):
+        scene.layout().pack(elements)
+    with pytest.raises(ValueError):
+        scene.layout().pack(elements, width=50)
+    with pytest.raises(ValueError):
+        scene.layout().pack(elements, frames=[scene.frame()])
+    with pytest.raises(ValueError):
+        scene.layout().pack(elements, frames=[scene.frame().size(300, 300)])
@@ -0,0 +1,106 @@
+"""
+Description: Unit tests for the tree layout.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import math
+import random
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.layout.TreeLayout import TreeLayout
+
+def random_tree(count, seed=1):
+    rng = random.Random(seed)
+    parents = [-1] + [rng.randrange(max(0, node - 20), node) for node in range(1, count)]
+    sizes = [(rng.choice((40, 80, 120)), rng.choice((30, 50))) for _ in range(count)]
+    return sizes, parents
+
+def assert_no_overlaps(centers, sizes):
+    for i in range(len(centers)):
+        for j in range(i + 1, len(centers)):
+            separated_x = abs(centers[i][0] - centers[j][0]) >= (sizes[i][0] + sizes[j][0]) / 2 - 1e-6
+            separated_y = abs(centers[i][1] - centers[j][1]) >= (sizes[i][1] + sizes[j][1]) / 2 - 1e-6
+            assert separated_x or separated_y
+
+def test_parent_is_centered_over_children():
+    sizes = [(100, 40)] * 4
+    centers = TreeLayout(level_spacing=50, sibling_spacing=20).place(sizes, [-1, 0, 0, 0])
+    assert centers[0] == (170, 20)
+    assert [center[0] for center in centers[1:]] == [50, 170, 290]
+    assert {center[1] for center in centers[1:]} == {110}
+
+def test_subtrees_are_packed_by_contours():
+    # The deep subtree of the first child does not push the leaf siblings apart
+    sizes = [(20, 20)] * 6
+    parents = [-1, 0, 1, 2, 0, 0]
+    centers = TreeLayout(sibling_spacing=10).place(sizes, parents)
+    assert centers[4][0] - centers[1][0] == pytest.approx(30)
+    assert centers[5][0] - centers[4][0] == pytest.approx(30)
+
+def test_random_trees_do_not_overlap():
+    sizes, parents = random_tree(300)
+    for direction in ("TB", "LR", "radial"):
+        assert_no_overlaps(TreeLayout(direction).place(sizes, parents), sizes)
+
+def test_directions():
+    sizes, parents = [(60, 30)] * 2, [-1, 0]
+    root, child = TreeLayout("TB").place(sizes, parents)
+    assert child[1] > root[1] and child[0] == root[0]
+    root, child = TreeLayout("BT").place(sizes, parents)
+    assert child[1] < root[1]
+    root, child = TreeLayout("LR").place(sizes, parents)
+    assert child[0] - root[0] == 60 + 80
+    root, child = TreeLayout("RL").place(sizes, parents)
+    assert child[0] < root[0]
+
+def test_radial_rings():
+    sizes, parents = [(40, 40)] * 9, [-1, 0, 0, 0, 0, 1, 2, 3, 4]
+    centers = TreeLayout("radial", level_spacing=40).place(sizes, parents)
+    assert centers[0] == (0, 0)
+    first = {round(math.hypot(*center), 6) for center in centers[1:5]}
+    second = {round(math.hypot(*center), 6) for center in centers[5:]}
+    assert len(first) == len(second) == 1
+    assert second.pop() - first.pop() >= 80
+
+def test_deep_tree_does_not_recurse():
+    count = 5000
+    centers = TreeLayout().place([(10, 10)] * count, [-1] + list(range(count - 1)))
+    assert {center[0] for center in centers} == {5}
+
+def test_invalid_parents():
+    with pytest.raises(ValueError, match="pre-order"):
+        TreeLayout().place([(10, 10)] * 2, [-1, 1])
+    with pytest.raises(ValueError, match="direction"):
+        TreeLayout("up")
+
+def test_scene_tree():
+    scene = SceneBuilder()
+    result = scene.layout().tree({"Root": {"A": ["A1", {"A2": "A21"}], "B": None, "C": "C1"}}, shape="ellipse")
+    nodes = result.nodes()
+    assert [node._get_label()._text for node in nodes] == ["Root", "A", "A1", "A2", "A21", "B", "C", "C1"]
+    assert all(node._type == "ellipse" for node in nodes)
+
+    label = nodes[0]._get_label()
+    assert nodes[0]._width >= label._width * math.sqrt(2)
+    assert label.center() == nodes[0].center() == result.position(nodes[0])
+
+    arrows = result.arrows()
+    assert len(arrows) == 7
+    assert arrows[0]._start_binding["elementId"] == nodes[0]._id
+    assert arrows[0]._end_binding["elementId"] == nodes[1]._id
+
+def test_scene_tree_radial():
+    scene = SceneBuilder()
+    result = scene.layout().tree({"Center": ["North", "East", "South", "West"]}, direction="radial", arrows=False)
+    assert result.nodes()[0].center() == (0, 0)
+    assert result.arrows() == []
+
+def test_invalid_tree():
+    scene = SceneBuilder()
+    with pytest.raises(ValueError, match="single root"):
+        scene.layout().tree({"A": None, "B": None})
+    with pytest.raises(ValueError, match="Invalid children"):
+        scene.layout().tree({"A": {"B": object()}})
+    with pytest.raises(ValueError, match="shape"):
+        scene.layout().tree({"A": None}, shape="star")
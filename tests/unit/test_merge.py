@@ -0,0 +1,91 @@
+"""
+Description: Unit tests for pickling and merging scenes.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import json
+import math
+import pickle
+from excaligen.SceneBuilder import SceneBuilder
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24"></svg>'
+
+def region(name):
+    scene = SceneBuilder()
+    first = scene.rectangle(f"{name} 1").size(100, 50).position(0, 0)
+    second = scene.ellipse(f"{name} 2").size(100, 50).position(300, 0)
+    scene.arrow("calls").bind(first, second)
+    scene.image().data(SVG).position(0, 100)
+    scene.frame(name).elements(first, second)
+    scene.group().elements(first, second)
+    return scene
+
+def test_pickled_scene_is_the_same():
+    scene = region("Region")
+    scene.line().points([(0, 0), (100, 0)]).position(0, 300)
+    scene.transform((math.cos(1), math.sin(1), -math.sin(1), math.cos(1), 0, 0))  # Wraps the points of the line
+    copy = pickle.loads(pickle.dumps(scene))
+    assert copy.json() == scene.json()
+
+    box = copy.rectangle("Added")
+    assert box._get_label() in copy._elements
+    assert box._index > scene._elements[-1]._index
+
+def test_merge_reallocates_indexes_and_ids():
+    scene = region("Left")
+    right = pickle.loads(pickle.dumps(region("Right")))
+    copy = pickle.loads(pickle.dumps(scene))  # Same ids as the scene
+    scene.merge(right, copy, offset=(1000, 0))
+
+    assert len(scene._elements) == 3 * 8
+    ids = [element._id for element in scene._elements]
+    assert len(set(ids)) == len(ids)
+    indexes = [element._index for element in scene._elements]
+    assert indexes == sorted(indexes) and len(set(indexes)) == len(indexes)
+    assert len(right._elements) == 8  # The merged scenes are not changed
+
+def test_merged_references_and_offset():
+    scene = SceneBuilder()
+    other = region("Other")
+    box, ellipse, arrow = other._elements[1], other._elements[3], other._elements[5]
+    scene.merge(other, offset=(1000, 500))
+    elements = {element._id: element for element in scene._elements}
+    label, box_copy, _, ellipse_copy, _, arrow_copy, _, frame = scene._elements
+
+    assert (box_copy._x, box_copy._y) == (1000, 500)
+    assert label._container_id == box_copy._id and box_copy._get_label() is label
+    assert arrow_copy._start_binding["elementId"] == box_copy._id and arrow_copy._end_binding["elementId"] == ellipse_copy._id
+    assert {bound["id"] for bound in box_copy._bound_elements} == {label._id, arrow_copy._id}
+    assert box_copy._frame_id == frame._id and (frame._x, frame._y) == (970, 470)
+    assert box_copy._group_ids == ellipse_copy._group_ids != box._group_ids
+    assert all(bound["id"] in elements for element in scene._elements for bound in element._bound_elements or ())
+    assert arrow._start_binding["elementId"] == box._id and ellipse._x == 300
+
+    ellipse_copy.position(5000, 0)
+    assert frame._x + frame._width == 5130  # The merged frame fits its merged members
+
+def test_merge_dedupes_files():
+    scene = region("Left")
+    scene.merge(region("Middle"), region("Right"))
+    document = json.loads(scene.json())
+    assert len(document["files"]) == 1
+    file_ids = {element["fileId"] for element in document["elements"] if element["type"] == "image"}
+    assert file_ids == set(document["files"])
+
+    other = SceneBuilder()
+    other.image().data(SVG.replace("24", "32"))
+    scene.merge(other)
+    assert len(json.loads(scene.json())["files"]) == 2
+
+def test_invalid_merge_and_pickle(tmp_path):
+    scene = SceneBuilder()
+    with pytest.raises(ValueError):
+        scene.merge(scene)
+    scene.stream(str(tmp_path / "scene.excalidraw"))
+    with pytest.raises(ValueError):
+        pickle.dumps(scene)
+    with pytest.raises(ValueError):
+        SceneBuilder().merge(scene)
+    scene.close()
@@ -0,0 +1,58 @@
+"""
+Description: Unit tests for the cached element outlines.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import math
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.geometry.Outline import Outline
+from excaligen.impl.geometry.HalfLineIntersection import HalfLineIntersection
+from excaligen.impl.geometry.CircleIntersection import CircleIntersection
+
+def test_outline_is_cached_until_geometry_changes():
+    rectangle = SceneBuilder().rectangle().size(100, 50).center(0, 0)
+    outline = rectangle._outline()
+    assert rectangle._outline() is outline
+
+    rectangle.center(10, 0)
+    moved = rectangle._outline()
+    assert moved is not outline and moved._center == (10, 0)
+
+    rectangle.rotate(0.5)
+    assert rectangle._outline() is not moved
+
+def test_hub_outline_computed_once(monkeypatch):
+    scene = SceneBuilder()
+    hub = scene.ellipse().size(100, 100).center(0, 0)
+    outlines = []
+    init = Outline.__init__
+    def counting_init(self, element_type, *args):
+        outlines.append(element_type)
+        init(self, element_type, *args)
+    monkeypatch.setattr(Outline, "__init__", counting_init)
+
+    for angle in range(0, 360, 30):
+        target = scene.rectangle().size(80, 40).center(300 * math.cos(math.radians(angle)), 300 * math.sin(math.radians(angle)))
+        scene.arrow().bind(hub, target)
+
+    assert outlines.count("ellipse") == 1
+    assert outlines.count("rectangle") == 12
+
+@pytest.mark.parametrize("element_type, shape", [("rectangle", "rectangle"), ("text", "rectangle"), ("diamond", "diamond"), ("ellipse", "ellipse")])
+def test_outline_intersections(element_type, shape):
+    outline = Outline(element_type, 10, 20, 120, 60, 0.6)
+    cx, cy = 70, 50
+
+    expected = getattr(HalfLineIntersection, f"with_{shape}")(0, 0, 1, 2, 60, 30, 0.6)
+    assert outline.intersect_half_line(1, 2) == pytest.approx((expected[0] + cx, expected[1] + cy))
+    assert outline.intersect_half_lines([(1, 2)]) == [pytest.approx((expected[0] + cx, expected[1] + cy))]
+
+    expected_points = getattr(CircleIntersection, f"with_{shape}")(100 - cx, 0 - cy, 80, 60, 30, 0.6)
+    points = outline.intersect_circle(100, 0, 80)
+    assert points == [pytest.approx((x + cx, y + cy)) for x, y in expected_points]
+
+def test_outline_unknown_type():
+    with pytest.raises(TypeError):
+        Outline("line", 0, 0, 10, 10, 0)
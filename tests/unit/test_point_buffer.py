@@ -0,0 +1,87 @@
+"""
+Description: Unit tests for the array backed point storage of lines and arrows.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import copy
+import json
+from array import array
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.geometry.PointBuffer import PointBuffer
+
+def test_append_and_prepend():
+    points = PointBuffer([(1, 2), (3, 4)])
+    points.prepend([(5, 6), (7, 8)])
+    points.append((0, -1))
+    points.prepend([(9, 9)])
+
+    assert points == [(9, 9), (5, 6), (7, 8), (1, 2), (3, 4), (0, -1)]
+    assert len(points) == 6
+    assert points[0] == (9, 9) and points[-1] == (0, -1) and points[3] == (1, 2)
+    assert points[1:3] == [(5, 6), (7, 8)]
+    assert points.bounds() == (0, -1, 9, 9)
+    with pytest.raises(IndexError):
+        points[6]
+
+def test_integer_coordinates_are_kept():
+    points = PointBuffer([(1, 2)])
+    assert type(points[0][0]) is int and type(points.bounds()[2]) is int
+    points.append((0.5, 2))
+    points.prepend([(3.0, 4)])
+    assert [tuple(map(type, point)) for point in points] == [(float, int), (int, int), (float, int)]
+    assert [tuple(map(type, point)) for point in (points[0], points[1], points[2])] == [(float, int), (int, int), (float, int)]
+    assert list(map(type, points.bounds())) == [float, int, float, int]
+
+def test_mixed_coordinates_serialize_as_given():
+    scene = SceneBuilder()
+    scene.line().points([(0, 0), (10, 5), (2.5, 9)])
+    points = json.loads(scene.json())["elements"][0]["points"]
+    assert [[type(value) for value in point] for point in points] == [[int, int], [int, int], [float, int]]
+
+def test_from_buffer_does_not_copy():
+    data = array('d', [0, 0, 10, 5, -2, 3])
+    points = PointBuffer.from_buffer(data)
+    assert points == [(0, 0), (10, 5), (-2, 3)]
+    assert points.bounds() == (-2, 0, 10, 5)
+
+    data[2] = 20  # Visible through the view, the data were not copied
+    assert points[1] == (20, 5)
+
+    points.append((1, 1))  # Copied on write
+    data[2] = 30
+    assert points[1] == (20, 5)
+
+def test_from_invalid_buffer():
+    with pytest.raises(ValueError):
+        PointBuffer.from_buffer(array('d', [1, 2, 3]))
+    with pytest.raises(ValueError):
+        PointBuffer.from_buffer(array('i', [1, 2]))
+
+def test_copy_is_independent():
+    points = PointBuffer([(1, 2)])
+    copied = copy.copy(points)
+    copied.append((3, 4))
+    assert points == [(1, 2)] and copied == [(1, 2), (3, 4)]
+
+def test_line_incremental_size():
+    line = SceneBuilder().line().points([(0, 0)])
+    for i in range(1, 100):
+        line.append([(i, i % 10)])
+    line.prepend([(-50, -5)])
+
+    assert (line._width, line._height) == (149, 14)
+    assert len(line._points) == 101 and line._points[0] == (-50, -5)
+
+def test_line_points_from_buffer():
+    scene = SceneBuilder()
+    line = scene.line().points_from_buffer(array('d', [0, 0, 100.5, 50, 200, -25]))
+    arrow = scene.arrow().points_from_buffer(array('d', [0, 0, 10, 10]))
+
+    assert (line._width, line._height) == (200, 75)
+    assert (arrow._width, arrow._height) == (10, 10)
+
+    elements = json.loads(scene.json())["elements"]
+    assert elements[0]["points"] == [[0, 0], [100.5, 50], [200, -25]]
+    assert elements[1]["points"] == [[0, 0], [10, 10]]
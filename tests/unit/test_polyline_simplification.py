@@ -0,0 +1,95 @@
+"""
+Description: Unit tests for polyline simplification.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import importlib.util
+import math
+import random
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.geometry.PolylineSimplification import PolylineSimplification
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+def distance_to_segment(point, start, end) -> float:
+    (px, py), (x1, y1), (x2, y2) = point, start, end
+    dx, dy = x2 - x1, y2 - y1
+    length_squared = dx * dx + dy * dy
+    t = 0.0 if length_squared == 0 else max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length_squared))
+    return math.hypot(px - x1 - t * dx, py - y1 - t * dy)
+
+def max_error(points, simplified) -> float:
+    """The largest distance of an original point from the simplified segment spanning it."""
+    error, segment = 0.0, 0
+    indices = [points.index(point) for point in simplified]
+    for i, point in enumerate(points):
+        while indices[segment + 1] < i:
+            segment += 1
+        error = max(error, distance_to_segment(point, simplified[segment], simplified[segment + 1]))
+    return error
+
+def trace(count: int, seed: int = 42) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    return [(i * 0.5, 100 * math.sin(i / 300) + rng.uniform(-1, 1)) for i in range(count)]
+
+def test_douglas_peucker_within_tolerance():
+    points = trace(5_000)
+    simplified = PolylineSimplification.simplify(points, 2.0)
+
+    assert simplified[0] == points[0] and simplified[-1] == points[-1]
+    assert len(simplified) < len(points) / 10
+    assert max_error(points, simplified) <= 2.0
+
+def test_douglas_peucker_is_not_recursive():
+    # A widening zigzag keeps splitting next to one end, which would exceed the recursion limit
+    points = [(i * (1 if i % 2 else -1), i) for i in range(1_200)]
+    assert PolylineSimplification.simplify(points, 0.1) == points
+
+def test_visvalingam():
+    points = [(0, 0), (1, 0.01), (2, 0), (3, 5), (4, 0), (5, 0.02), (6, 0)]
+    assert PolylineSimplification.simplify(points, 0.5, "visvalingam") == [(0, 0), (2, 0), (3, 5), (4, 0), (6, 0)]
+
+    simplified = PolylineSimplification.simplify(trace(5_000), 2.0, "visvalingam")
+    assert simplified[0] == (0, trace(1)[0][1]) and len(simplified) < 1_000
+
+def test_closed_polyline_stays_closed():
+    square = [(0, 0), (5, 0), (10, 0), (10, 5), (10, 10), (5, 10), (0, 10), (0, 5), (0, 0)]
+    for method in PolylineSimplification.METHODS:
+        simplified = PolylineSimplification.simplify(square, 0.1, method)
+        assert simplified == [(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)]
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        PolylineSimplification.simplify([(0, 0), (1, 1), (2, 0)], -1)
+    with pytest.raises(ValueError, match="Invalid simplification method"):
+        PolylineSimplification.simplify([(0, 0), (1, 1), (2, 0)], 1, "fast")
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed")
+def test_numpy_matches_pure_python(monkeypatch):
+    points = trace(3_000)
+    vectorized = PolylineSimplification.simplify(points, 1.5)
+    monkeypatch.setattr(PolylineSimplification, "NUMPY_THRESHOLD", math.inf)
+    assert PolylineSimplification.simplify(points, 1.5) == vectorized
+
+def test_line_simplify():
+    line = SceneBuilder().line().points(trace(2_000))
+    width = line._width
+    line.simplify(2.0)
+
+    assert 2 < len(line._points) < 200
+    assert line._width == pytest.approx(width)
+
+def test_scene_simplify_lines():
+    scene = SceneBuilder()
+    scene.line().points(trace(1_000))
+    scene.line().points(trace(1_000, seed=7)).close()
+    scene.arrow().points([(0, 0), (50, 0.1), (100, 0)])
+    scene.rectangle()
+
+    removed = scene.simplify_lines(2.0)
+    counts = [len(element._points) for element in scene._elements if hasattr(element, "_points")]
+    assert removed == 2_001 + 3 - sum(counts)
+    assert counts[2] == 2
+    assert scene._elements[1]._points[0] == scene._elements[1]._points[-1]
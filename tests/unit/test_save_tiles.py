@@ -0,0 +1,108 @@
+"""
+Description: Unit tests for splitting a scene into several files.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import json
+from excaligen.SceneBuilder import SceneBuilder
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24"></svg>'
+
+def load(path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+def by_id(document):
+    return {element["id"]: element for element in document["elements"]}
+
+def test_tiles_keep_labels_and_groups(tmp_path):
+    scene = SceneBuilder()
+    left = scene.rectangle("Left").size(100, 50).position(100, 100)
+    right = scene.rectangle("Right").size(100, 50).position(1100, 100)
+    grouped = [scene.ellipse().size(20, 20).position(950, 500), scene.ellipse().size(20, 20).position(1100, 500)]
+    scene.group().elements(*grouped)
+
+    paths = scene.save_tiles(str(tmp_path / "map.excalidraw"), tile_size=(1000, 1000))
+    assert [path.split("/")[-1] for path in paths] == ["map-1.excalidraw", "map-2.excalidraw"]
+    first, second = (by_id(load(path)) for path in paths)
+    assert left._id in first and left._get_label()._id in first
+    assert right._id in second and right._get_label()._id in second
+    assert all(element._id in second for element in grouped)  # The group is centered in the second tile
+
+def test_crossing_arrow_is_written_to_both_tiles(tmp_path):
+    scene = SceneBuilder()
+    a = scene.rectangle().size(100, 50).position(100, 100)
+    b = scene.rectangle().size(100, 50).position(1100, 100)
+    arrow = scene.arrow("calls").bind(a, b)
+
+    paths = scene.save_tiles(str(tmp_path / "map.excalidraw"), tile_size=(1000, 1000), base_url="https://example.com/")
+    first, second = (by_id(load(path)) for path in paths)
+    assert first[arrow._id]["startBinding"]["elementId"] == a._id and first[arrow._id]["endBinding"] is None
+    assert second[arrow._id]["endBinding"]["elementId"] == b._id and second[arrow._id]["startBinding"] is None
+    assert first[arrow._id]["link"] == "https://example.com/map-2.excalidraw"
+    assert second[arrow._id]["link"] == "https://example.com/map-1.excalidraw"
+    assert arrow._get_label()._id in second
+    assert {bound["id"] for bound in second[b._id]["boundElements"]} == {arrow._id}
+    assert arrow._link is None and arrow._end_binding is not None  # The scene is not changed
+
+    overview = load(tmp_path / "map.excalidraw")["elements"]
+    tiles = [element for element in overview if element["type"] == "rectangle"]
+    assert [tile["link"] for tile in tiles] == ["https://example.com/map-1.excalidraw", "https://example.com/map-2.excalidraw"]
+    assert (tiles[1]["x"], tiles[1]["width"]) == (1100, 100)
+    assert any(element["type"] == "text" and element["text"] == "1" for element in overview)
+
+def test_split_by_frames(tmp_path):
+    scene = SceneBuilder()
+    inner = scene.frame("Inner").elements(scene.rectangle().position(0, 0))
+    first = scene.frame("First").elements(inner, scene.text("Title").position(0, -100))
+    second = scene.frame("Second").elements(scene.ellipse().position(1000, 0))
+    loose = scene.diamond().position(0, 1000)
+
+    paths = scene.save_tiles(str(tmp_path / "slides.excalidraw"), frames=True)
+    documents = [by_id(load(path)) for path in paths]
+    assert len(documents) == 3
+    assert first._id in documents[0] and inner._id in documents[0] and len(documents[0]) == 4
+    assert second._id in documents[1] and len(documents[1]) == 2
+    assert list(documents[2]) == [loose._id]
+    overview = load(tmp_path / "slides.excalidraw")["elements"]
+    assert [e["text"].split("\n")[0] for e in overview if e["type"] == "text"] == ["First", "Second", "Other elements"]
+
+def test_arrow_with_both_ends_in_other_part_is_copied_once(tmp_path):
+    scene = SceneBuilder()
+    a = scene.rectangle().position(1000, 0)
+    b = scene.rectangle().position(1000, 300)
+    arrow = scene.arrow("calls").bind(a, b)
+    first = scene.frame("F1").elements(arrow)
+    second = scene.frame("F2").elements(a, b)
+
+    documents = [load(path)["elements"] for path in scene.save_tiles(str(tmp_path / "slides.excalidraw"), frames=True)]
+    with_ends, with_arrow = ([element["id"] for element in elements] for elements in documents)
+    assert sorted(with_arrow) == sorted([first._id, arrow._id, arrow._get_label()._id])
+    assert sorted(with_ends) == sorted([second._id, a._id, b._id, arrow._id, arrow._get_label()._id])  # No duplicates
+
+def test_split_by_budget_keeps_order_and_files(tmp_path):
+    scene = SceneBuilder()
+    images = [scene.image().data(SVG).position(100 * i, 0) for i in range(3)]
+    boxes = [scene.rectangle().position(100 * i, 200) for i in range(7)]
+
+    paths = scene.save_tiles(str(tmp_path / "big.excalidraw"), budget=4)
+    documents = [load(path) for path in paths]
+    assert [len(document["elements"]) for document in documents] == [4, 4, 2]
+    assert list(documents[0]["files"]) == [image._file_id for image in images]
+    assert documents[1]["files"] == {}
+    indexes = [element["index"] for document in documents for element in document["elements"]]
+    assert indexes == sorted(indexes) == [element._index for element in images + boxes]
+
+def test_invalid_split(tmp_path):
+    scene = SceneBuilder()
+    path = str(tmp_path / "map.excalidraw")
+    with pytest.raises(ValueError):
+        scene.save_tiles(path)
+    with pytest.raises(ValueError):
+        scene.save_tiles(path, tile_size=(100, 100), budget=10)
+    with pytest.raises(ValueError):
+        scene.save_tiles(path, tile_size=(0, 100))
+    with pytest.raises(ValueError):
+        scene.save_tiles(path, budget=0)
@@ -0,0 +1,105 @@
+"""
+Description: Unit tests for streaming a scene to a file.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import json
+import re
+from excaligen.SceneBuilder import SceneBuilder
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24"></svg>'
+
+def build(scene, flush):
+    for i in range(10):
+        box = scene.rectangle(f"Node {i}").position(200 * i, 0)
+        scene.arrow().bind(box, scene.ellipse().position(200 * i, 200))
+        scene.image().data(SVG).position(200 * i, 400)
+        if flush and i % 3 == 2:
+            scene.flush()
+
+def normalized(text):
+    # The ids and seeds are random
+    text = re.sub(r'"[0-9a-f]{8}-[0-9a-f-]{27}"', '"id"', text)
+    return re.sub(r'"(seed|versionNonce)": \d+', r'"\1": 0', text)
+
+def test_streamed_file_is_the_saved_file(tmp_path):
+    saved = SceneBuilder()
+    build(saved, flush=False)
+    streamed = SceneBuilder().stream(str(tmp_path / "streamed.excalidraw"))
+    build(streamed, flush=True)
+    streamed.close()
+
+    text = (tmp_path / "streamed.excalidraw").read_text(encoding="utf-8")
+    assert normalized(text) == normalized(saved.json())
+    document = json.loads(text)
+    assert len(document["elements"]) == 50 and len(document["files"]) == 10
+
+def test_flush_drops_elements_and_keeps_indexes(tmp_path):
+    scene = SceneBuilder().stream(str(tmp_path / "scene.excalidraw"))
+    for i in range(100):
+        scene.rectangle().position(i, 0)
+        if i % 10 == 9:
+            scene.flush()
+            assert scene._elements == []
+    scene.close()
+
+    indexes = [element["index"] for element in json.loads((tmp_path / "scene.excalidraw").read_text())["elements"]]
+    assert len(set(indexes)) == 100 and indexes == sorted(indexes)
+
+def test_empty_stream(tmp_path):
+    SceneBuilder().background("#eeeeee").stream(str(tmp_path / "empty.excalidraw")).close()
+    document = json.loads((tmp_path / "empty.excalidraw").read_text())
+    assert document["elements"] == [] and document["files"] == {}
+    assert document["appState"]["viewBackgroundColor"] == "#eeeeee"
+
+def test_empty_stream_is_the_saved_file(tmp_path):
+    scene = SceneBuilder()
+    scene.save(str(tmp_path / "saved.excalidraw"))
+    scene.stream(str(tmp_path / "streamed.excalidraw")).close()
+    assert (tmp_path / "streamed.excalidraw").read_text() == (tmp_path / "saved.excalidraw").read_text()
+
+def test_stream_as_context_manager(tmp_path):
+    with SceneBuilder().stream(str(tmp_path / "scene.excalidraw")) as scene:
+        scene.rectangle().position(0, 0)
+        scene.flush()
+        scene.ellipse().position(100, 0)
+    assert len(json.loads((tmp_path / "scene.excalidraw").read_text())["elements"]) == 2
+
+    with pytest.raises(RuntimeError):
+        with SceneBuilder().stream(str(tmp_path / "failed.excalidraw")) as scene:
+            scene.rectangle()
+            scene.flush()
+            raise RuntimeError("Interrupted")
+    scene.stream(str(tmp_path / "again.excalidraw")).close()  # The failed stream was closed
+
+def test_failed_flush_closes_the_file(tmp_path):
+    scene = SceneBuilder().stream(str(tmp_path / "scene.excalidraw"))
+    scene.rectangle()._invalid = object()  # Not serializable
+    with pytest.raises(AttributeError):
+        scene.flush()
+    with pytest.raises(ValueError):
+        scene.close()  # Not streamed any more
+
+def test_invalid_stream_calls(tmp_path):
+    scene = SceneBuilder()
+    with pytest.raises(ValueError):
+        scene.flush()
+    scene.stream(str(tmp_path / "scene.excalidraw"))
+    with pytest.raises(ValueError):
+        scene.stream(str(tmp_path / "other.excalidraw"))
+    with pytest.raises(ValueError):
+        scene.json()
+    (tmp_path / "saved.excalidraw").write_text("previous")
+    with pytest.raises(ValueError):
+        scene.save(str(tmp_path / "saved.excalidraw"))
+    assert (tmp_path / "saved.excalidraw").read_text() == "previous"
+    scene.rectangle()
+    scene.flush()
+    with pytest.raises(ValueError):
+        scene.save_tiles(str(tmp_path / "tiles.excalidraw"), budget=10)
+    assert not (tmp_path / "tiles.excalidraw").exists()
+    scene.close()
+    with pytest.raises(ValueError):
+        scene.close()
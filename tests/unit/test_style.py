@@ -0,0 +1,104 @@
+"""
+Description: Unit tests for shared styles.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import json
+from excaligen.SceneBuilder import SceneBuilder
+
+def element_json(scene: SceneBuilder, index: int = 0) -> dict:
+    return json.loads(scene.json())["elements"][index]
+
+def test_elements_share_default_style():
+    scene = SceneBuilder()
+    first = scene.rectangle()
+    second = scene.rectangle()
+
+    assert first._stroke_color == "#000000"
+    assert "_stroke_color" not in vars(first)
+    assert first._AbstractElement__style is second._AbstractElement__style
+
+    data = element_json(scene)
+    assert data["strokeColor"] == "#000000"
+    assert data["fillStyle"] == "hachure"
+    assert data["roundness"] == {"type": 3}
+    assert data["opacity"] == 100
+
+def test_defaults_change_does_not_affect_existing_elements():
+    scene = SceneBuilder()
+    before = scene.ellipse()
+    scene.defaults().color("#FF0000").fill("solid")
+    after = scene.ellipse()
+
+    assert before._stroke_color == "#000000"
+    assert after._stroke_color == "#FF0000"
+    assert after._fill_style == "solid"
+
+def test_text_defaults():
+    scene = SceneBuilder()
+    scene.defaults().align("left").baseline("top").autoresize(False).spacing(1.5)
+    text = scene.text("Hello")
+
+    assert text._text_align == "left"
+    assert text._vertical_align == "top"
+    assert text._auto_resize is False
+    assert text._line_height == 1.5
+
+def test_named_style():
+    scene = SceneBuilder()
+    warning = scene.style("warning", color="#E53935", background="#FFEBEE", fill="solid", thickness=2)
+    assert scene.style("warning") is warning
+    assert warning.name() == "warning"
+
+    rectangle = scene.rectangle().style(warning)
+    data = element_json(scene)
+    assert data["strokeColor"] == "#E53935"
+    assert data["backgroundColor"] == "#FFEBEE"
+    assert data["fillStyle"] == "solid"
+    assert data["strokeWidth"] == 2
+    assert "_stroke_color" not in vars(rectangle)
+
+def test_style_overrides():
+    scene = SceneBuilder()
+    style = scene.style(color="#1E88E5", opacity=50)
+
+    before = scene.diamond().color("#000000").style(style)
+    after = scene.diamond().style(style).color("#43A047")
+
+    assert before._stroke_color == "#1E88E5"
+    assert after._stroke_color == "#43A047"
+    assert after._opacity == 50
+    assert element_json(scene, 1)["strokeColor"] == "#43A047"
+
+def test_style_for_lines_and_text():
+    scene = SceneBuilder()
+    style = scene.style(arrowheads=("dot", "triangle"), fontsize="L", stroke="dashed")
+
+    arrow = scene.arrow().style(style)
+    text = scene.text("Title").style(style)
+
+    assert (arrow._start_arrowhead, arrow._end_arrowhead) == ("dot", "triangle")
+    assert arrow._stroke_style == "dashed"
+    assert text._font_size == 24
+    assert not hasattr(text, "_stroke_style")
+
+def test_style_invalid():
+    scene = SceneBuilder()
+    with pytest.raises(ValueError, match="Unknown style"):
+        scene.style("missing")
+    with pytest.raises(ValueError, match="Invalid style attribute"):
+        scene.style(size=(10, 10))
+    with pytest.raises(ValueError):
+        scene.style(fill="checkered")
+    with pytest.raises(TypeError):
+        scene.rectangle().style("warning")
+
+def test_style_resizes_text():
+    scene = SceneBuilder()
+    text = scene.text("Title").center(0, 0)
+    text.style(scene.style(fontsize="XL"))
+
+    assert text.size() == pytest.approx((5 * 32 * 0.6, 32 * 1.25))
+    assert text.center() == pytest.approx((0, 0))
@@ -0,0 +1,107 @@
+"""
+Description: Unit tests for SVG parsing and minification.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import base64
+from xml.etree import ElementTree as ET
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.images.ImageLoader import ImageLoader
+from excaligen.impl.images.SvgMinifier import SvgMinifier
+
+EDITOR_SVG = '''<?xml version="1.0" encoding="UTF-8"?>
+<!-- Created with Inkscape -->
+<svg xmlns="http://www.w3.org/2000/svg"
+     xmlns:xlink="http://www.w3.org/1999/xlink"
+     xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
+     xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"
+     xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+     width="120" height="80" inkscape:version="1.3">
+    <sodipodi:namedview id="view" pagecolor="#ffffff"/>
+    <metadata>
+        <rdf:RDF><rdf:Description about="robot"/></rdf:RDF>
+    </metadata>
+    <defs>
+        <circle id="dot" r="4" inkscape:label="Dot"/>
+    </defs>
+    <g inkscape:groupmode="layer">
+        <!-- the dots -->
+        <use xlink:href="#dot" x="10" y="10"/>
+        <text x="0" y="70">Hello <tspan font-weight="bold">big</tspan> world</text>
+    </g>
+</svg>
+'''
+
+def minify(svg: str) -> str:
+    return SvgMinifier().minify(ET.fromstring(svg))
+
+def test_minify_strips_editor_content():
+    minified = minify(EDITOR_SVG)
+    assert minified == (
+        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="120" height="80">'
+        '<defs><circle id="dot" r="4"/></defs>'
+        '<g><use xlink:href="#dot" x="10" y="10"/>'
+        '<text x="0" y="70">Hello <tspan font-weight="bold">big</tspan> world</text></g>'
+        '</svg>'
+    )
+
+def test_minify_output_is_equivalent():
+    original = ET.fromstring(EDITOR_SVG)
+    minified = ET.fromstring(minify(EDITOR_SVG))
+    assert minified.tag == original.tag
+    assert minified.find(".//{http://www.w3.org/2000/svg}use").attrib == {
+        "{http://www.w3.org/1999/xlink}href": "#dot", "x": "10", "y": "10"
+    }
+
+def test_minify_preserves_space():
+    svg = '<svg xmlns="http://www.w3.org/2000/svg"><g xml:space="preserve"> <rect/> </g>  <style> .a { fill: red } </style></svg>'
+    assert minify(svg) == (
+        '<svg xmlns="http://www.w3.org/2000/svg"><g xml:space="preserve"> <rect/> </g>'
+        '<style> .a { fill: red } </style></svg>'
+    )
+
+def test_minify_escapes_content():
+    svg = '<svg xmlns="http://www.w3.org/2000/svg"><text font-family="&quot;A&amp;B&quot;">a &lt; b</text></svg>'
+    assert ET.fromstring(minify(svg)).find("{http://www.w3.org/2000/svg}text").text == "a < b"
+    assert ET.fromstring(minify(svg)).find("{http://www.w3.org/2000/svg}text").get("font-family") == '"A&B"'
+
+def test_minify_without_namespace():
+    assert minify('<svg width="10" height="10">\n  <rect width="5"/>\n</svg>') == '<svg width="10" height="10"><rect width="5"/></svg>'
+
+def test_svg_is_parsed_once(monkeypatch):
+    calls = []
+    fromstring = ET.fromstring
+    monkeypatch.setattr(ET, "fromstring", lambda data: calls.append(data) or fromstring(data))
+
+    loader = ImageLoader()
+    loader.minify_svg(True)
+    image_data = loader.load_from_data(EDITOR_SVG)
+
+    assert len(calls) == 1
+    assert (image_data.width, image_data.height) == (120, 80)
+
+def test_invalid_svg():
+    with pytest.raises(ValueError, match="Invalid SVG data"):
+        ImageLoader().load_from_data('<html></html>')
+    with pytest.raises(ValueError, match="Invalid SVG data"):
+        ImageLoader().load_from_data('<svg')
+
+def test_scene_reports_bytes_saved(tmp_path):
+    path = tmp_path / "robot.svg"
+    path.write_text(EDITOR_SVG, encoding="utf-8")
+
+    scene = SceneBuilder()
+    assert scene.svg_bytes_saved() == 0
+    scene.image().file(str(path))
+    scene.minify_svg()
+    scene.image().file(str(path))
+    scene.image().data(EDITOR_SVG)
+
+    saved = len(EDITOR_SVG.encode("utf-8")) - len(minify(EDITOR_SVG).encode("utf-8"))
+    assert scene.svg_bytes_saved() == 2 * saved
+
+    data_urls = [file["dataURL"].data_url for file in scene._files.values()]
+    assert base64.b64decode(data_urls[0].split(",")[1]).decode("utf-8") == EDITOR_SVG
+    assert base64.b64decode(data_urls[1].split(",")[1]).decode("utf-8") == minify(EDITOR_SVG)
@@ -0,0 +1,152 @@
+"""
+Description: Unit tests for templates and stamping.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import json
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.elements.Text import Text
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24"></svg>'
+
+def service(scene):
+    box = scene.rectangle("Service").size(160, 80).position(100, 100)
+    icon = scene.image().data(SVG).position(110, 110)
+    port_in = scene.ellipse().size(10, 10).center(100, 140)
+    port_out = scene.ellipse().size(10, 10).center(260, 140)
+    wire = scene.arrow().bind(port_in, box)
+    scene.group().elements(box, icon, port_in, port_out)
+    return scene.template(box=box, icon=icon, port_in=port_in, port_out=port_out, wire=wire)
+
+def test_template_takes_elements_out_of_scene():
+    scene = SceneBuilder()
+    component = service(scene)
+    assert scene._elements == []
+    assert component.parts() == ["box", "icon", "port_in", "port_out", "wire"]
+    assert component.origin() == (95, 100)
+
+def test_stamp_translates_copies():
+    scene = SceneBuilder()
+    component = service(scene)
+    parts = scene.stamp(component, at=(1000, 500))
+
+    assert len(scene._elements) == 6  # The label is copied with the box
+    assert (parts["box"]._x, parts["box"]._y) == (1005, 500)
+    assert parts["port_in"].center() == (1005, 540)
+    assert parts["wire"]._points == component._Template__parts["wire"]._points
+
+    label = parts["box"]._get_label()
+    assert label in scene._elements
+    assert label._container_id == parts["box"]._id
+    assert label.center() == parts["box"].center()
+
+def test_stamp_remaps_references():
+    scene = SceneBuilder()
+    component = service(scene)
+    first = scene.stamp(component, at=(0, 0))
+    second = scene.stamp(component, at=(0, 200))
+
+    ids = [element._id for element in scene._elements]
+    assert len(set(ids)) == len(ids) == 12
+
+    for parts in (first, second):
+        box, wire, port_in = parts["box"], parts["wire"], parts["port_in"]
+        assert {bound["id"] for bound in box._bound_elements} == {box._get_label()._id, wire._id}
+        assert wire._start_binding["elementId"] == port_in._id
+        assert wire._end_binding["elementId"] == box._id
+        assert port_in._bound_elements == [{"id": wire._id, "type": "arrow"}]
+
+    assert first["box"]._group_ids == first["icon"]._group_ids == first["port_out"]._group_ids
+    assert first["box"]._group_ids != second["box"]._group_ids
+    assert first["box"]._group_ids != component._Template__parts["box"]._group_ids
+
+def test_stamp_shares_image_file():
+    scene = SceneBuilder()
+    component = service(scene)
+    first = scene.stamp(component, at=(0, 0))
+    second = scene.stamp(component, at=(0, 200))
+    assert first["icon"]._file_id == second["icon"]._file_id
+    assert len(scene._files) == 1
+
+def test_stamp_does_not_remeasure_text(monkeypatch):
+    scene = SceneBuilder()
+    component = service(scene)
+    def fail(*_):
+        raise AssertionError("text measured")
+    monkeypatch.setattr(Text, "_Text__calculate_dimensions", fail)
+    scene.stamp(component, at=(0, 0))
+
+def test_stamp_overrides():
+    scene = SceneBuilder()
+    component = service(scene)
+    parts = scene.stamp(component, at=(0, 0), overrides={
+        "box": "Database",
+        "port_out": lambda port: port.background("#FF0000"),
+    })
+    assert parts["box"]._get_label()._text == "Database"
+    assert parts["box"]._get_label().center() == parts["box"].center()
+    assert parts["port_out"]._background_color == "#FF0000"
+    assert component._Template__parts["box"]._get_label()._text == "Service"
+
+    with pytest.raises(ValueError, match="Unknown template parts"):
+        scene.stamp(component, at=(0, 0), overrides={"missing": "x"})
+    with pytest.raises(ValueError):
+        scene.stamp(component, at=(0, 0), overrides={"port_in": "x"})
+
+def test_stamp_drops_bindings_out_of_template():
+    scene = SceneBuilder()
+    outside = scene.rectangle().position(-500, 0)
+    box = scene.rectangle().position(0, 0)
+    arrow = scene.arrow().bind(outside, box)
+    template = scene.template(box=box, arrow=arrow)
+
+    parts = scene.stamp(template, at=(0, 300))
+    assert parts["arrow"]._start_binding is None
+    assert parts["arrow"]._end_binding["elementId"] == parts["box"]._id
+    assert outside._bound_elements is None  # The extracted arrow is no longer in the scene
+
+def test_template_releases_outside_references():
+    scene = SceneBuilder()
+    box = scene.rectangle("Box").size(100, 50).position(0, 0)
+    other = scene.rectangle().size(100, 50).position(1000, 1000)
+    arrow = scene.arrow().bind(other, box)
+    frame = scene.frame().elements(box, other)
+    scene.template(box=box)
+
+    data = json.loads(scene.json())
+    ids = {element["id"] for element in data["elements"]}
+    assert ids == {other._id, arrow._id, frame._id}
+    assert all(bound["id"] in ids for element in data["elements"] for bound in element["boundElements"] or ())
+    assert arrow._start_binding["elementId"] == other._id and arrow._end_binding is None
+    assert (frame._width, frame._height) == (160, 110)  # Fits only the remaining member
+    assert box._frame_id is None
+
+def test_template_keeps_frame_with_members():
+    scene = SceneBuilder()
+    box = scene.rectangle().size(100, 50).position(0, 0)
+    frame = scene.frame("Card").elements(box)
+    template = scene.template(frame=frame, box=box)
+
+    parts = scene.stamp(template, at=(500, 0))
+    assert parts["box"]._frame_id == parts["frame"]._id
+    parts["box"].position(1000, 0)
+    assert parts["frame"]._x + parts["frame"]._width == 1130
+
+def test_stamped_scene_serializes():
+    scene = SceneBuilder()
+    component = service(scene)
+    for i in range(3):
+        scene.stamp(component, at=(i * 300, 0))
+    data = json.loads(scene.json())
+    assert len(data["elements"]) == 18
+    assert [element["index"] for element in data["elements"]] == sorted(element["index"] for element in data["elements"])
+
+def test_template_requires_scene_elements():
+    scene = SceneBuilder()
+    with pytest.raises(ValueError):
+        scene.template()
+    other = SceneBuilder().rectangle()
+    with pytest.raises(ValueError, match="elements of this scene"):
+        scene.template(box=other)
@@ -0,0 +1,117 @@
+"""
+Description: Unit tests for the transforms of groups and of the whole scene.
+"""
+# Copyright (c) 2024 - 2026 Milan Piskla
+# Licensed under the MIT License - see LICENSE file for details
+
+import pytest
+import math
+from excaligen.SceneBuilder import SceneBuilder
+from excaligen.impl.geometry.AffineTransform import AffineTransform
+
+def test_affine_transform_batch_matches_single_points(monkeypatch):
+    from array import array
+    transform = AffineTransform.rotation(0.3, (10, 20))
+    coordinates = array('d', [float(i) for i in range(2 * 5000)])
+    expected = [c for i in range(0, len(coordinates), 2) for c in transform.apply(coordinates[i], coordinates[i + 1])]
+    assert list(transform.apply_many(coordinates)) == pytest.approx(expected)
+    monkeypatch.setattr(AffineTransform, "NUMPY_THRESHOLD", 10 ** 9)
+    assert list(transform.apply_many(coordinates)) == pytest.approx(expected)
+
+def test_from_matrix():
+    assert vars(AffineTransform.from_matrix((2, 0, 0, 3, 5, 7))) == vars(AffineTransform(2, 0, 0, 3, 5, 7))
+    assert vars(AffineTransform.from_matrix([[2, 0, 5], [0, 3, 7], [0, 0, 1]])) == vars(AffineTransform(2, 0, 0, 3, 5, 7))
+    for invalid in ((1, 2, 3), [[1, 0, 0], [0, 1, 0], [1, 0, 1]], (1, 1, 1, 1, 0, 0)):
+        with pytest.raises(ValueError):
+            AffineTransform.from_matrix(invalid)
+
+def test_group_translate():
+    scene = SceneBuilder()
+    box = scene.rectangle("Box").position(10, 20)
+    line = scene.line().points([(0, 0), (30, 40)]).position(100, 100)
+    scene.group().elements(box, line).translate(5, -10)
+    assert (box._x, box._y) == (15, 10)
+    assert (line._x, line._y) == (105, 90)
+    assert line._points == [(0, 0), (30, 40)]
+    label = box._get_label()
+    assert label.center() == pytest.approx(box.center())
+
+def test_group_scale_around_center():
+    scene = SceneBuilder()
+    a = scene.rectangle("A").size(100, 50).position(0, 0)
+    b = scene.ellipse().size(100, 50).position(200, 0)
+    group = scene.group().elements(a, b)
+    font_size = a._get_label()._font_size
+    group.scale(2)
+
+    assert group.center() == pytest.approx((150, 25))
+    assert (a._x, a._y, a._width, a._height) == pytest.approx((-150, -25, 200, 100))
+    assert b.center() == pytest.approx((350, 25))
+    assert a._get_label()._font_size == pytest.approx(2 * font_size)
+    assert a._get_label().center() == pytest.approx(a.center())
+
+def test_group_rotate():
+    scene = SceneBuilder()
+    a = scene.rectangle().size(20, 10).center(100, 0)
+    line = scene.line().points([(0, 0), (10, 0)]).position(0, 0)
+    scene.group().elements(a, line).rotate(math.pi / 2, origin=(0, 0))
+
+    assert a.center() == pytest.approx((0, 100))
+    assert (a._width, a._height) == pytest.approx((20, 10))
+    assert a._angle == pytest.approx(math.pi / 2)
+    assert [c for point in line._points for c in point] == pytest.approx([0, 0, 0, 10])
+    assert (line._width, line._height) == pytest.approx((0, 10))
+
+def test_bound_arrows_follow():
+    scene = SceneBuilder()
+    a = scene.rectangle().center(0, 0)
+    b = scene.rectangle().center(300, 0)
+    outside = scene.rectangle().center(0, 300)
+    inner = scene.arrow().bind(a, b)
+    crossing = scene.arrow().bind(b, outside)
+    scene.group().elements(a, b, inner).translate(0, 100)
+
+    assert inner._y == pytest.approx(100)
+    start = (crossing._x, crossing._y)
+    end = (crossing._x + crossing._points[-1][0], crossing._y + crossing._points[-1][1])
+    assert start[1] == pytest.approx(100, abs=60) and start[0] == pytest.approx(300, abs=60)
+    assert end[0] == pytest.approx(0, abs=60) and end[1] == pytest.approx(300, abs=60)
+
+def test_frame_contents_follow_frame():
+    scene = SceneBuilder()
+    box = scene.rectangle().position(10, 10)
+    frame = scene.frame().elements(box)
+    scene.group().elements(frame).translate(100, 0)
+    assert box._x == 110 and frame._x == 100 - 30 + 10
+
+def test_frames_stay_axis_aligned():
+    scene = SceneBuilder()
+    box = scene.rectangle().size(100, 50).position(0, 0)
+    fitting = scene.frame().elements(box)
+    sized = scene.frame().size(200, 100).position(0, 200)
+    scene.group().elements(fitting, sized).rotate(math.pi / 2, (0, 0))
+
+    assert fitting._angle == sized._angle == 0
+    assert box._angle == pytest.approx(math.pi / 2)
+    assert (fitting._x, fitting._y, fitting._width, fitting._height) == pytest.approx((-105, -5, 160, 110))
+    assert (sized._x, sized._y, sized._width, sized._height) == pytest.approx((-300, 0, 100, 200))
+
+def test_scene_transform():
+    scene = SceneBuilder()
+    box = scene.rectangle("Box").size(100, 60).center(50, 30)
+    text = scene.text("Title").center(0, -50)
+    arrow = scene.arrow().points([(0, 0), (100, 0)]).position(0, 100)
+    font_size = text._font_size
+    scene.transform((0.5, 0, 0, 0.5, 100, 100))
+
+    assert box.center() == pytest.approx((125, 115)) and (box._width, box._height) == pytest.approx((50, 30))
+    assert text.center() == pytest.approx((100, 75)) and text._font_size == pytest.approx(font_size / 2)
+    assert (arrow._x, arrow._y) == pytest.approx((100, 150)) and arrow._width == pytest.approx(50)
+    assert box._get_label().center() == pytest.approx(box.center())
+
+def test_scene_transform_many_lines():
+    scene = SceneBuilder()
+    lines = [scene.line().points([(i, 0), (i, 10), (i + 5, 10)]) for i in range(2000)]
+    scene.transform((1, 0, 0, -1, 0, 0))
+    assert lines[1999]._points == [(1999, 0), (1999, -10), (2004, -10)]
+    assert lines[0]._height == 10